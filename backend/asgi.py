@@ -0,0 +1,38 @@
+"""ASGI entry point: the same ``/api`` routes and Socket.IO events on one event loop per worker.
+
+    uvicorn asgi:app --host 0.0.0.0 --port 8001 --workers 4
+
+Socket.IO is served by python-socketio's ``AsyncServer``, whose handlers run directly on the
+server's loop. Everything else goes to the Flask app through a thread-pooled WSGI adapter; its
+``async def`` views, the background job queues and the live sessions are all executed on that
+same loop, so the Motor client and the live Deepgram sockets never see another loop.
+"""
+import asyncio
+import os
+
+os.environ.setdefault("SERVER_MODE", "asgi")
+
+import socketio  # noqa: E402
+from a2wsgi import WSGIMiddleware  # noqa: E402
+
+import server  # noqa: E402
+
+if server.SERVER_MODE != "asgi":
+    raise RuntimeError("asgi.py requires SERVER_MODE=asgi")
+
+
+async def startup():
+    server.bind_event_loop(asyncio.get_running_loop())
+    await server.run_startup_tasks()
+
+
+async def shutdown():
+    await server.shutdown()
+
+
+app = socketio.ASGIApp(
+    server.sio,
+    other_asgi_app=WSGIMiddleware(server.app, workers=server.ASGI_WSGI_THREADS),
+    on_startup=startup,
+    on_shutdown=shutdown,
+)
@@ -0,0 +1,134 @@
+import asyncio
+import logging
+import time
+from collections import deque
+from typing import Any, Awaitable, Callable, Dict
+
+logger = logging.getLogger(__name__)
+
+OVERFLOW_POLICIES = ("drop_oldest", "drop_newest")
+
+
+class AudioIngest:
+    """Coalesces one client's live PCM into fixed-duration frames and forwards them upstream.
+
+    Incoming chunks of any size are appended to a partial-frame buffer; every complete
+    ``frame_ms`` frame is queued and sent by a single drain task, so the number of upstream
+    sends no longer depends on how the browser slices audio. At most ``max_queued_frames``
+    frames are held in memory. When the upstream is slower than real time the queue fills
+    and ``policy`` decides what happens:
+
+    * ``drop_oldest`` – discard the oldest queued frame (keeps latency low)
+    * ``drop_newest`` – discard the incoming frame
+
+    There is no blocking policy: Socket.IO handlers are dispatched without waiting for the
+    previous chunk, so a waiting ``feed`` would only move the unbounded backlog into pending
+    handlers. Dropped audio is counted in ``stats()``.
+    """
+
+    def __init__(self, send: Callable[[bytes], Awaitable[Any]], sample_rate: int = 16000, channels: int = 1,
+                 sample_width: int = 2, frame_ms: int = 100, max_queued_frames: int = 50,
+                 policy: str = "drop_oldest"):
+        if policy not in OVERFLOW_POLICIES:
+            raise ValueError(f"Unknown overflow policy '{policy}', expected one of {OVERFLOW_POLICIES}")
+        self.send = send
+        self.sample_bytes = sample_width * channels
+        self.frame_bytes = sample_rate * self.sample_bytes * frame_ms // 1000
+        self.max_queued_frames = max_queued_frames
+        self.policy = policy
+        self._partial = bytearray()
+        self._frames: deque = deque()
+        self._drain_task = None
+        self._closed = False
+        # Stats
+        self.chunks_in = 0
+        self.bytes_in = 0
+        self.frames_out = 0
+        self.bytes_out = 0
+        self.dropped_frames = 0
+        self.dropped_bytes = 0
+        self.max_queue_depth = 0
+        self.send_errors = 0
+        self._send_seconds = 0.0
+        self._max_send_seconds = 0.0
+
+    @property
+    def queue_depth(self) -> int:
+        return len(self._frames)
+
+    async def feed(self, data: bytes):
+        """Accept a chunk of PCM from the client."""
+        if self._closed or not data:
+            return
+        self.chunks_in += 1
+        self.bytes_in += len(data)
+        self._partial += data
+        while len(self._partial) >= self.frame_bytes:
+            frame = bytes(self._partial[:self.frame_bytes])
+            del self._partial[:self.frame_bytes]
+            self._enqueue(frame)
+        self._start_drain()
+
+    def _enqueue(self, frame: bytes):
+        if len(self._frames) >= self.max_queued_frames:
+            if self.policy == "drop_oldest":
+                self._drop(self._frames.popleft())
+            else:
+                self._drop(frame)
+                return
+        self._frames.append(frame)
+        self.max_queue_depth = max(self.max_queue_depth, len(self._frames))
+
+    def _drop(self, frame: bytes):
+        self.dropped_frames += 1
+        self.dropped_bytes += len(frame)
+
+    def _start_drain(self):
+        if self._frames and (self._drain_task is None or self._drain_task.done()):
+            self._drain_task = asyncio.get_running_loop().create_task(self._drain())
+
+    async def _drain(self):
+        while self._frames:
+            await self._send_frame(self._frames.popleft())
+
+    async def _send_frame(self, frame: bytes):
+        start = time.perf_counter()
+        try:
+            await self.send(frame)
+        except Exception as e:
+            self.send_errors += 1
+            self._drop(frame)
+            logger.error(f"Upstream audio send failed: {e}")
+            return
+        elapsed = time.perf_counter() - start
+        self._send_seconds += elapsed
+        self._max_send_seconds = max(self._max_send_seconds, elapsed)
+        self.frames_out += 1
+        self.bytes_out += len(frame)
+
+    async def close(self):
+        """Send everything still buffered (including a final partial frame) and stop accepting audio."""
+        self._closed = True
+        if self._drain_task is not None:
+            await self._drain_task
+        while self._frames:
+            await self._send_frame(self._frames.popleft())
+        tail = len(self._partial) - len(self._partial) % self.sample_bytes
+        if tail:
+            await self._send_frame(bytes(self._partial[:tail]))
+        self._partial.clear()
+
+    def stats(self) -> Dict[str, Any]:
+        return {
+            "chunks_in": self.chunks_in,
+            "bytes_in": self.bytes_in,
+            "frames_out": self.frames_out,
+            "bytes_out": self.bytes_out,
+            "dropped_frames": self.dropped_frames,
+            "dropped_bytes": self.dropped_bytes,
+            "send_errors": self.send_errors,
+            "queue_depth": len(self._frames),
+            "max_queue_depth": self.max_queue_depth,
+            "avg_send_ms": round(self._send_seconds * 1000 / self.frames_out, 3) if self.frames_out else 0.0,
+            "max_send_ms": round(self._max_send_seconds * 1000, 3),
+        }
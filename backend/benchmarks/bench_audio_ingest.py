@@ -0,0 +1,95 @@
+"""Benchmark: per-message passthrough vs coalesced frames on the live audio ingestion path.
+
+Simulates N concurrent speakers streaming linear16 @ 16 kHz in small, irregular browser-sized
+chunks into a local fake Deepgram socket, in real time. Reports upstream sends, CPU per stream,
+drops and send latency for the original passthrough and for ``AudioIngest``. CPU time includes
+the simulated clients, which are identical in every run.
+
+    python benchmarks/bench_audio_ingest.py --speakers 200 --seconds 10 --upstream-ms 2
+"""
+import argparse
+import asyncio
+import random
+import sys
+import time
+from pathlib import Path
+
+sys.path.insert(0, str(Path(__file__).resolve().parent.parent))
+
+from audio_ingest import AudioIngest  # noqa: E402
+
+BYTES_PER_SECOND = 16000 * 2
+
+
+class FakeDeepgramSocket:
+    """Counts sends; each send costs ``latency`` seconds of upstream time."""
+
+    def __init__(self, latency):
+        self.latency = latency
+        self.sends = 0
+        self.bytes = 0
+
+    async def send(self, data):
+        self.sends += 1
+        self.bytes += len(data)
+        await asyncio.sleep(self.latency)
+
+
+async def speaker(feed, seconds, rng):
+    """Emit 10-40 ms chunks in real time, like MediaRecorder/AudioWorklet frames."""
+    sent = 0.0
+    start = time.perf_counter()
+    while sent < seconds:
+        chunk_ms = rng.choice((10, 20, 20, 40)) + rng.random()
+        size = int(BYTES_PER_SECOND * chunk_ms / 1000) & ~1
+        await feed(b"\0" * size)
+        sent += chunk_ms / 1000
+        delay = start + sent - time.perf_counter()
+        if delay > 0:
+            await asyncio.sleep(delay)
+
+
+async def run(label, speakers, seconds, upstream_latency, coalesce, policy="drop_oldest"):
+    rng = random.Random(5)
+    sockets = [FakeDeepgramSocket(upstream_latency) for _ in range(speakers)]
+    ingests = []
+    feeds = []
+    for socket in sockets:
+        if coalesce:
+            ingest = AudioIngest(socket.send, frame_ms=100, max_queued_frames=50, policy=policy)
+            ingests.append(ingest)
+            feeds.append(ingest.feed)
+        else:
+            feeds.append(socket.send)
+
+    cpu_start, wall_start = time.process_time(), time.perf_counter()
+    await asyncio.gather(*(speaker(feed, seconds, rng) for feed in feeds))
+    for ingest in ingests:
+        await ingest.close()
+    cpu = time.process_time() - cpu_start
+    wall = time.perf_counter() - wall_start
+
+    sends = sum(s.sends for s in sockets)
+    dropped = sum(i.dropped_frames for i in ingests)
+    avg_send = (sum(i.stats()["avg_send_ms"] for i in ingests) / len(ingests)) if ingests else float("nan")
+    print(f"{label:<26}{sends / speakers / seconds:>10.1f}{cpu * 1000 / speakers / seconds:>16.3f}"
+          f"{cpu / wall * 100:>9.1f}%{dropped:>9}{avg_send:>12.2f}")
+
+
+async def main():
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[0])
+    parser.add_argument("--speakers", type=int, default=100)
+    parser.add_argument("--seconds", type=float, default=5)
+    parser.add_argument("--upstream-ms", type=float, default=1.0)
+    args = parser.parse_args()
+
+    print(f"{args.speakers} speakers x {args.seconds:g}s, upstream send latency {args.upstream_ms} ms")
+    print(f"{'strategy':<26}{'sends/s/str':>10}{'CPU ms/s/stream':>16}{'CPU':>10}{'dropped':>9}{'send ms':>12}")
+    latency = args.upstream_ms / 1000
+    await run("passthrough (baseline)", args.speakers, args.seconds, latency, coalesce=False)
+    await run("coalesced 100 ms frames", args.speakers, args.seconds, latency, coalesce=True)
+    await run("coalesced, slow upstream", args.speakers, args.seconds, 0.15, coalesce=True)
+
+
+if __name__ == "__main__":
+    asyncio.run(main())
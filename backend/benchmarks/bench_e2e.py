@@ -0,0 +1,223 @@
+"""End-to-end load test: N concurrent meetings through the real routes and Socket.IO handlers.
+
+Runs ``server.py`` with ``PROVIDERS=fake`` (deterministic Deepgram/OpenAI/SendGrid stand-ins from
+``fakes.py``) and, by default, an in-memory MongoDB (``mongomock-motor``); set ``MONGO_URL`` to a
+real server for realistic database numbers. Two phases:
+
+* REST – every meeting is created, transcribed from an upload (job polled to completion),
+  fetched, summarized, emailed and listed via ``app.test_client()`` from ``--concurrency`` threads.
+* Live – every meeting joins over the Socket.IO handlers (``join_meeting`` / ``receive_audio`` /
+  ``client_disconnected``, awaited on the server's shared event loop as the Socket.IO server
+  would) and streams ``--live-seconds`` of real-time PCM. The delay is measured from the moment
+  the client sent the last byte of an utterance to the moment its final transcript reached the
+  server callback.
+
+Reports requests/sec, p50/p99 latency per route, live transcript delay and peak RSS.
+
+    pip install mongomock-motor
+    python benchmarks/bench_e2e.py --meetings 50 --concurrency 16 --live-seconds 20
+"""
+import argparse
+import asyncio
+import bisect
+import io
+import os
+import resource
+import statistics
+import sys
+import threading
+import time
+from collections import defaultdict
+from concurrent.futures import ThreadPoolExecutor
+from pathlib import Path
+
+os.environ.setdefault("PROVIDERS", "fake")
+os.environ.setdefault("MONGO_URL", "mongomock://")
+os.environ.setdefault("DB_NAME", "bench_e2e")
+os.environ.setdefault("FAKE_DEEPGRAM_LATENCY", "0.5")
+os.environ.setdefault("FAKE_DEEPGRAM_LIVE_LATENCY", "0.3")
+os.environ.setdefault("FAKE_OPENAI_LATENCY", "0.5")
+os.environ.setdefault("FAKE_SENDGRID_LATENCY", "0.1")
+sys.path.insert(0, str(Path(__file__).resolve().parent.parent))
+
+import server  # noqa: E402
+
+if server.SERVER_MODE == "asgi":
+    server.start_event_loop_thread()
+
+BYTES_PER_SECOND = 16000 * 2  # 16 kHz mono linear16, as configured in start_live_session
+
+
+def percentile(values, pct):
+    if not values:
+        return 0.0
+    ordered = sorted(values)
+    return ordered[min(len(ordered) - 1, int(len(ordered) * pct / 100))]
+
+
+def peak_rss_mb():
+    return resource.getrusage(resource.RUSAGE_SELF).ru_maxrss / 1024
+
+
+class RouteTimer:
+    """Thread-safe latency samples per route label."""
+
+    def __init__(self):
+        self.samples = defaultdict(list)
+        self.errors = defaultdict(int)
+        self._lock = threading.Lock()
+
+    def call(self, label, method, *args, expect=(200, 201, 202), **kwargs):
+        start = time.perf_counter()
+        response = method(*args, **kwargs)
+        elapsed = (time.perf_counter() - start) * 1000
+        with self._lock:
+            self.samples[label].append(elapsed)
+            if response.status_code not in expect:
+                self.errors[label] += 1
+        return response
+
+    def report(self, wall_seconds):
+        total = sum(len(v) for v in self.samples.values())
+        print(f"\nREST: {total} requests in {wall_seconds:.1f}s ({total / wall_seconds:.1f} req/s)")
+        print(f"{'route':<24}{'count':>7}{'errors':>8}{'p50 ms':>10}{'p99 ms':>10}")
+        for label, values in self.samples.items():
+            print(f"{label:<24}{len(values):>7}{self.errors[label]:>8}"
+                  f"{statistics.median(values):>10.1f}{percentile(values, 99):>10.1f}")
+
+
+def run_meeting(http, timer: RouteTimer, index: int, upload_bytes: int, poll_interval: float):
+    """One meeting's REST lifecycle; returns the meeting id."""
+    response = timer.call("POST /meetings", http.post, "/api/meetings", json={
+        "title": f"Bench meeting {index}", "host": "bench", "participants": ["alice", "bob"]
+    })
+    meeting_id = response.get_json()["id"]
+
+    response = timer.call(
+        "POST transcribe-file", http.post, f"/api/meetings/{meeting_id}/transcribe-file",
+        data={"audio_file": (io.BytesIO(b"\0" * upload_bytes), "bench.wav")}, content_type="multipart/form-data"
+    )
+    job_id = response.get_json()["job_id"]
+    while True:
+        job = timer.call("GET /jobs/<id>", http.get, f"/api/jobs/{job_id}").get_json()
+        if job["status"] in ("completed", "failed"):
+            break
+        time.sleep(poll_interval)
+
+    timer.call("GET /meetings/<id>", http.get, f"/api/meetings/{meeting_id}")
+    timer.call("POST summarize", http.post, f"/api/meetings/{meeting_id}/summarize", json={})
+    timer.call("POST send-email", http.post, f"/api/meetings/{meeting_id}/send-email", json={
+        "recipient_emails": [f"person{i}@example.com" for i in range(5)]
+    })
+    timer.call("GET /meetings", http.get, "/api/meetings?limit=20")
+    return meeting_id
+
+
+def run_rest_phase(args):
+    timer = RouteTimer()
+    start = time.perf_counter()
+
+    def worker(index):
+        with server.app.test_client() as http:
+            return run_meeting(http, timer, index, args.upload_kb * 1024, args.poll_interval)
+
+    if server.SERVER_MODE == "eventlet":
+        # Green threads: eventlet's locks must not be shared with real OS threads
+        meeting_ids = list(server.eventlet.GreenPool(args.concurrency).imap(worker, range(args.meetings)))
+    else:
+        with ThreadPoolExecutor(max_workers=args.concurrency) as pool:
+            meeting_ids = list(pool.map(worker, range(args.meetings)))
+    timer.report(time.perf_counter() - start)
+    return meeting_ids
+
+
+class LiveProbe:
+    """Records when audio was sent per session and when final transcripts came back."""
+
+    def __init__(self):
+        self.sent = defaultdict(lambda: ([], []))  # sid -> (cumulative bytes, send time)
+        self.delays = []
+        self.finals = 0
+        self._callback = server.on_deepgram_message
+
+    def mark_sent(self, sid, total_bytes):
+        offsets, times = self.sent[sid]
+        offsets.append(total_bytes)
+        times.append(time.perf_counter())
+
+    async def on_deepgram_message(self, result, sid, **kwargs):
+        if result.is_final:
+            offsets, times = self.sent[sid]
+            end_byte = int((result.start + result.duration) * BYTES_PER_SECOND)
+            position = bisect.bisect_left(offsets, end_byte)
+            if position < len(times):
+                self.delays.append((time.perf_counter() - times[position]) * 1000)
+                self.finals += 1
+        await self._callback(result, sid, **kwargs)
+
+
+async def run_session(probe: LiveProbe, meeting_id: str, seconds: float, chunk_ms: int):
+    if server.sio is not None:
+        sid = await server.sio.manager.connect(f"bench-{meeting_id}", "/")
+    else:
+        sid = server.socketio.server.manager.connect(f"bench-{meeting_id}", "/")
+    await server.join_meeting(sid, {"meeting_id": meeting_id})
+    chunk = b"\0" * (BYTES_PER_SECOND * chunk_ms // 1000)
+    sent = 0
+    started = time.perf_counter()
+    for i in range(int(seconds * 1000 / chunk_ms)):
+        # Pace like a microphone: chunk i is due at i * chunk_ms
+        await asyncio.sleep(max(0.0, started + i * chunk_ms / 1000 - time.perf_counter()))
+        sent += len(chunk)
+        probe.mark_sent(sid, sent)
+        await server.receive_audio(sid, chunk)
+    await server.client_disconnected(sid)
+
+
+async def run_live_phase(args, meeting_ids):
+    probe = LiveProbe()
+    server.on_deepgram_message = probe.on_deepgram_message
+    emitted = defaultdict(int)
+    original_emit = server.emit
+
+    async def counting_emit(event, *a, **k):
+        emitted[event] += 1
+        await original_emit(event, *a, **k)
+
+    server.emit = counting_emit
+    start = time.perf_counter()
+    await asyncio.gather(*(run_session(probe, meeting_id, args.live_seconds, args.chunk_ms)
+                           for meeting_id in meeting_ids))
+    wall = time.perf_counter() - start
+    server.emit = original_emit
+    server.on_deepgram_message = probe._callback
+
+    print(f"\nLive: {len(meeting_ids)} sessions x {args.live_seconds:.0f}s audio in {wall:.1f}s")
+    print(f"  final transcripts:     {probe.finals}")
+    print(f"  emitted events:        {dict(emitted)}")
+    if probe.delays:
+        print(f"  transcript delay p50:  {statistics.median(probe.delays):.1f} ms")
+        print(f"  transcript delay p99:  {percentile(probe.delays, 99):.1f} ms")
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[0])
+    parser.add_argument("--meetings", type=int, default=20)
+    parser.add_argument("--concurrency", type=int, default=8)
+    parser.add_argument("--upload-kb", type=int, default=512)
+    parser.add_argument("--poll-interval", type=float, default=0.1)
+    parser.add_argument("--live-seconds", type=float, default=10.0)
+    parser.add_argument("--chunk-ms", type=int, default=250)
+    parser.add_argument("--skip-live", action="store_true")
+    args = parser.parse_args()
+
+    print(f"providers={server.providers.mode} mongo={server.mongo_url} meetings={args.meetings} "
+          f"concurrency={args.concurrency}")
+    meeting_ids = run_rest_phase(args)
+    if not args.skip_live:
+        server.run_on_loop(run_live_phase(args, meeting_ids)).result()
+    print(f"\nPeak RSS: {peak_rss_mb():.0f} MB")
+
+
+if __name__ == "__main__":
+    main()
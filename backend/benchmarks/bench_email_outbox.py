@@ -0,0 +1,99 @@
+"""Benchmark: serial per-recipient sends vs the batched, retrying email outbox.
+
+Uses a local SendGrid stand-in with configurable per-request latency and failure rate, and an
+in-memory stand-in for the ``email_logs`` collection, so it runs without network access.
+
+    python benchmarks/bench_email_outbox.py --recipients 40 --latency-ms 400 --failure-rate 0.1
+"""
+import argparse
+import asyncio
+import copy
+import random
+import sys
+import threading
+import time
+from pathlib import Path
+
+sys.path.insert(0, str(Path(__file__).resolve().parent.parent))
+
+from email_outbox import EmailOutbox  # noqa: E402
+
+
+class FakeSendGrid:
+    """Sleeps ``latency`` per request and fails a request with probability ``failure_rate``."""
+
+    def __init__(self, latency, failure_rate, seed=1):
+        self.latency = latency
+        self.failure_rate = failure_rate
+        self.rng = random.Random(seed)
+        self.lock = threading.Lock()
+        self.requests = 0
+        self.delivered = 0
+
+    def send_batch(self, sender, recipients, subject, body):
+        time.sleep(self.latency)
+        with self.lock:
+            self.requests += 1
+            if self.rng.random() < self.failure_rate:
+                raise RuntimeError("SendGrid returned 503")
+            self.delivered += len(recipients)
+
+
+class MemoryCollection:
+    """Just enough of the Motor collection API for ``EmailOutbox``."""
+
+    def __init__(self):
+        self.docs = {}
+
+    async def insert_one(self, doc):
+        self.docs[doc["id"]] = copy.deepcopy(doc)
+
+    async def find_one(self, query, projection=None):
+        doc = self.docs.get(query["id"])
+        return copy.deepcopy(doc) if doc else None
+
+    async def update_one(self, query, update):
+        self.docs[query["id"]].update(copy.deepcopy(update["$set"]))
+
+
+def serial_baseline(sendgrid, recipients):
+    """What send_meeting_email used to do: one request per recipient, stop at the first error."""
+    for email in recipients:
+        sendgrid.send_batch({"email": "meetings@example.com"}, [email], "subject", "body")
+
+
+async def main():
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[0])
+    parser.add_argument("--recipients", type=int, default=40)
+    parser.add_argument("--latency-ms", type=float, default=400)
+    parser.add_argument("--failure-rate", type=float, default=0.1)
+    args = parser.parse_args()
+    recipients = [f"user{i}@example.com" for i in range(args.recipients)]
+    latency = args.latency_ms / 1000
+
+    baseline = FakeSendGrid(latency, args.failure_rate)
+    start = time.perf_counter()
+    try:
+        serial_baseline(baseline, recipients)
+        outcome = "all sent"
+    except RuntimeError:
+        outcome = "aborted on first failure"
+    print(f"serial baseline: {time.perf_counter() - start:6.2f}s, {baseline.requests} requests, "
+          f"{baseline.delivered}/{len(recipients)} delivered ({outcome})")
+
+    for batch_size in (1000, 10):
+        sendgrid = FakeSendGrid(latency, args.failure_rate)
+        outbox = EmailOutbox(MemoryCollection(), sendgrid.send_batch, batch_size=batch_size,
+                             max_concurrency=4, max_attempts=5, base_delay=0.05)
+        start = time.perf_counter()
+        outbox_id = await outbox.enqueue("bench", {"email": "meetings@example.com"}, "subject", "body", recipients)
+        enqueue_ms = (time.perf_counter() - start) * 1000
+        doc = await outbox.deliver(outbox_id)
+        sent = sum(1 for r in doc["recipients"] if r["status"] == "sent")
+        print(f"outbox batch={batch_size:<5} enqueue {enqueue_ms:5.2f} ms (request returns here), delivery "
+              f"{time.perf_counter() - start:6.2f}s, {sendgrid.requests} requests, {sent}/{len(recipients)} "
+              f"delivered in {doc['attempts']} rounds, status {doc['status']}")
+
+
+if __name__ == "__main__":
+    asyncio.run(main())
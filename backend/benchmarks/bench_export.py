@@ -0,0 +1,112 @@
+"""Benchmark: bulk export throughput (MB/s) and peak memory against a seeded collection.
+
+Seeds ``--meetings`` meetings, each with ``--segments`` transcript segments in bucketed storage
+and a summary, then streams every format through ``MeetingExporter`` (what ``GET /api/export``
+serves) and, for comparison, the load-everything approach: ``to_list`` every meeting and its
+transcript, then serialize. Peak memory is measured with ``tracemalloc`` (Python allocations).
+Run it with two sizes to see the streamed peak stay flat while the baseline grows.
+
+Defaults to the in-memory stand-in (``mongomock-motor``); pass ``--mongo-url`` for a real server.
+
+    MONGO_URL=mongodb://localhost:27017 python benchmarks/bench_export.py --meetings 1000 --segments 300
+"""
+import argparse
+import asyncio
+import json
+import os
+import random
+import sys
+import time
+import tracemalloc
+import uuid
+from datetime import datetime, timedelta
+from pathlib import Path
+
+sys.path.insert(0, str(Path(__file__).resolve().parent.parent))
+
+from export import MeetingExporter, export_query  # noqa: E402
+from providers import build_mongo_client  # noqa: E402
+from transcript_store import TranscriptStore  # noqa: E402
+
+WORDS = "budget roadmap hiring launch review pilot customer design sprint retro planning sync".split()
+
+
+async def seed(db, store, meetings, segments, rng):
+    await db.meetings.drop()
+    await db.transcript_buckets.drop()
+    await store.ensure_indexes()
+    await db.meetings.create_index([("timestamp", -1), ("id", -1)])
+    for i in range(meetings):
+        meeting_id = str(uuid.uuid4())
+        await db.meetings.insert_one({
+            "id": meeting_id, "title": f"{rng.choice(WORDS).title()} sync #{i}",
+            "timestamp": datetime(2024, 1, 1) + timedelta(hours=i), "host": "bench",
+            "participants": rng.sample(["alice", "bob", "chen", "dana", "eve"], 3),
+            "segments_count": segments, "status": "completed",
+            "summary": {"key_points": [" ".join(rng.choice(WORDS) for _ in range(10)) for _ in range(5)],
+                        "action_items": [" ".join(rng.choice(WORDS) for _ in range(8)) for _ in range(3)]},
+        })
+        await store.replace(meeting_id, [{
+            "id": str(uuid.uuid4()), "text": " ".join(rng.choice(WORDS) for _ in range(25)),
+            "timestamp": s * 4.0, "speaker": f"Speaker {s % 4}", "confidence": 0.9,
+        } for s in range(segments)])
+
+
+async def load_everything(db, store):
+    """The approach the export replaces: materialize all meetings, then serialize in one go."""
+    meetings = await db.meetings.find({}, {"_id": 0}).to_list(None)
+    for meeting in meetings:
+        meeting["transcript"] = await store.read_range(meeting["id"])
+    return "\n".join(json.dumps(m, default=str) for m in meetings).encode()
+
+
+async def measure(produce):
+    tracemalloc.start()
+    start = time.perf_counter()
+    size = await produce()
+    elapsed = time.perf_counter() - start
+    _, peak = tracemalloc.get_traced_memory()
+    tracemalloc.stop()
+    return size, elapsed, peak
+
+
+async def main():
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[0])
+    parser.add_argument("--mongo-url", default=os.environ.get("MONGO_URL", "mongomock://"))
+    parser.add_argument("--meetings", type=int, default=300)
+    parser.add_argument("--segments", type=int, default=200)
+    parser.add_argument("--batch-size", type=int, default=100)
+    parser.add_argument("--chunk-kb", type=int, default=64)
+    args = parser.parse_args()
+
+    client = build_mongo_client(args.mongo_url)
+    db = client["bench_export"]
+    store = TranscriptStore(db.transcript_buckets)
+    await seed(db, store, args.meetings, args.segments, random.Random(7))
+    print(f"{args.meetings} meetings x {args.segments} segments; mongo={args.mongo_url}")
+    print(f"{'export':<18}{'MB':>9}{'seconds':>9}{'MB/s':>8}{'peak MB':>9}")
+
+    for export_format in ("ndjson", "csv", "markdown"):
+        async def produce():
+            exporter = MeetingExporter(db.meetings, store, batch_size=args.batch_size,
+                                       chunk_bytes=args.chunk_kb * 1024)
+            async for _ in exporter.stream(export_format, export_query()):
+                pass
+            return exporter.bytes_exported
+
+        size, elapsed, peak = await measure(produce)
+        print(f"{export_format + ' (stream)':<18}{size / 1e6:>9.1f}{elapsed:>9.2f}{size / 1e6 / elapsed:>8.1f}{peak / 1e6:>9.1f}")
+
+    async def produce_all():
+        return len(await load_everything(db, store))
+
+    size, elapsed, peak = await measure(produce_all)
+    print(f"{'ndjson (to_list)':<18}{size / 1e6:>9.1f}{elapsed:>9.2f}{size / 1e6 / elapsed:>8.1f}{peak / 1e6:>9.1f}")
+
+    await db.meetings.drop()
+    await db.transcript_buckets.drop()
+    client.close()
+
+
+if __name__ == "__main__":
+    asyncio.run(main())
@@ -0,0 +1,138 @@
+"""Benchmark: outbound messages, bytes and staleness of live transcript fan-out to a meeting room.
+
+Replays a simulated Deepgram stream (an interim every ``--interim-ms`` that grows, and now and then
+revises, the current utterance; a final every ``--words-per-utterance`` words) into
+
+* baseline – every result emitted in full as it arrives (the original ``transcript_update``)
+* fanout   – ``LiveFanout``: interims throttled to ``--debounce-ms`` and delta-encoded, finals in full
+
+and delivers every emit to ``--listeners`` viewers (each payload JSON-encoded once, as Socket.IO
+does, and counted once per viewer). Staleness is how long an interim waited until a message
+carrying it, or a newer text, went out. No server or database is needed.
+
+    python benchmarks/bench_live_fanout.py --listeners 200 --utterances 40
+"""
+import argparse
+import asyncio
+import json
+import random
+import statistics
+import sys
+import time
+from pathlib import Path
+
+sys.path.insert(0, str(Path(__file__).resolve().parent.parent))
+
+from live_fanout import LiveFanout, apply_interim_delta  # noqa: E402
+
+WORDS = ("we should ship the release next week after the review of the budget numbers and "
+         "the customer feedback from the pilot so please follow up with finance").split()
+
+
+def percentile(values, pct):
+    ordered = sorted(values)
+    return ordered[min(len(ordered) - 1, int(len(ordered) * pct / 100))] if ordered else 0.0
+
+
+def make_stream(utterances, words_per_utterance, rng):
+    """(is_final, text) results: an interim per word, sometimes revising the previous word."""
+    results = []
+    for _ in range(utterances):
+        words = []
+        for _ in range(words_per_utterance):
+            if words and rng.random() < 0.2:
+                words[-1] = rng.choice(WORDS)
+            words.append(rng.choice(WORDS))
+            results.append((False, " ".join(words)))
+        results.append((True, " ".join(words)))
+    return results
+
+
+class Room:
+    """Counts what every listener of a room receives and checks the deltas decode."""
+
+    def __init__(self, listeners):
+        self.listeners = listeners
+        self.messages = 0
+        self.bytes = 0
+        self.sent_at = []  # (time, index of the newest result reflected)
+        self.current = -1
+        self.decoded = ""
+        self.mismatches = 0
+        self.expected = ""
+
+    async def emit(self, event, data, to=None):
+        self.messages += self.listeners
+        self.bytes += len(json.dumps([event, data]).encode()) * self.listeners
+        self.sent_at.append((time.perf_counter(), self.current))
+        if event == "transcript_interim":
+            self.decoded = apply_interim_delta(self.decoded, data)
+            self.mismatches += self.decoded != self.expected
+        else:
+            self.decoded = ""
+
+
+async def replay(results, interim_seconds, make_sink, room):
+    received_at = []
+    sink = make_sink(room)
+    start = time.perf_counter()
+    for index, (is_final, text) in enumerate(results):
+        await asyncio.sleep(max(0.0, start + index * interim_seconds - time.perf_counter()))
+        room.current, room.expected = index, text
+        received_at.append(time.perf_counter())
+        await sink(is_final, text)
+    await asyncio.sleep(interim_seconds * 4)  # let a trailing debounce window fire
+
+    staleness = []
+    position = 0
+    for index, received in enumerate(received_at):
+        while position < len(room.sent_at) and room.sent_at[position][1] < index:
+            position += 1
+        if position < len(room.sent_at):
+            staleness.append((room.sent_at[position][0] - received) * 1000)
+    return staleness
+
+
+def baseline_sink(room):
+    async def sink(is_final, text):
+        await room.emit('transcript_update', {"type": "transcript", "data": {
+            "text": text, "timestamp": time.time(), "is_final": is_final
+        }}, to="room")
+    return sink
+
+
+def fanout_sink(debounce):
+    def make(room):
+        fanout = LiveFanout(room.emit, "room", "sid-1", debounce=debounce)
+
+        async def sink(is_final, text):
+            if is_final:
+                await fanout.final({"text": text, "timestamp": time.time(), "is_final": True})
+            else:
+                await fanout.interim(text)
+        return sink
+    return make
+
+
+async def main():
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[0])
+    parser.add_argument("--listeners", type=int, default=100)
+    parser.add_argument("--utterances", type=int, default=30)
+    parser.add_argument("--words-per-utterance", type=int, default=15)
+    parser.add_argument("--interim-ms", type=float, default=60.0)
+    parser.add_argument("--debounce-ms", type=float, default=150.0)
+    args = parser.parse_args()
+
+    results = make_stream(args.utterances, args.words_per_utterance, random.Random(7))
+    print(f"{len(results)} results ({args.utterances} finals), {args.listeners} listeners, "
+          f"interim every {args.interim_ms:g} ms, debounce {args.debounce_ms:g} ms")
+    print(f"{'mode':<10}{'messages':>10}{'KB':>10}{'KB/viewer':>11}{'stale p50':>11}{'stale p99':>11}{'bad':>5}")
+    for label, make_sink in (("baseline", baseline_sink), ("fanout", fanout_sink(args.debounce_ms / 1000))):
+        room = Room(args.listeners)
+        staleness = await replay(results, args.interim_ms / 1000, make_sink, room)
+        print(f"{label:<10}{room.messages:>10}{room.bytes / 1024:>10.0f}{room.bytes / 1024 / args.listeners:>11.1f}"
+              f"{statistics.median(staleness):>9.1f}ms{percentile(staleness, 99):>9.1f}ms{room.mismatches:>5}")
+
+
+if __name__ == "__main__":
+    asyncio.run(main())
@@ -0,0 +1,180 @@
+"""Benchmark: live-session capacity across several worker processes, with owner routing.
+
+Starts W worker processes that share a ``LocalSessionRegistry`` (a ``multiprocessing.Manager``
+dict) and talk over a ``QueueSessionBus``. A driver opens S sessions round-robin and then sends
+every audio chunk to a *random* worker, as a non-sticky load balancer would, so most chunks must be
+forwarded to the owning worker. Each upstream send burns ``--frame-cost-ms`` of CPU, standing in
+for the Deepgram client. Reports frames delivered upstream per second for W = 1, 2, 4, ...
+(linear scaling needs at least W free CPU cores).
+
+With ``--kill-worker`` the first worker is terminated halfway through and the report shows how
+many of its sessions were taken over by the survivors.
+
+    python benchmarks/bench_live_workers.py --workers 1 2 4 --sessions 300 --seconds 6
+"""
+import argparse
+import asyncio
+import hashlib
+import multiprocessing as mp
+import random
+import sys
+import time
+from pathlib import Path
+
+sys.path.insert(0, str(Path(__file__).resolve().parent.parent))
+
+from audio_ingest import AudioIngest  # noqa: E402
+from session_registry import LocalSessionRegistry, QueueSessionBus, encode_message  # noqa: E402
+
+FRAME_BYTES = 3200  # 100 ms of linear16 @ 16 kHz
+
+
+def burn(ms):
+    end = time.process_time() + ms / 1000
+    digest = b""
+    while time.process_time() < end:
+        digest = hashlib.sha256(digest + b"x" * 256).digest()
+
+
+def worker_main(worker_id, inboxes, store, lock, results, frame_cost_ms, ttl):
+    async def run():
+        loop = asyncio.get_running_loop()
+        registry = LocalSessionRegistry(store, worker_id, ttl=ttl, lock=lock)
+        bus = QueueSessionBus(worker_id, inboxes)
+        ingests = {}
+        stats = {"forwarded": 0, "taken_over": 0, "first_audio": None}
+        done = asyncio.Event()
+
+        async def upstream_send(frame):
+            burn(frame_cost_ms)
+
+        async def start_session(sid, meeting_id):
+            ingests[sid] = AudioIngest(upstream_send, max_queued_frames=20)
+            await registry.claim(sid, meeting_id)
+
+        async def client_audio(sid, data):
+            if sid in ingests:
+                await ingests[sid].feed(data)
+                return
+            entry = await registry.lookup(sid)
+            if not entry:
+                return
+            if registry.is_alive(entry) and bus.publish(entry["worker_id"], {"type": "audio", "sid": sid, "data": data}):
+                stats["forwarded"] += 1
+            elif await registry.takeover(sid):
+                stats["taken_over"] += 1
+                ingests[sid] = AudioIngest(upstream_send, max_queued_frames=20)
+                await ingests[sid].feed(data)
+
+        async def dispatch(message):
+            kind = message["type"]
+            if kind == "client_join":
+                await start_session(message["sid"], message["sid"])
+            elif kind in ("client_audio", "audio"):
+                if stats["first_audio"] is None:
+                    stats["first_audio"] = time.perf_counter()
+                if kind == "audio" and message["sid"] in ingests:
+                    await ingests[message["sid"]].feed(message["data"])
+                else:
+                    await client_audio(message["sid"], message["data"])
+            elif kind == "stop":
+                done.set()
+
+        async def heartbeat():
+            while not done.is_set():
+                await registry.heartbeat()
+                await asyncio.sleep(ttl / 3)
+
+        bus.start(lambda message: asyncio.run_coroutine_threadsafe(dispatch(message), loop))
+        heartbeat_task = loop.create_task(heartbeat())
+        cpu_start = time.process_time()
+        await done.wait()
+        # Rate over the time this worker actually spent on audio; a saturated worker is still
+        # working through its inbox long after the driver stops
+        frames_out = sum(i.frames_out for i in ingests.values())
+        busy = time.perf_counter() - (stats.pop("first_audio") or time.perf_counter())
+        for ingest in ingests.values():
+            await ingest.close()
+        heartbeat_task.cancel()
+        results.put({
+            "worker_id": worker_id,
+            "frames_out": frames_out,
+            "rate": frames_out / busy if busy > 0 else 0.0,
+            "dropped": sum(i.dropped_frames for i in ingests.values()),
+            "cpu": time.process_time() - cpu_start,
+            **stats,
+        })
+
+    asyncio.run(run())
+
+
+def run_cluster(workers, sessions, seconds, frame_cost_ms, kill_worker, ttl=2.0):
+    manager = mp.Manager()
+    store, lock = manager.dict(), manager.Lock()
+    worker_ids = [f"w{i}" for i in range(workers)]
+    inboxes = {worker_id: manager.Queue() for worker_id in worker_ids}
+    results = manager.Queue()
+    processes = {worker_id: mp.Process(target=worker_main, args=(
+        worker_id, inboxes, store, lock, results, frame_cost_ms, ttl)) for worker_id in worker_ids}
+    for process in processes.values():
+        process.start()
+
+    sids = [f"s{i}" for i in range(sessions)]
+    for i, sid in enumerate(sids):
+        inboxes[worker_ids[i % workers]].put(encode_message({"type": "client_join", "sid": sid}))
+    time.sleep(0.5)
+
+    rng = random.Random(1)
+    frame = b"\0" * FRAME_BYTES
+    alive = list(worker_ids)
+    sent, killed = 0, None
+    start = time.perf_counter()
+    tick = 0
+    while time.perf_counter() - start < seconds:
+        if kill_worker and killed is None and time.perf_counter() - start > seconds / 2:
+            killed = alive.pop(0)
+            processes[killed].terminate()
+        for sid in sids:  # one 100 ms frame per session per tick
+            inboxes[rng.choice(alive)].put(encode_message({"type": "client_audio", "sid": sid, "data": frame}))
+            sent += 1
+        tick += 1
+        delay = start + tick * 0.1 - time.perf_counter()
+        if delay > 0:
+            time.sleep(delay)
+    elapsed = time.perf_counter() - start
+
+    for worker_id in alive:
+        inboxes[worker_id].put(encode_message({"type": "stop", "sid": ""}))
+    reports = [results.get(timeout=60) for _ in alive]
+    for process in processes.values():
+        process.join(timeout=10)
+    owners = {}
+    for entry in store.values():
+        owners[entry["worker_id"]] = owners.get(entry["worker_id"], 0) + 1
+    manager.shutdown()
+
+    delivered = sum(r["rate"] for r in reports)
+    taken_over = sum(r["taken_over"] for r in reports)
+    print(f"{workers:>7}{sent / elapsed:>14.0f}{delivered:>16.0f}{sum(r['dropped'] for r in reports):>9}"
+          f"{sum(r['forwarded'] for r in reports):>11}"
+          + (f"   killed {killed}, {taken_over} sessions taken over, owners now {owners}" if killed else ""))
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[0])
+    parser.add_argument("--workers", type=int, nargs="+", default=[1, 2, 4])
+    parser.add_argument("--sessions", type=int, default=200)
+    parser.add_argument("--seconds", type=float, default=6)
+    parser.add_argument("--frame-cost-ms", type=float, default=1.0)
+    parser.add_argument("--kill-worker", action="store_true")
+    args = parser.parse_args()
+
+    print(f"{args.sessions} sessions x 10 frames/s, {args.frame_cost_ms} ms CPU per upstream frame")
+    print(f"{'workers':>7}{'offered fr/s':>14}{'delivered fr/s':>16}{'dropped':>9}{'forwarded':>11}")
+    for workers in args.workers:
+        run_cluster(workers, args.sessions, args.seconds, args.frame_cost_ms,
+                    kill_worker=args.kill_worker and workers > 1)
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,134 @@
+"""Benchmark: meeting history listing latency and response size on a seeded collection.
+
+Compares the original query (unanchored ``$regex`` over title/host, full documents, 100 rows) with the projected, keyset-paginated query served by
+``GET /api/meetings``. Needs a reachable MongoDB; seeds a throwaway database.
+
+    MONGO_URL=mongodb://localhost:27017 python benchmarks/bench_meeting_listing.py --meetings 5000
+"""
+import argparse
+import asyncio
+import json
+import os
+import random
+import statistics
+import sys
+import time
+import uuid
+from datetime import datetime, timedelta
+from pathlib import Path
+
+sys.path.insert(0, str(Path(__file__).resolve().parent.parent))
+
+from motor.motor_asyncio import AsyncIOMotorClient  # noqa: E402
+from pymongo import ASCENDING, DESCENDING, TEXT  # noqa: E402
+
+from pagination import encode_cursor, keyset_filter  # noqa: E402
+
+WORDS = "budget roadmap hiring launch review pilot customer design sprint retro planning sync".split()
+LIST_PROJECTION = {"_id": 0, "id": 1, "title": 1, "timestamp": 1, "host": 1,
+                   "participants": 1, "duration": 1, "status": 1, "segments_count": 1}
+
+
+def make_meeting(i, rng, segments):
+    start = datetime(2024, 1, 1) + timedelta(minutes=37 * i)
+    transcript = [{
+        "id": str(uuid.uuid4()),
+        "text": " ".join(rng.choice(WORDS) for _ in range(20)),
+        "timestamp": s * 4.0, "speaker": f"Speaker {s % 4}", "confidence": 0.9,
+    } for s in range(segments)]
+    return {
+        "id": str(uuid.uuid4()),
+        "title": f"{rng.choice(WORDS).title()} {rng.choice(WORDS)} #{i}",
+        "timestamp": start,
+        "host": rng.choice(["Alice", "Bob", "Chen", "Dana"]),
+        "participants": rng.sample(["alice", "bob", "chen", "dana", "eve", "femi"], 3),
+        "transcript": transcript,
+        "segments_count": segments,
+        "summary": {"key_points": [" ".join(rng.choice(WORDS) for _ in range(12)) for _ in range(10)]},
+        "status": "completed",
+    }
+
+
+async def seed(collection, count, segments):
+    rng = random.Random(7)
+    await collection.drop()
+    batch = []
+    for i in range(count):
+        batch.append(make_meeting(i, rng, segments))
+        if len(batch) == 200:
+            await collection.insert_many(batch)
+            batch = []
+    if batch:
+        await collection.insert_many(batch)
+    await collection.create_index("id", unique=True)
+    await collection.create_index([("timestamp", DESCENDING), ("id", DESCENDING)])
+    await collection.create_index([("participants", ASCENDING), ("timestamp", DESCENDING)])
+    await collection.create_index([("title", TEXT), ("host", TEXT)], name="meetings_search")
+
+
+async def old_listing(collection, search):
+    query = {}
+    if search:
+        query["$or"] = [{"title": {"$regex": search, "$options": "i"}},
+                        {"host": {"$regex": search, "$options": "i"}}]
+    docs = await collection.find(query).sort("timestamp", -1).to_list(100)
+    for doc in docs:
+        doc.pop("_id", None)
+    return json.dumps(docs, default=str)
+
+
+async def new_listing(collection, search, cursor=None, limit=20):
+    query = keyset_filter(cursor)
+    if search:
+        query["$text"] = {"$search": search}
+    docs = await (collection.find(query, LIST_PROJECTION)
+                  .sort([("timestamp", DESCENDING), ("id", DESCENDING)])
+                  .limit(limit + 1).to_list(limit + 1))
+    next_cursor = None
+    if len(docs) > limit:
+        docs = docs[:limit]
+        next_cursor = encode_cursor(docs[-1]["timestamp"], docs[-1]["id"])
+    return json.dumps({"meetings": docs, "next_cursor": next_cursor}, default=str)
+
+
+async def measure(label, fn, runs):
+    latencies, size = [], 0
+    for _ in range(runs):
+        start = time.perf_counter()
+        body = await fn()
+        latencies.append((time.perf_counter() - start) * 1000)
+        size = len(body)
+    quantiles = statistics.quantiles(latencies, n=100)
+    print(f"{label:<34}{quantiles[49]:>9.1f}{quantiles[98]:>9.1f}{size / 1024:>12.1f}")
+
+
+async def main():
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[0])
+    parser.add_argument("--meetings", type=int, default=3000)
+    parser.add_argument("--segments", type=int, default=300)
+    parser.add_argument("--runs", type=int, default=50)
+    parser.add_argument("--no-seed", action="store_true")
+    args = parser.parse_args()
+
+    client = AsyncIOMotorClient(os.environ.get("MONGO_URL", "mongodb://localhost:27017"))
+    collection = client["bench_meeting_listing"]["meetings"]
+    if not args.no_seed:
+        print(f"Seeding {args.meetings} meetings x {args.segments} segments...")
+        await seed(collection, args.meetings, args.segments)
+
+    first_page = json.loads(await new_listing(collection, None))
+    deep_cursor = first_page["next_cursor"]
+    for _ in range(20):
+        deep_cursor = json.loads(await new_listing(collection, None, deep_cursor))["next_cursor"] or deep_cursor
+
+    print(f"{'query':<34}{'p50 ms':>9}{'p99 ms':>9}{'resp KiB':>12}")
+    await measure("old: list all", lambda: old_listing(collection, None), args.runs)
+    await measure("old: search 'budget'", lambda: old_listing(collection, "budget"), args.runs)
+    await measure("new: first page", lambda: new_listing(collection, None), args.runs)
+    await measure("new: page 21 (keyset)", lambda: new_listing(collection, None, deep_cursor), args.runs)
+    await measure("new: search 'budget'", lambda: new_listing(collection, "budget"), args.runs)
+    client.close()
+
+
+if __name__ == "__main__":
+    asyncio.run(main())
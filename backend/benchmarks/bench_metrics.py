@@ -0,0 +1,96 @@
+"""Microbenchmark: cost of the metrics instrumentation on the hot paths.
+
+Measures the per-call overhead of ``Histogram.observe``, ``Counter.inc``, the ``Histogram.time``
+context manager, the ``metrics.to_thread`` wrapper compared with plain ``asyncio.to_thread``,
+and the time to render a realistically sized registry for one scrape.
+
+    python benchmarks/bench_metrics.py --iterations 500000
+"""
+import argparse
+import asyncio
+import statistics
+import sys
+import time
+from pathlib import Path
+
+sys.path.insert(0, str(Path(__file__).resolve().parent.parent))
+
+import metrics  # noqa: E402
+
+
+def per_call_ns(func, iterations):
+    start = time.perf_counter_ns()
+    for _ in range(iterations):
+        func()
+    return (time.perf_counter_ns() - start) / iterations
+
+
+def bench_primitives(iterations):
+    registry = metrics.Registry()
+    histogram = registry.histogram("bench_seconds", "bench", ["method", "route", "status"])
+    counter = registry.counter("bench_total", "bench", ["type"])
+
+    def noop():
+        pass
+
+    def observe():
+        histogram.observe(0.0123, "GET", "/api/meetings", "200")
+
+    def inc():
+        counter.inc(1, "prompt")
+
+    def timed():
+        with histogram.time("GET", "/api/meetings", "200"):
+            pass
+
+    baseline = per_call_ns(noop, iterations)
+    print(f"{'operation':<28}{'ns/call':>10}")
+    for label, func in (("Histogram.observe", observe), ("Counter.inc", inc), ("Histogram.time()", timed)):
+        print(f"{label:<28}{per_call_ns(func, iterations) - baseline:>10.0f}")
+
+
+async def bench_to_thread(calls):
+    def work():
+        return None
+
+    async def run(offload):
+        samples = []
+        for _ in range(calls):
+            start = time.perf_counter()
+            await offload()
+            samples.append((time.perf_counter() - start) * 1e6)
+        return statistics.median(samples)
+
+    plain = await run(lambda: asyncio.to_thread(work))
+    wrapped = await run(lambda: metrics.to_thread("bench", work))
+    print(f"\nasyncio.to_thread median: {plain:.1f} us, metrics.to_thread median: {wrapped:.1f} us "
+          f"(+{wrapped - plain:.1f} us)")
+
+
+def bench_render(routes, label_sets):
+    registry = metrics.Registry()
+    histogram = registry.histogram("http_request_duration_seconds", "bench", ["method", "route", "status"])
+    for route in range(routes):
+        for status in range(label_sets):
+            histogram.observe(0.01 * status, "GET", f"/api/route/{route}", str(200 + status))
+    start = time.perf_counter()
+    body = registry.render()
+    elapsed = (time.perf_counter() - start) * 1000
+    print(f"\nRender {routes * label_sets} histogram series: {elapsed:.1f} ms, {len(body) / 1024:.0f} KiB")
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[0])
+    parser.add_argument("--iterations", type=int, default=200000)
+    parser.add_argument("--thread-calls", type=int, default=2000)
+    parser.add_argument("--routes", type=int, default=30)
+    parser.add_argument("--statuses", type=int, default=4)
+    args = parser.parse_args()
+
+    bench_primitives(args.iterations)
+    asyncio.run(bench_to_thread(args.thread_calls))
+    bench_render(args.routes, args.statuses)
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,79 @@
+"""Benchmark: ``/api/search`` segment query latency on a seeded segment collection.
+
+Seeds ``--meeting-hours`` worth of segments (~900 per hour) into a throwaway database and
+reports p50/p99 latency for first pages and for deep cursor pages. Needs a reachable MongoDB.
+
+    MONGO_URL=mongodb://localhost:27017 python benchmarks/bench_segment_search.py --meeting-hours 20000
+"""
+import argparse
+import asyncio
+import os
+import random
+import statistics
+import sys
+import time
+import uuid
+from pathlib import Path
+
+sys.path.insert(0, str(Path(__file__).resolve().parent.parent))
+
+from motor.motor_asyncio import AsyncIOMotorClient  # noqa: E402
+
+from segment_search import SegmentSearchIndex  # noqa: E402
+
+VOCABULARY = [f"word{i}" for i in range(5000)] + "budget roadmap hiring launch review pilot".split()
+SEGMENTS_PER_HOUR = 900
+
+
+async def seed(index, meeting_hours):
+    rng = random.Random(11)
+    await index.collection.drop()
+    await index.ensure_indexes()
+    for hour in range(meeting_hours):
+        meeting_id = str(uuid.uuid4())
+        await index.add_segments(meeting_id, [{
+            "id": str(uuid.uuid4()),
+            "text": " ".join(rng.choice(VOCABULARY) for _ in range(18)),
+            "timestamp": s * 4.0, "speaker": f"Speaker {s % 4}",
+        } for s in range(SEGMENTS_PER_HOUR)])
+        if hour % 1000 == 0:
+            print(f"  seeded {hour} meeting-hours")
+
+
+async def measure(label, fn, runs):
+    latencies = []
+    for _ in range(runs):
+        start = time.perf_counter()
+        await fn()
+        latencies.append((time.perf_counter() - start) * 1000)
+    quantiles = statistics.quantiles(latencies, n=100)
+    print(f"{label:<36}{quantiles[49]:>9.1f}{quantiles[98]:>9.1f}")
+
+
+async def main():
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[0])
+    parser.add_argument("--meeting-hours", type=int, default=1000)
+    parser.add_argument("--runs", type=int, default=50)
+    parser.add_argument("--no-seed", action="store_true")
+    args = parser.parse_args()
+
+    client = AsyncIOMotorClient(os.environ.get("MONGO_URL", "mongodb://localhost:27017"))
+    index = SegmentSearchIndex(client["bench_segment_search"]["transcript_segments"])
+    if not args.no_seed:
+        print(f"Seeding {args.meeting_hours} meeting-hours ({args.meeting_hours * SEGMENTS_PER_HOUR} segments)...")
+        await seed(index, args.meeting_hours)
+
+    _, cursor = await index.search("word42")
+    for _ in range(5):
+        _, cursor = await index.search("word42", cursor=cursor)
+
+    print(f"{'query':<36}{'p50 ms':>9}{'p99 ms':>9}")
+    await measure("rare term, first page", lambda: index.search("word42"), args.runs)
+    await measure("rare term, page 7", lambda: index.search("word42", cursor=cursor), args.runs)
+    await measure("two terms", lambda: index.search("word42 word4242"), args.runs)
+    await measure("common term, first page", lambda: index.search("budget"), args.runs)
+    client.close()
+
+
+if __name__ == "__main__":
+    asyncio.run(main())
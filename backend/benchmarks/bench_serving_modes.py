@@ -0,0 +1,155 @@
+"""Side-by-side load test of the eventlet and ASGI serving modes.
+
+Starts the backend once per mode as a subprocess (``python server.py`` for eventlet,
+``uvicorn asgi:app`` for ASGI) with the fake providers, then drives the same HTTP mix against each
+from ``--concurrency`` client threads: create meeting, fetch it, list meetings, save a transcript
+and summarize it (fake OpenAI with ``FAKE_OPENAI_LATENCY``). Reports req/s, p50/p99 latency,
+errors and the server's peak RSS.
+
+MongoDB defaults to the in-memory stand-in (one per server process, needs ``mongomock-motor``);
+pass ``--mongo-url mongodb://...`` to measure against a real server, where Motor's loop binding
+matters most.
+
+    pip install uvicorn a2wsgi mongomock-motor
+    python benchmarks/bench_serving_modes.py --requests 2000 --concurrency 32
+"""
+import argparse
+import json
+import os
+import statistics
+import subprocess
+import sys
+import threading
+import time
+import urllib.error
+import urllib.request
+from concurrent.futures import ThreadPoolExecutor
+from pathlib import Path
+
+BACKEND_DIR = Path(__file__).resolve().parent.parent
+
+
+def percentile(values, pct):
+    ordered = sorted(values)
+    return ordered[min(len(ordered) - 1, int(len(ordered) * pct / 100))] if ordered else 0.0
+
+
+def request(base, method, path, body=None):
+    data = json.dumps(body).encode() if body is not None else None
+    req = urllib.request.Request(base + path, data=data, method=method,
+                                 headers={"Content-Type": "application/json"})
+    with urllib.request.urlopen(req, timeout=60) as response:
+        return json.loads(response.read() or b"null")
+
+
+def start_server(mode, port, mongo_url):
+    env = dict(os.environ, PROVIDERS="fake", SERVER_MODE=mode, MONGO_URL=mongo_url,
+               DB_NAME=f"bench_serving_{mode}", PORT=str(port))
+    env.setdefault("FAKE_OPENAI_LATENCY", "0.2")
+    if mode == "asgi":
+        command = [sys.executable, "-m", "uvicorn", "asgi:app", "--port", str(port), "--log-level", "warning"]
+    else:
+        command = [sys.executable, "server.py"]
+    process = subprocess.Popen(command, cwd=BACKEND_DIR, env=env,
+                               stdout=subprocess.DEVNULL, stderr=subprocess.DEVNULL)
+    deadline = time.time() + 30
+    while time.time() < deadline:
+        try:
+            request(f"http://127.0.0.1:{port}", "GET", "/api/")
+            return process
+        except (urllib.error.URLError, ConnectionError):
+            time.sleep(0.2)
+    process.kill()
+    raise RuntimeError(f"{mode} server did not start on port {port}")
+
+
+def peak_rss_mb(pid):
+    try:
+        for line in Path(f"/proc/{pid}/status").read_text().splitlines():
+            if line.startswith("VmHWM:"):
+                return int(line.split()[1]) / 1024
+    except OSError:
+        pass
+    return float("nan")
+
+
+def scenario(base, index):
+    """One iteration of the request mix; returns (label, ms) samples."""
+    samples = []
+
+    def timed(label, method, path, body=None):
+        start = time.perf_counter()
+        result = request(base, method, path, body)
+        samples.append((label, (time.perf_counter() - start) * 1000))
+        return result
+
+    meeting = timed("POST /meetings", "POST", "/api/meetings", {"title": f"Bench {index}", "host": "bench"})
+    timed("GET /meetings/<id>", "GET", f"/api/meetings/{meeting['id']}")
+    timed("GET /meetings", "GET", "/api/meetings?limit=20")
+    timed("POST transcript", "POST", f"/api/meetings/{meeting['id']}/transcript", {
+        "segments": [{"text": f"Line {i} about the launch plan", "speaker": f"Speaker {i % 2}",
+                     "timestamp": float(i)} for i in range(20)]
+    })
+    timed("POST summarize", "POST", f"/api/meetings/{meeting['id']}/summarize", {"refresh": True})
+    return samples
+
+
+def run_load(base, iterations, concurrency):
+    samples, errors = [], 0
+    lock = threading.Lock()
+
+    def worker(index):
+        nonlocal errors
+        try:
+            result = scenario(base, index)
+        except Exception:
+            with lock:
+                errors += 1
+            return
+        with lock:
+            samples.extend(result)
+
+    start = time.perf_counter()
+    with ThreadPoolExecutor(max_workers=concurrency) as pool:
+        list(pool.map(worker, range(iterations)))
+    return samples, errors, time.perf_counter() - start
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[0])
+    parser.add_argument("--requests", type=int, default=1000, help="approximate number of HTTP requests per mode")
+    parser.add_argument("--concurrency", type=int, default=32)
+    parser.add_argument("--modes", nargs="+", default=["eventlet", "asgi"])
+    parser.add_argument("--mongo-url", default="mongomock://")
+    parser.add_argument("--port", type=int, default=8765)
+    args = parser.parse_args()
+
+    iterations = max(1, args.requests // 5)
+    results = {}
+    for offset, mode in enumerate(args.modes):
+        process = start_server(mode, args.port + offset, args.mongo_url)
+        try:
+            samples, errors, wall = run_load(f"http://127.0.0.1:{args.port + offset}", iterations, args.concurrency)
+            results[mode] = (samples, errors, wall, peak_rss_mb(process.pid))
+        finally:
+            process.terminate()
+            process.wait(timeout=10)
+
+    print(f"\n{'mode':<10}{'req/s':>9}{'p50 ms':>9}{'p99 ms':>9}{'errors':>8}{'RSS MB':>8}")
+    for mode, (samples, errors, wall, rss) in results.items():
+        latencies = [ms for _, ms in samples]
+        print(f"{mode:<10}{len(samples) / wall:>9.1f}{statistics.median(latencies) if latencies else 0:>9.1f}"
+              f"{percentile(latencies, 99):>9.1f}{errors:>8}{rss:>8.0f}")
+
+    labels = sorted({label for samples, *_ in results.values() for label, _ in samples})
+    print(f"\n{'route p50/p99 ms':<22}" + "".join(f"{mode:>20}" for mode in results))
+    for label in labels:
+        row = ""
+        for samples, *_ in results.values():
+            values = [ms for name, ms in samples if name == label]
+            row += f"{statistics.median(values):>10.1f}/{percentile(values, 99):<9.1f}" if values else f"{'-':>20}"
+        print(f"{label:<22}{row}")
+
+
+if __name__ == "__main__":
+    main()
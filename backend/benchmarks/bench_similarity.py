@@ -0,0 +1,124 @@
+"""Benchmark: related-meeting and open-item clustering queries on a large synthetic corpus.
+
+Builds ``MeetingSimilarity`` in memory (no database) for ``--meetings`` synthetic meetings drawn
+from a handful of recurring topics, each with a few action items built from shared templates, then
+times index build, ``related`` queries (one sparse matrix-vector product) against a per-pair
+Python loop over dict vectors, and the blocked near-duplicate clustering of all items.
+
+    python benchmarks/bench_similarity.py --meetings 20000
+"""
+import argparse
+import asyncio
+import math
+import random
+import statistics
+import sys
+import time
+from pathlib import Path
+
+sys.path.insert(0, str(Path(__file__).resolve().parent.parent))
+
+from similarity import MeetingSimilarity  # noqa: E402
+
+TOPICS = [
+    "budget forecast spending finance quarter revenue costs".split(),
+    "launch marketing campaign press website announcement".split(),
+    "hiring candidates interviews recruiting onboarding offers".split(),
+    "incident outage postmortem oncall alerts database".split(),
+    "roadmap features customers feedback priorities backlog".split(),
+    "design mockups usability research prototype review".split(),
+]
+FILLER = "team discuss plan next week update status share notes follow meeting".split()
+ITEM_TEMPLATES = ["{who} to {verb} the {thing} {detail}", "{who} will {verb} the {thing} {detail} by friday",
+                  "{verb} the {detail} {thing} ({who})", "Follow up: {who} to {verb} {thing} {detail}"]
+WHO = [f"person{i}" for i in range(40)]
+VERBS = ["send", "review", "update", "draft", "finalize", "schedule", "check", "share"]
+DETAILS = [f"item{i}" for i in range(500)]
+
+
+def make_meeting(rng):
+    topic = rng.choice(TOPICS)
+    segments = [{"text": " ".join(rng.choice(topic if rng.random() < 0.4 else FILLER) for _ in range(20))}
+                for _ in range(rng.randint(20, 60))]
+    items = [rng.choice(ITEM_TEMPLATES).format(who=rng.choice(WHO), verb=rng.choice(VERBS), thing=rng.choice(topic),
+                                               detail=rng.choice(DETAILS))
+             for _ in range(rng.randint(2, 5))]
+    return segments, {"action_items": items, "unresolved_issues": [f"Open question on {rng.choice(topic)}"]}
+
+
+def percentile(values, pct):
+    ordered = sorted(values)
+    return ordered[min(len(ordered) - 1, int(len(ordered) * pct / 100))]
+
+
+def naive_related(vectors, meeting_id, limit):
+    """Per-pair cosine over raw term-count dicts, as a Python loop."""
+    query = vectors[meeting_id]
+    query_norm = math.sqrt(sum(v * v for v in query.values()))
+    scores = []
+    for other_id, other in vectors.items():
+        if other_id == meeting_id:
+            continue
+        dot = sum(count * other.get(term, 0) for term, count in query.items())
+        scores.append((dot / (query_norm * math.sqrt(sum(v * v for v in other.values())) or 1), other_id))
+    return sorted(scores, reverse=True)[:limit]
+
+
+async def main():
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[0])
+    parser.add_argument("--meetings", type=int, default=20000)
+    parser.add_argument("--queries", type=int, default=50)
+    parser.add_argument("--naive-queries", type=int, default=3)
+    parser.add_argument("--threshold", type=float, default=0.6)
+    args = parser.parse_args()
+
+    rng = random.Random(7)
+    similarity = MeetingSimilarity()
+    docs = [similarity.vectorize(f"m{i}", *make_meeting(rng)) for i in range(args.meetings)]
+
+    start = time.perf_counter()
+    similarity._apply_all(docs)
+    similarity.meetings.weighted()
+    similarity.items.weighted()
+    build_s = time.perf_counter() - start
+    print(f"{args.meetings} meetings, {len(similarity.items)} items: index built in {build_s:.2f}s")
+
+    ids = [f"m{rng.randrange(args.meetings)}" for _ in range(args.queries)]
+    samples = []
+    for meeting_id in ids:
+        start = time.perf_counter()
+        await similarity.related(meeting_id, limit=10)
+        samples.append((time.perf_counter() - start) * 1000)
+    print(f"related (matrix):      p50 {statistics.median(samples):8.1f} ms   p99 {percentile(samples, 99):8.1f} ms")
+
+    vectors = {doc["meeting_id"]: dict(zip(doc["terms"], doc["counts"])) for doc in docs}
+    samples = []
+    for meeting_id in ids[:args.naive_queries]:
+        start = time.perf_counter()
+        naive_related(vectors, meeting_id, 10)
+        samples.append((time.perf_counter() - start) * 1000)
+    print(f"related (pair loop):   p50 {statistics.median(samples):8.1f} ms")
+
+    start = time.perf_counter()
+    clusters = await similarity.item_clusters(args.threshold)
+    cluster_s = time.perf_counter() - start
+    repeated = [c for c in clusters if len({item["meeting_id"] for item in c}) > 1]
+    print(f"item clusters:         {cluster_s * 1000:8.1f} ms   {len(clusters)} clusters, {len(repeated)} repeated")
+    start = time.perf_counter()
+    await similarity.item_clusters(args.threshold)
+    print(f"item clusters (cached): {(time.perf_counter() - start) * 1000:7.1f} ms")
+
+    start = time.perf_counter()
+    await similarity.update_meeting("m0", *make_meeting(rng))
+    await similarity.related("m0")
+    print(f"incremental update + related query: {(time.perf_counter() - start) * 1000:.1f} ms")
+
+    # The index changed: the cached clusters are served while they are rebuilt in the background
+    start = time.perf_counter()
+    await similarity.item_clusters(args.threshold)
+    print(f"item clusters (stale):  {(time.perf_counter() - start) * 1000:7.1f} ms")
+    await asyncio.gather(*similarity._cluster_tasks.values())
+
+
+if __name__ == "__main__":
+    asyncio.run(main())
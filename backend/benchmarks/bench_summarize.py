@@ -0,0 +1,83 @@
+"""Benchmark: single-call vs map-reduce summarization wall-clock for long transcripts.
+
+Uses a local stand-in for the OpenAI client whose latency grows with prompt size, so no
+API key is needed. Reports per-stage timings from ``ChunkedSummarizer``.
+
+    python benchmarks/bench_summarize.py --minutes 120 --ms-per-1k-tokens 400
+"""
+import argparse
+import asyncio
+import json
+import random
+import sys
+import time
+from pathlib import Path
+from types import SimpleNamespace
+
+sys.path.insert(0, str(Path(__file__).resolve().parent.parent))
+
+from summarizer import ChunkedSummarizer, estimate_tokens  # noqa: E402
+
+WORDS = "we agreed to move the launch review budget hiring plan to next sprint and alice owns the follow up".split()
+
+
+class FakeCompletions:
+    """Sleeps in proportion to the prompt size and returns a canned summary."""
+
+    def __init__(self, base_ms, ms_per_1k_tokens):
+        self.base_ms = base_ms
+        self.ms_per_1k_tokens = ms_per_1k_tokens
+        self.calls = 0
+
+    def create(self, model, messages, max_tokens, temperature):
+        self.calls += 1
+        tokens = sum(estimate_tokens(m["content"]) for m in messages)
+        time.sleep((self.base_ms + self.ms_per_1k_tokens * tokens / 1000) / 1000)
+        content = json.dumps({
+            "key_points": [f"Point from call {self.calls}", "Launch moved to next sprint"],
+            "action_items": ["Alice to follow up on the hiring plan"],
+            "decisions_made": ["Launch moved to next sprint."],
+        })
+        return SimpleNamespace(choices=[SimpleNamespace(message=SimpleNamespace(content=content))])
+
+
+def make_segments(minutes, rng):
+    segments, speaker = [], 0
+    for i in range(minutes * 15):
+        if rng.random() < 0.3:
+            speaker = rng.randint(0, 5)
+        segments.append({"speaker": f"Speaker {speaker}", "text": " ".join(rng.choice(WORDS) for _ in range(25)),
+                         "timestamp": i * 4.0})
+    return segments
+
+
+async def run(label, summarizer, segments):
+    start = time.perf_counter()
+    merged, timings = await summarizer.summarize(segments)
+    wall = (time.perf_counter() - start) * 1000
+    longest = max(timings["chunk_ms"])
+    print(f"{label:<30}{timings['chunks']:>7}{wall:>11.0f}{longest:>14.0f}"
+          f"{timings['split_ms']:>10.1f}{timings['reduce_ms']:>11.2f}{len(merged['key_points']):>8}")
+
+
+async def main():
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[0])
+    parser.add_argument("--minutes", type=int, default=120)
+    parser.add_argument("--base-ms", type=float, default=300)
+    parser.add_argument("--ms-per-1k-tokens", type=float, default=400)
+    args = parser.parse_args()
+
+    segments = make_segments(args.minutes, random.Random(3))
+    total_tokens = sum(estimate_tokens(f"{s['speaker']}: {s['text']}") for s in segments)
+    print(f"{len(segments)} segments, ~{total_tokens} tokens")
+    print(f"{'strategy':<30}{'chunks':>7}{'wall ms':>11}{'longest ms':>14}{'split ms':>10}{'reduce ms':>11}{'points':>8}")
+
+    fake = SimpleNamespace(chat=SimpleNamespace(completions=FakeCompletions(args.base_ms, args.ms_per_1k_tokens)))
+    await run("single call", ChunkedSummarizer(fake, token_budget=10 ** 9), segments)
+    for budget, concurrency in ((6000, 4), (4000, 8), (2000, 16)):
+        await run(f"chunks of {budget}, x{concurrency}",
+                  ChunkedSummarizer(fake, token_budget=budget, max_concurrency=concurrency), segments)
+
+
+if __name__ == "__main__":
+    asyncio.run(main())
@@ -0,0 +1,69 @@
+"""Benchmark: time to first content of blocking vs streamed summaries.
+
+Uses ``fakes.FakeOpenAI``, which replies after ``--latency`` seconds and, when streaming, sends
+the reply in ``--chunk-chars`` pieces every ``--chunk-delay`` seconds (roughly a model's token
+rate), so no API key is needed. A blocking request has nothing to show until the last token has
+been generated, so its time to first content is the streamed run's total; the streamed run
+delivers each section as soon as ``SectionStreamParser`` sees it complete.
+
+    python benchmarks/bench_summary_streaming.py --minutes 10 60 --chunk-delay 0.02
+"""
+import argparse
+import asyncio
+import random
+import statistics
+import sys
+import time
+from pathlib import Path
+
+sys.path.insert(0, str(Path(__file__).resolve().parent.parent))
+
+from fakes import FakeOpenAI  # noqa: E402
+from summarizer import ChunkedSummarizer  # noqa: E402
+
+WORDS = "we agreed to move the launch review budget hiring plan to next sprint and alice owns the follow up".split()
+
+
+def make_segments(minutes, rng):
+    return [{"speaker": f"Speaker {i % 3}", "text": " ".join(rng.choice(WORDS) for _ in range(25))}
+            for i in range(minutes * 6)]
+
+
+async def measure(summarizer, segments):
+    """(first section ms, all sections ms) of one streamed summary."""
+    start = time.perf_counter()
+    first = []
+
+    async def on_section(section, items):
+        if not first:
+            first.append(time.perf_counter())
+
+    await summarizer.summarize(segments, on_section=on_section)
+    end = time.perf_counter()
+    return (first[0] - start) * 1000, (end - start) * 1000
+
+
+async def main():
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[0])
+    parser.add_argument("--minutes", type=int, nargs="+", default=[10, 60])
+    parser.add_argument("--latency", type=float, default=0.5, help="seconds until the first token")
+    parser.add_argument("--chunk-delay", type=float, default=0.02, help="seconds between streamed pieces")
+    parser.add_argument("--chunk-chars", type=int, default=12)
+    parser.add_argument("--token-budget", type=int, default=6000)
+    parser.add_argument("--runs", type=int, default=3)
+    args = parser.parse_args()
+
+    rng = random.Random(7)
+    print(f"{'minutes':<9}{'chunks':>7}{'blocking first ms':>19}{'streamed first ms':>19}{'total ms':>10}")
+    for minutes in args.minutes:
+        segments = make_segments(minutes, rng)
+        client = FakeOpenAI(latency=args.latency, chunk_delay=args.chunk_delay, chunk_chars=args.chunk_chars)
+        summarizer = ChunkedSummarizer(client, token_budget=args.token_budget)
+        samples = [await measure(summarizer, segments) for _ in range(args.runs)]
+        first = statistics.median(s[0] for s in samples)
+        total = statistics.median(s[1] for s in samples)
+        print(f"{minutes:<9}{client.chat.completions.calls // args.runs:>7}{total:>19.0f}{first:>19.0f}{total:>10.0f}")
+
+
+if __name__ == "__main__":
+    asyncio.run(main())
@@ -0,0 +1,117 @@
+"""Benchmark: transcript read latency for a long meeting, embedded list vs time buckets.
+
+Seeds one ``--hours``-long meeting (a segment every ``--segment-seconds``) twice: as the original
+embedded ``meetings.transcript`` list and through ``TranscriptStore``. Then times, per layout:
+
+* metadata – fetching the meeting document (what ``GET /api/meetings/<id>`` loads)
+* full     – reading the whole transcript
+* range    – a ``--range-minutes`` window from the middle of the meeting
+* stream   – iterating the whole transcript bucket by bucket (``iter_segments``)
+
+The embedded layout has no range or streaming read; it always loads the whole document.
+Defaults to the in-memory stand-in (``mongomock-motor``); pass ``--mongo-url`` for a real server.
+
+    MONGO_URL=mongodb://localhost:27017 python benchmarks/bench_transcript_reads.py --hours 3
+"""
+import argparse
+import asyncio
+import os
+import random
+import statistics
+import sys
+import time
+import uuid
+from pathlib import Path
+
+sys.path.insert(0, str(Path(__file__).resolve().parent.parent))
+
+from providers import build_mongo_client  # noqa: E402
+from transcript_store import TranscriptStore  # noqa: E402
+
+WORDS = "budget roadmap hiring launch review pilot customer design sprint retro planning sync".split()
+
+
+def make_segments(hours, segment_seconds, rng):
+    return [{
+        "id": str(uuid.uuid4()),
+        "text": " ".join(rng.choice(WORDS) for _ in range(rng.randint(8, 30))),
+        "timestamp": i * segment_seconds,
+        "speaker": f"Speaker {rng.randint(0, 5)}",
+        "confidence": 0.9,
+    } for i in range(int(hours * 3600 / segment_seconds))]
+
+
+async def timed(runs, make_call):
+    samples = []
+    for _ in range(runs):
+        start = time.perf_counter()
+        await make_call()
+        samples.append((time.perf_counter() - start) * 1000)
+    return statistics.median(samples), max(samples)
+
+
+async def main():
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[0])
+    parser.add_argument("--mongo-url", default=os.environ.get("MONGO_URL", "mongomock://"))
+    parser.add_argument("--hours", type=float, default=3.0)
+    parser.add_argument("--segment-seconds", type=float, default=4.0)
+    parser.add_argument("--range-minutes", type=float, default=5.0)
+    parser.add_argument("--bucket-segments", type=int, default=200)
+    parser.add_argument("--bucket-seconds", type=float, default=300.0)
+    parser.add_argument("--runs", type=int, default=20)
+    args = parser.parse_args()
+
+    client = build_mongo_client(args.mongo_url)
+    db = client["bench_transcript_reads"]
+    await db.meetings.drop()
+    await db.transcript_buckets.drop()
+    store = TranscriptStore(db.transcript_buckets, max_segments=args.bucket_segments,
+                            bucket_seconds=args.bucket_seconds)
+    await store.ensure_indexes()
+    await db.meetings.create_index("id", unique=True)
+
+    segments = make_segments(args.hours, args.segment_seconds, random.Random(7))
+    embedded_id, bucketed_id = str(uuid.uuid4()), str(uuid.uuid4())
+    meeting = {"title": "Quarterly planning", "host": "bench", "participants": ["alice", "bob"],
+               "segments_count": len(segments), "status": "completed"}
+    await db.meetings.insert_one(dict(meeting, id=embedded_id, transcript=segments))
+    await db.meetings.insert_one(dict(meeting, id=bucketed_id))
+    await store.replace(bucketed_id, segments)
+    buckets = await db.transcript_buckets.count_documents({"meeting_id": bucketed_id})
+
+    middle = args.hours * 3600 / 2
+    range_start, range_end = middle, middle + args.range_minutes * 60
+
+    async def embedded_full():
+        return (await db.meetings.find_one({"id": embedded_id}))["transcript"]
+
+    async def embedded_range():
+        return [s for s in await embedded_full() if range_start <= s["timestamp"] <= range_end]
+
+    async def stream():
+        async for _ in store.iter_segments(bucketed_id):
+            pass
+
+    rows = [
+        ("metadata", lambda: db.meetings.find_one({"id": embedded_id}),
+         lambda: db.meetings.find_one({"id": bucketed_id}, {"_id": 0, "transcript": 0})),
+        ("full", embedded_full, lambda: store.read_range(bucketed_id)),
+        ("range", embedded_range, lambda: store.read_range(bucketed_id, range_start, range_end)),
+        ("stream", embedded_full, stream),
+    ]
+
+    print(f"{len(segments)} segments over {args.hours:g}h; {buckets} buckets; "
+          f"range {args.range_minutes:g} min; mongo={args.mongo_url}")
+    print(f"{'read':<10}{'embedded p50/max ms':>24}{'buckets p50/max ms':>24}")
+    for label, embedded, bucketed in rows:
+        e50, emax = await timed(args.runs, embedded)
+        b50, bmax = await timed(args.runs, bucketed)
+        print(f"{label:<10}{e50:>14.2f}/{emax:<9.2f}{b50:>14.2f}/{bmax:<9.2f}")
+
+    await db.meetings.drop()
+    await db.transcript_buckets.drop()
+    client.close()
+
+
+if __name__ == "__main__":
+    asyncio.run(main())
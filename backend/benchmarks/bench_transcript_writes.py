@@ -0,0 +1,108 @@
+"""Benchmark: MongoDB write ops and bytes per meeting-hour for live transcript persistence.
+
+Compares the original single ``$set`` of the whole transcript at the end of the meeting
+with the batched writes done by ``TranscriptBuffer`` into the bucketed ``TranscriptStore``
+while the meeting runs (ops include the per-flush lookup of the last bucket). Uses a recording
+stand-in for the Motor collection, so no database is needed.
+
+    python benchmarks/bench_transcript_writes.py --segments-per-minute 15
+"""
+import argparse
+import asyncio
+import json
+import random
+import sys
+import uuid
+from pathlib import Path
+
+sys.path.insert(0, str(Path(__file__).resolve().parent.parent))
+
+from transcript_buffer import TranscriptBuffer  # noqa: E402
+from transcript_store import TranscriptStore  # noqa: E402
+
+try:
+    import bson
+
+    def encoded_size(doc):
+        return len(bson.encode(doc))
+except ImportError:  # pymongo not installed; JSON size is a close enough proxy
+    def encoded_size(doc):
+        return len(json.dumps(doc, default=str).encode())
+
+WORDS = ("we should ship the release next week after the review of the budget numbers and "
+         "the customer feedback from the pilot so please follow up with finance").split()
+
+
+class RecordingCollection:
+    """Counts operations and their encoded size; remembers bucket headers for ``find_one``."""
+
+    def __init__(self):
+        self.ops = 0
+        self.bytes = 0
+        self.largest = 0
+        self.buckets = []
+
+    def _record(self, doc):
+        size = encoded_size(doc)
+        self.ops += 1
+        self.bytes += size
+        self.largest = max(self.largest, size)
+
+    async def find_one(self, query, projection=None, sort=None):
+        self._record({"q": query})
+        return dict(self.buckets[-1]) if self.buckets else None
+
+    async def update_one(self, query, update):
+        self._record({"q": query, "u": update})
+        if self.buckets and "$inc" in update:
+            self.buckets[-1]["count"] += update["$inc"]["count"]
+
+    async def insert_many(self, docs):
+        self._record({"docs": docs})
+        self.buckets.extend({"seq": doc["seq"], "start": doc["start"], "count": doc["count"]} for doc in docs)
+
+
+def make_segments(count, rng):
+    segments = []
+    for i in range(count):
+        text = " ".join(rng.choice(WORDS) for _ in range(rng.randint(8, 30)))
+        segments.append({
+            "id": str(uuid.uuid4()), "text": text, "timestamp": i * 4.0,
+            "speaker": "Unknown", "confidence": round(rng.random(), 3),
+        })
+    return segments
+
+
+async def run_buffered(segments, max_segments, max_delay):
+    collection = RecordingCollection()
+    buffer = TranscriptBuffer(TranscriptStore(collection), "bench-meeting", max_segments=max_segments, max_delay=max_delay)
+    for segment in segments:
+        await buffer.add(segment)
+    await buffer.close()
+    return collection
+
+
+async def main():
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[0])
+    parser.add_argument("--segments-per-minute", type=int, default=15)
+    parser.add_argument("--hours", type=float, default=1.0)
+    args = parser.parse_args()
+
+    rng = random.Random(42)
+    segments = make_segments(int(args.segments_per_minute * 60 * args.hours), rng)
+
+    baseline = RecordingCollection()
+    await baseline.update_one({"id": "bench-meeting"}, {"$set": {"transcript": segments, "status": "completed"}})
+
+    print(f"{len(segments)} final segments over {args.hours:g} meeting-hour(s)")
+    print(f"{'strategy':<28}{'ops/hour':>10}{'bytes/hour':>14}{'largest write':>15}")
+    print(f"{'single $set (baseline)':<28}{baseline.ops / args.hours:>10.0f}"
+          f"{baseline.bytes / args.hours:>14.0f}{baseline.bytes:>15}")
+    for max_segments in (1, 10, 25, 100):
+        collection = await run_buffered(segments, max_segments, max_delay=3600)
+        print(f"{f'bucketed batch={max_segments}':<28}{collection.ops / args.hours:>10.0f}"
+              f"{collection.bytes / args.hours:>14.0f}{collection.largest:>15}")
+
+
+if __name__ == "__main__":
+    asyncio.run(main())
@@ -0,0 +1,118 @@
+"""Load test: concurrent audio uploads through ``/transcribe-file`` and the transcription job pool.
+
+Drives the real Flask route with a fake Deepgram client (fixed latency, canned utterances) and
+reports upload acceptance latency, end-to-end throughput and peak RSS. Needs a reachable MongoDB;
+uses the ``bench_upload_jobs`` database.
+
+    MONGO_URL=mongodb://localhost:27017 python benchmarks/bench_upload_jobs.py --uploads 40 --size-mb 50
+"""
+import argparse
+import os
+import resource
+import statistics
+import sys
+import tempfile
+import threading
+import time
+from pathlib import Path
+from types import SimpleNamespace
+
+os.environ.setdefault("MONGO_URL", "mongodb://localhost:27017")
+os.environ.setdefault("DB_NAME", "bench_upload_jobs")
+os.environ.setdefault("DEEPGRAM_API_KEY", "bench")
+sys.path.insert(0, str(Path(__file__).resolve().parent.parent))
+
+import server  # noqa: E402
+
+if server.SERVER_MODE == "asgi":
+    server.start_event_loop_thread()
+
+
+class FakePrerecorded:
+    """Reads the uploaded file in chunks (like an HTTP upload would) and returns canned utterances."""
+
+    def __init__(self, latency):
+        self.latency = latency
+
+    def transcribe_file(self, source, options):
+        while source["buffer"].read(1024 * 1024):
+            pass
+        time.sleep(self.latency)
+        utterances = [SimpleNamespace(transcript=f"utterance {i}", start=i * 3.0, speaker=i % 3, confidence=0.9)
+                      for i in range(200)]
+        return SimpleNamespace(results=SimpleNamespace(utterances=utterances))
+
+
+class FakeDeepgramClient:
+    def __init__(self, latency):
+        prerecorded = FakePrerecorded(latency)
+        self.listen = SimpleNamespace(prerecorded=SimpleNamespace(v=lambda version: prerecorded))
+
+
+def peak_rss_mb():
+    return resource.getrusage(resource.RUSAGE_SELF).ru_maxrss / 1024
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[0])
+    parser.add_argument("--uploads", type=int, default=20)
+    parser.add_argument("--concurrency", type=int, default=10)
+    parser.add_argument("--size-mb", type=int, default=20)
+    parser.add_argument("--deepgram-latency", type=float, default=2.0)
+    args = parser.parse_args()
+
+    server.deepgram_client = FakeDeepgramClient(args.deepgram_latency)
+    server.transcription_jobs.max_pending = max(server.transcription_jobs.max_pending, args.uploads)
+
+    with tempfile.NamedTemporaryFile(suffix=".wav", delete=False) as audio:
+        chunk = os.urandom(1024 * 1024)
+        for _ in range(args.size_mb):
+            audio.write(chunk)
+        audio_path = audio.name
+
+    client = server.app.test_client()
+    accept_ms, job_ids, lock = [], [], threading.Lock()
+    baseline_rss = peak_rss_mb()
+
+    def upload(n):
+        meeting = client.post("/api/meetings", json={"title": f"bench upload {n}"}).get_json()
+        start = time.perf_counter()
+        with open(audio_path, "rb") as f:
+            response = client.post(f"/api/meetings/{meeting['id']}/transcribe-file",
+                                   data={"audio_file": (f, "meeting.wav")}, content_type="multipart/form-data")
+        elapsed = (time.perf_counter() - start) * 1000
+        with lock:
+            accept_ms.append(elapsed)
+            if response.status_code == 202:
+                job_ids.append(response.get_json()["job_id"])
+
+    start = time.perf_counter()
+    pending = list(range(args.uploads))
+    while pending:
+        batch, pending = pending[:args.concurrency], pending[args.concurrency:]
+        threads = [threading.Thread(target=upload, args=(n,)) for n in batch]
+        for t in threads:
+            t.start()
+        for t in threads:
+            t.join()
+
+    while True:
+        statuses = [client.get(f"/api/jobs/{job_id}").get_json()["status"] for job_id in job_ids]
+        if all(status in ("completed", "failed") for status in statuses):
+            break
+        time.sleep(0.5)
+    elapsed = time.perf_counter() - start
+    os.unlink(audio_path)
+
+    completed = statuses.count("completed")
+    print(f"uploads accepted:      {len(job_ids)}/{args.uploads} ({completed} completed)")
+    print(f"accept latency p50/p99: {statistics.median(accept_ms):.0f} / "
+          f"{statistics.quantiles(accept_ms, n=100)[98]:.0f} ms")
+    print(f"throughput:            {completed / elapsed:.2f} files/s, {completed * args.size_mb / elapsed:.1f} MB/s")
+    print(f"peak RSS:              {peak_rss_mb():.0f} MB (baseline {baseline_rss:.0f} MB, "
+          f"upload size {args.size_mb} MB x {args.concurrency} concurrent)")
+    server.transcription_jobs.shutdown()
+
+
+if __name__ == "__main__":
+    main()
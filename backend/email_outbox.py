@@ -0,0 +1,177 @@
+import asyncio
+import logging
+import uuid
+from datetime import datetime, timedelta
+from typing import Any, Callable, Dict, List, Optional
+
+import metrics
+
+logger = logging.getLogger(__name__)
+
+# Upper bound of personalizations SendGrid accepts in one v3 mail/send request
+SENDGRID_MAX_PERSONALIZATIONS = 1000
+
+
+class EmailOutbox:
+    """Persistent outbox for meeting emails with per-recipient status and retries.
+
+    Messages are rendered once and stored in ``collection`` (``email_logs``). Each ``deliver`` call
+    runs one round: it leases the entry for ``owner`` (so only one worker sends it) and sends the
+    still-pending recipients in batches of ``batch_size`` (one provider request per batch, at most
+    ``max_concurrency`` in flight). If some fail, the entry goes back to ``pending`` with
+    ``next_attempt_at`` set by exponential backoff (``base_delay``, doubling every round) and the
+    lease released; ``due_ids`` finds it again once it is due. Retries go one recipient per request,
+    for up to ``max_attempts`` rounds.
+
+    ``send_batch(sender, recipients, subject, body)`` is a blocking callable that raises on failure;
+    it is run in a thread.
+    """
+
+    def __init__(self, collection, send_batch: Callable[[Dict[str, Any], List[str], str, str], Any],
+                 owner: str = "local", batch_size: int = SENDGRID_MAX_PERSONALIZATIONS,
+                 max_concurrency: int = 4, max_attempts: int = 5, base_delay: float = 2.0,
+                 lease_ttl: float = 300.0):
+        self.collection = collection
+        self.send_batch = send_batch
+        self.owner = owner
+        self.batch_size = min(batch_size, SENDGRID_MAX_PERSONALIZATIONS)
+        self.max_concurrency = max_concurrency
+        self.max_attempts = max_attempts
+        self.base_delay = base_delay
+        self.lease_ttl = lease_ttl
+
+    async def ensure_indexes(self):
+        # Sparse: log entries written before the outbox existed have no id
+        await self.collection.create_index("id", unique=True, sparse=True)
+        await self.collection.create_index([("status", 1), ("next_attempt_at", 1)])
+
+    async def enqueue(self, meeting_id: str, sender: Dict[str, Any], subject: str, body: str,
+                      recipients: List[str]) -> str:
+        """Store a rendered message for delivery; returns the outbox id."""
+        unique_recipients = list(dict.fromkeys(email.strip() for email in recipients if email.strip()))
+        outbox_id = str(uuid.uuid4())
+        await self.collection.insert_one({
+            "id": outbox_id,
+            "meeting_id": meeting_id,
+            "sender": sender,
+            "subject": subject,
+            "body": body,
+            "status": "pending",
+            "attempts": 0,
+            "next_attempt_at": None,
+            "lease_owner": None,
+            "lease_until": None,
+            "recipients": [
+                {"email": email, "status": "pending", "attempts": 0, "last_error": None, "sent_at": None}
+                for email in unique_recipients
+            ],
+            "created_at": datetime.utcnow(),
+            "sent_at": None,
+        })
+        return outbox_id
+
+    @staticmethod
+    def _due_filter(now: datetime) -> Dict[str, Any]:
+        # Unfinished, past its retry time and not leased by a live worker (``None`` also matches a missing field)
+        return {
+            "status": {"$in": ["pending", "sending"]},
+            "$and": [
+                {"$or": [{"next_attempt_at": None}, {"next_attempt_at": {"$lte": now}}]},
+                {"$or": [{"lease_until": None}, {"lease_until": {"$lte": now}}]},
+            ],
+        }
+
+    async def due_ids(self, limit: int = 0) -> List[str]:
+        """Outbox entries ready for a delivery round: new, due for a retry, or abandoned by a dead worker."""
+        cursor = self.collection.find(self._due_filter(datetime.utcnow()), {"_id": 0, "id": 1})
+        return [doc["id"] for doc in await cursor.to_list(limit or None)]
+
+    async def _claim(self, outbox_id: str) -> Optional[Dict[str, Any]]:
+        now = datetime.utcnow()
+        lease = {"status": "sending", "lease_owner": self.owner, "lease_until": now + timedelta(seconds=self.lease_ttl)}
+        # Pre-update document plus the lease: mongomock finds no AFTER document once the update unmatches the filter
+        doc = await self.collection.find_one_and_update(
+            {"id": outbox_id, **self._due_filter(now)}, {"$set": lease}, projection={"_id": 0}
+        )
+        if doc:
+            doc.update(lease)
+        return doc
+
+    async def _renew_lease(self, outbox_id: str):
+        await self.collection.update_one(
+            {"id": outbox_id, "lease_owner": self.owner},
+            {"$set": {"lease_until": datetime.utcnow() + timedelta(seconds=self.lease_ttl)}}
+        )
+
+    async def _send(self, doc: Dict[str, Any], batch: List[Dict[str, Any]], semaphore: asyncio.Semaphore):
+        emails = [recipient["email"] for recipient in batch]
+        async with semaphore:
+            try:
+                # Provider SDK calls are blocking, run in a thread
+                await metrics.to_thread(
+                    "sendgrid", self.send_batch, doc["sender"], emails, doc["subject"], doc["body"]
+                )
+                error = None
+            except Exception as e:
+                error = str(e) or type(e).__name__
+        now = datetime.utcnow()
+        for recipient in batch:
+            recipient["attempts"] += 1
+            if error is None:
+                recipient.update(status="sent", sent_at=now, last_error=None)
+            else:
+                recipient["last_error"] = error
+        if error is not None:
+            logger.warning(f"Email batch of {len(batch)} for outbox {doc['id']} failed: {error}")
+        # Large rounds can outlast the lease; each finished batch shows this worker is still at it
+        await self._renew_lease(doc["id"])
+
+    async def deliver(self, outbox_id: str) -> Optional[Dict[str, Any]]:
+        """Run one delivery round of an outbox entry. Returns the updated document, or ``None`` if it
+        is missing, not due yet or leased by another worker."""
+        doc = await self._claim(outbox_id)
+        if not doc:
+            logger.debug(f"Outbox {outbox_id} not claimable (finished, not due or leased elsewhere)")
+            return None
+
+        pending = [r for r in doc["recipients"] if r["status"] != "sent"]
+        if pending:
+            # First round sends whole batches; retries go per recipient so one bad address can't sink the rest
+            size = self.batch_size if doc["attempts"] == 0 else 1
+            batches = [pending[i:i + size] for i in range(0, len(pending), size)]
+            semaphore = asyncio.Semaphore(self.max_concurrency)
+            await asyncio.gather(*(self._send(doc, batch, semaphore) for batch in batches))
+            doc["attempts"] += 1
+
+        failed = [r for r in doc["recipients"] if r["status"] != "sent"]
+        now = datetime.utcnow()
+        update = {"recipients": doc["recipients"], "attempts": doc["attempts"], "lease_owner": None, "lease_until": None}
+        retry = bool(failed) and doc["attempts"] < self.max_attempts
+        if retry:
+            update.update(
+                status="pending", next_attempt_at=now + timedelta(seconds=self.base_delay * 2 ** (doc["attempts"] - 1))
+            )
+        else:
+            for recipient in failed:
+                recipient["status"] = "failed"
+            if not failed:
+                status = "sent"
+            elif len(failed) < len(doc["recipients"]):
+                status = "partial"
+            else:
+                status = "failed"
+            update.update(status=status, sent_at=now, next_attempt_at=None)
+        doc.update(update)
+        await self.collection.update_one({"id": outbox_id, "lease_owner": self.owner}, {"$set": update})
+
+        if retry:
+            logger.info(
+                f"Outbox {outbox_id}: {len(failed)} recipients failed in round {doc['attempts']}, "
+                f"retrying at {doc['next_attempt_at'].isoformat()}"
+            )
+        else:
+            logger.info(
+                f"Outbox {outbox_id} for meeting {doc['meeting_id']}: {doc['status']} "
+                f"({len(doc['recipients']) - len(failed)}/{len(doc['recipients'])} delivered, {doc['attempts']} rounds)"
+            )
+        return doc
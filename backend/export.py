@@ -0,0 +1,199 @@
+import csv
+import io
+import json
+import logging
+import re
+import zipfile
+from datetime import datetime
+from typing import Any, AsyncIterator, Dict, List, Optional
+
+from pymongo import DESCENDING
+
+logger = logging.getLogger(__name__)
+
+# format -> (content type, file extension)
+EXPORT_FORMATS = {
+    "ndjson": ("application/x-ndjson", "ndjson"),
+    "csv": ("text/csv; charset=utf-8", "csv"),
+    "markdown": ("application/zip", "zip"),
+}
+
+CSV_COLUMNS = ["meeting_id", "meeting_title", "meeting_timestamp", "segment_id", "timestamp", "speaker",
+               "confidence", "text"]
+
+SECTION_TITLES = {
+    "key_points": "Key Points", "decisions_made": "Decisions Made", "action_items": "Action Items",
+    "assignees": "Assignees", "deadlines": "Deadlines", "attendee_recommendations": "Attendee Recommendations",
+    "ai_recommendations": "AI Recommendations", "unresolved_issues": "Unresolved Issues",
+    "followup_reminders": "Follow-up Reminders", "references": "References",
+}
+
+
+def export_query(start: Optional[datetime] = None, end: Optional[datetime] = None,
+                 participant: Optional[str] = None, search: Optional[str] = None) -> Dict[str, Any]:
+    """Meeting filter for an export: ``start <= timestamp < end``, participant and title/host search."""
+    query: Dict[str, Any] = {}
+    if start or end:
+        query["timestamp"] = {}
+        if start:
+            query["timestamp"]["$gte"] = start
+        if end:
+            query["timestamp"]["$lt"] = end
+    if participant:
+        query["participants"] = participant
+    if search:
+        query["$text"] = {"$search": search}
+    return query
+
+
+def _json_default(value):
+    if isinstance(value, datetime):
+        return value.isoformat()
+    return str(value)
+
+
+def render_markdown(meeting: Dict[str, Any], segments: List[Dict[str, Any]]) -> str:
+    timestamp = meeting.get("timestamp")
+    lines = [f"# {meeting.get('title', 'Untitled meeting')}", ""]
+    if isinstance(timestamp, datetime):
+        lines.append(f"- **Date:** {timestamp.isoformat()}")
+    lines.append(f"- **Host:** {meeting.get('host', '')}")
+    lines.append(f"- **Participants:** {', '.join(meeting.get('participants') or [])}")
+    lines.append(f"- **Status:** {meeting.get('status', '')}")
+    summary = meeting.get("summary") or {}
+    if summary:
+        lines += ["", "## Summary"]
+        for section, title in SECTION_TITLES.items():
+            items = summary.get(section) or []
+            if items:
+                lines += ["", f"### {title}", *(f"- {item}" for item in items)]
+    lines += ["", "## Transcript", ""]
+    lines += [f"[{seg.get('timestamp', 0.0):.1f}s] **{seg.get('speaker', 'Unknown')}:** {seg.get('text', '')}  "
+              for seg in segments]
+    return "\n".join(lines) + "\n"
+
+
+def markdown_filename(meeting: Dict[str, Any]) -> str:
+    timestamp = meeting.get("timestamp")
+    date = timestamp.strftime("%Y-%m-%d") if isinstance(timestamp, datetime) else "undated"
+    slug = re.sub(r"[^\w]+", "-", meeting.get("title", "") or "meeting").strip("-").lower()[:60] or "meeting"
+    return f"{date}-{slug}-{meeting['id'][:8]}.md"
+
+
+class _ChunkSink(io.RawIOBase):
+    """Write-only, unseekable stream collecting bytes until they are taken (lets ``zipfile`` stream)."""
+
+    def __init__(self):
+        self._parts: List[bytes] = []
+        self.size = 0
+
+    def writable(self) -> bool:
+        return True
+
+    def write(self, data) -> int:
+        self._parts.append(bytes(data))
+        self.size += len(data)
+        return len(data)
+
+    def take(self) -> bytes:
+        data = b"".join(self._parts)
+        self._parts = []
+        self.size = 0
+        return data
+
+
+class MeetingExporter:
+    """Streams meetings matching a filter, with their transcripts, as NDJSON, CSV or a Markdown zip.
+
+    Meetings are read from a cursor in ``batch_size`` batches (newest first) and each transcript
+    is streamed bucket by bucket from ``TranscriptStore``, so at most one batch of meetings and one
+    meeting's output are held at a time. Output is yielded in chunks of about ``chunk_bytes``.
+    """
+
+    def __init__(self, meetings, transcript_store, batch_size: int = 100, chunk_bytes: int = 64 * 1024):
+        self.meetings = meetings
+        self.transcript_store = transcript_store
+        self.batch_size = batch_size
+        self.chunk_bytes = chunk_bytes
+        # Totals so far; the export route logs them once the stream ends
+        self.meetings_exported = 0
+        self.bytes_exported = 0
+
+    def _cursor(self, query: Dict[str, Any]):
+        return (self.meetings.find(query, {"_id": 0, "transcript": 0})
+                .sort([("timestamp", DESCENDING), ("id", DESCENDING)])
+                .batch_size(self.batch_size))
+
+    async def _segments(self, meeting_id: str) -> List[Dict[str, Any]]:
+        return [segment async for segment in self.transcript_store.iter_segments(meeting_id)]
+
+    def _take(self, buffer: io.StringIO) -> bytes:
+        data = buffer.getvalue().encode()
+        buffer.seek(0)
+        buffer.truncate()
+        self.bytes_exported += len(data)
+        return data
+
+    async def ndjson(self, query: Dict[str, Any]) -> AsyncIterator[bytes]:
+        """One JSON object per line: the meeting with its summary and ``transcript`` segments."""
+        buffer = io.StringIO()
+        async for meeting in self._cursor(query):
+            # A new dict, not the cursor's document: the cursor may still reference its batch
+            record = {**meeting, "transcript": await self._segments(meeting["id"])}
+            buffer.write(json.dumps(record, default=_json_default))
+            buffer.write("\n")
+            self.meetings_exported += 1
+            if buffer.tell() >= self.chunk_bytes:
+                yield self._take(buffer)
+        if buffer.tell():
+            yield self._take(buffer)
+
+    async def csv(self, query: Dict[str, Any]) -> AsyncIterator[bytes]:
+        """One row per transcript segment, with the meeting's id, title and timestamp."""
+        buffer = io.StringIO()
+        writer = csv.writer(buffer)
+        writer.writerow(CSV_COLUMNS)
+        async for meeting in self._cursor(query):
+            timestamp = meeting.get("timestamp")
+            meeting_columns = [meeting["id"], meeting.get("title", ""),
+                               timestamp.isoformat() if isinstance(timestamp, datetime) else timestamp]
+            async for segment in self.transcript_store.iter_segments(meeting["id"]):
+                writer.writerow(meeting_columns + [
+                    segment.get("id", ""), segment.get("timestamp", 0.0), segment.get("speaker", ""),
+                    segment.get("confidence", ""), segment.get("text", "")
+                ])
+                if buffer.tell() >= self.chunk_bytes:
+                    yield self._take(buffer)
+            self.meetings_exported += 1
+        if buffer.tell():
+            yield self._take(buffer)
+
+    async def markdown_zip(self, query: Dict[str, Any]) -> AsyncIterator[bytes]:
+        """A zip with one Markdown file per meeting, written as a stream (no seeking, no temp file)."""
+        sink = _ChunkSink()
+        names = set()
+        with zipfile.ZipFile(sink, "w", compression=zipfile.ZIP_DEFLATED) as archive:
+            async for meeting in self._cursor(query):
+                name = markdown_filename(meeting)
+                if name in names:
+                    name = f"{name[:-3]}-{meeting['id']}.md"
+                names.add(name)
+                archive.writestr(name, render_markdown(meeting, await self._segments(meeting["id"])))
+                self.meetings_exported += 1
+                if sink.size >= self.chunk_bytes:
+                    data = sink.take()
+                    self.bytes_exported += len(data)
+                    yield data
+        # Closing the archive wrote the central directory
+        data = sink.take()
+        self.bytes_exported += len(data)
+        yield data
+
+    def stream(self, export_format: str, query: Dict[str, Any]) -> AsyncIterator[bytes]:
+        if export_format == "ndjson":
+            return self.ndjson(query)
+        if export_format == "csv":
+            return self.csv(query)
+        if export_format == "markdown":
+            return self.markdown_zip(query)
+        raise ValueError(f"Unknown export format: {export_format}")
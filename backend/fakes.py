@@ -0,0 +1,336 @@
+"""Deterministic local stand-ins for the external services used by ``server.py``.
+
+They mirror the small part of each SDK the server calls, with configurable latency, so the
+real routes and Socket.IO handlers can be exercised and benchmarked offline
+(``PROVIDERS=fake``, see ``providers.py``). ``TextSearchClient`` fills in ``$text`` queries for
+the in-memory MongoDB.
+"""
+import asyncio
+import inspect
+import json
+import random
+import re
+import threading
+import time
+from types import SimpleNamespace
+from typing import Any, Callable, Dict, List, Optional, Tuple
+
+from pymongo import TEXT
+from pymongo.errors import OperationFailure
+
+WORDS = ("the team agreed to ship the beta next friday after reviewing budget numbers with finance and "
+         "alice will follow up with the pilot customers about onboarding while bob drafts the launch plan").split()
+
+
+def _sentence(rng: random.Random, words: int) -> str:
+    text = " ".join(rng.choice(WORDS) for _ in range(words))
+    return text[0].upper() + text[1:] + "."
+
+
+# --- Deepgram ---
+
+class FakePrerecorded:
+    """``listen.prerecorded.v("1")``: reads the whole source, waits, returns canned utterances."""
+
+    def __init__(self, latency: float, utterances: int, seed: int):
+        self.latency = latency
+        self.utterances = utterances
+        self.seed = seed
+
+    def transcribe_file(self, source: Dict[str, Any], options=None):
+        buffer = source["buffer"]
+        size = 0
+        if hasattr(buffer, "read"):
+            while True:
+                chunk = buffer.read(1024 * 1024)
+                if not chunk:
+                    break
+                size += len(chunk)
+        else:
+            size = len(buffer)
+        time.sleep(self.latency)
+        rng = random.Random(self.seed + size)
+        utterances = [SimpleNamespace(
+            transcript=_sentence(rng, rng.randint(6, 20)), start=i * 4.0, end=i * 4.0 + 3.5,
+            speaker=i % 3, confidence=round(0.8 + rng.random() * 0.2, 3)
+        ) for i in range(self.utterances)]
+        return SimpleNamespace(results=SimpleNamespace(utterances=utterances))
+
+
+class FakeLiveConnection:
+    """``listen.asynclive.v("1")``: turns received linear16 audio into transcript events.
+
+    An interim result is emitted every ``interim_seconds`` of audio and a final one every
+    ``utterance_seconds``, each ``latency`` seconds after the audio that completed it arrived.
+    Handlers are called like the SDK does: ``handler(connection, result=...)`` / ``error=...``.
+    """
+
+    def __init__(self, latency: float, utterance_seconds: float, interim_seconds: float, seed: int,
+                 bytes_per_second: int = 32000):
+        self.latency = latency
+        self.utterance_seconds = utterance_seconds
+        self.interim_seconds = interim_seconds
+        self.bytes_per_second = bytes_per_second
+        self.rng = random.Random(seed)
+        self.handlers: Dict[Any, List[Callable]] = {}
+        self.received = 0
+        self.started = False
+        self._utterance_start = 0.0
+        self._words: List[str] = []
+        self._next_interim = interim_seconds
+        self._tasks = set()
+
+    def on(self, event, handler):
+        self.handlers.setdefault(event, []).append(handler)
+
+    async def start(self, options=None):
+        self.started = True
+        return True
+
+    async def _emit(self, event, **kwargs):
+        for handler in self.handlers.get(event, []):
+            outcome = handler(self, **kwargs)
+            if inspect.isawaitable(outcome):
+                await outcome
+
+    async def _deliver(self, result):
+        await asyncio.sleep(self.latency)
+        await self._emit("Results", result=result)
+
+    def _schedule(self, result):
+        task = asyncio.get_running_loop().create_task(self._deliver(result))
+        self._tasks.add(task)
+        task.add_done_callback(self._tasks.discard)
+
+    def _result(self, is_final: bool, end: float):
+        return SimpleNamespace(
+            channel=SimpleNamespace(alternatives=[SimpleNamespace(
+                transcript=" ".join(self._words), confidence=0.95
+            )]),
+            is_final=is_final, start=self._utterance_start, duration=end - self._utterance_start
+        )
+
+    async def send(self, data: bytes):
+        if not self.started:
+            raise RuntimeError("Live connection not started")
+        self.received += len(data)
+        audio_seconds = self.received / self.bytes_per_second
+        while audio_seconds >= self._next_interim:
+            self._words += [self.rng.choice(WORDS) for _ in range(3)]
+            boundary = self._next_interim
+            self._next_interim += self.interim_seconds
+            if boundary - self._utterance_start >= self.utterance_seconds - 1e-9:
+                self._schedule(self._result(True, boundary))
+                self._utterance_start, self._words = boundary, []
+            else:
+                self._schedule(self._result(False, boundary))
+        return True
+
+    async def finish(self):
+        if self._tasks:
+            await asyncio.gather(*self._tasks, return_exceptions=True)
+        self.started = False
+        return True
+
+
+class FakeDeepgramClient:
+    def __init__(self, latency: float = 0.5, live_latency: float = 0.3, utterances: int = 50,
+                 utterance_seconds: float = 2.0, interim_seconds: float = 0.5, seed: int = 0):
+        prerecorded = FakePrerecorded(latency, utterances, seed)
+        self.live_connections: List[FakeLiveConnection] = []
+
+        def live(version):
+            connection = FakeLiveConnection(
+                live_latency, utterance_seconds, interim_seconds, seed + len(self.live_connections)
+            )
+            self.live_connections.append(connection)
+            return connection
+
+        self.listen = SimpleNamespace(
+            prerecorded=SimpleNamespace(v=lambda version: prerecorded),
+            asynclive=SimpleNamespace(v=live),
+        )
+
+
+# --- OpenAI ---
+
+def canned_summary(prompt: str) -> Dict[str, List[str]]:
+    """Deterministic summary derived from the transcript lines in the prompt."""
+    lines = [line.strip() for line in prompt.splitlines() if ": " in line and not line.strip().startswith('"')]
+    rng = random.Random(len(prompt))
+    picks = lambda n: [lines[rng.randrange(len(lines))][:120] for _ in range(min(n, len(lines)))]  # noqa: E731
+    return {
+        "key_points": picks(4), "decisions_made": picks(2), "action_items": picks(3),
+        "assignees": ["Alice", "Bob"], "deadlines": ["Next Friday"], "attendee_recommendations": [],
+        "ai_recommendations": ["Share the launch plan before the next sync."], "unresolved_issues": picks(1),
+        "followup_reminders": picks(1), "references": [],
+    }
+
+
+class FakeCompletions:
+    """``chat.completions``: canned JSON replies, optionally streamed in small deltas."""
+
+    def __init__(self, latency: float, chunk_delay: float, chunk_chars: int, content: Optional[str]):
+        self.latency = latency
+        self.chunk_delay = chunk_delay
+        self.chunk_chars = chunk_chars
+        self.content = content
+        self.calls = 0
+        self._lock = threading.Lock()
+
+    def _reply(self, messages) -> str:
+        if self.content is not None:
+            return self.content
+        return json.dumps(canned_summary(messages[-1]["content"]))
+
+    def create(self, model: str, messages: List[Dict[str, str]], stream: bool = False, **kwargs):
+        with self._lock:
+            self.calls += 1
+        content = self._reply(messages)
+        prompt_tokens = sum(len(m["content"]) for m in messages) // 4
+        usage = SimpleNamespace(prompt_tokens=prompt_tokens, completion_tokens=len(content) // 4,
+                                total_tokens=prompt_tokens + len(content) // 4)
+        if stream:
+            return self._stream(model, content, usage)
+        time.sleep(self.latency)
+        return SimpleNamespace(
+            model=model, usage=usage,
+            choices=[SimpleNamespace(message=SimpleNamespace(role="assistant", content=content),
+                                     finish_reason="stop")]
+        )
+
+    def _stream(self, model: str, content: str, usage):
+        time.sleep(self.latency)
+        for i in range(0, len(content), self.chunk_chars):
+            if i:
+                time.sleep(self.chunk_delay)
+            yield SimpleNamespace(model=model, usage=None, choices=[SimpleNamespace(
+                delta=SimpleNamespace(content=content[i:i + self.chunk_chars]), finish_reason=None
+            )])
+        yield SimpleNamespace(model=model, usage=usage, choices=[SimpleNamespace(
+            delta=SimpleNamespace(content=None), finish_reason="stop"
+        )])
+
+
+class FakeOpenAI:
+    def __init__(self, latency: float = 1.0, chunk_delay: float = 0.02, chunk_chars: int = 12,
+                 content: Optional[str] = None):
+        self.chat = SimpleNamespace(completions=FakeCompletions(latency, chunk_delay, chunk_chars, content))
+
+
+# --- SendGrid ---
+
+class FakeSendGrid:
+    """``SendGridAPIClient.send``: waits ``latency`` and fails with probability ``failure_rate``."""
+
+    def __init__(self, latency: float = 0.2, failure_rate: float = 0.0, seed: int = 0):
+        self.latency = latency
+        self.failure_rate = failure_rate
+        self.rng = random.Random(seed)
+        self.sent: List[Any] = []
+        self._lock = threading.Lock()
+
+    def send(self, message):
+        time.sleep(self.latency)
+        with self._lock:
+            if self.rng.random() < self.failure_rate:
+                raise RuntimeError("HTTP Error 503: Service Unavailable")
+            self.sent.append(message)
+        return SimpleNamespace(status_code=202, body=b"", headers={})
+
+
+# --- MongoDB (mongomock) ---
+
+class TextSearchClient:
+    """In-memory Motor client (``mongomock-motor``) with a stand-in for ``$text`` queries.
+
+    mongomock has no text indexes. The fields of every ``TEXT`` index created through this client
+    are recorded, and a ``$text`` filter becomes a case-insensitive regex scan for any of the
+    search words on those fields. ``{"$meta": "textScore"}`` is a constant ``1.0``, so hits come
+    back unranked (ties are broken by the usual sort keys).
+    """
+
+    def __init__(self, client):
+        self._client = client
+        self._text_fields: Dict[Tuple[str, str], List[str]] = {}
+
+    def __getitem__(self, name: str) -> "_TextSearchDatabase":
+        return _TextSearchDatabase(self._client[name], self._text_fields)
+
+    def get_database(self, name: str, *args, **kwargs) -> "_TextSearchDatabase":
+        return _TextSearchDatabase(self._client.get_database(name, *args, **kwargs), self._text_fields)
+
+    def __getattr__(self, name: str):
+        return getattr(self._client, name)
+
+
+class _TextSearchDatabase:
+    def __init__(self, database, text_fields: Dict[Tuple[str, str], List[str]]):
+        self._database = database
+        self._text_fields = text_fields
+
+    def __getitem__(self, name: str) -> "_TextSearchCollection":
+        return _TextSearchCollection(self._database[name], self._text_fields)
+
+    def get_collection(self, name: str, *args, **kwargs) -> "_TextSearchCollection":
+        return _TextSearchCollection(self._database.get_collection(name, *args, **kwargs), self._text_fields)
+
+    def __getattr__(self, name: str):
+        value = getattr(self._database, name)
+        # Attribute access doubles as collection lookup (``db.meetings``)
+        return value if inspect.ismethod(value) or name.startswith("_") else self[name]
+
+
+class _TextSearchCollection:
+    def __init__(self, collection, text_fields: Dict[Tuple[str, str], List[str]]):
+        self._collection = collection
+        self._text_fields = text_fields
+        self._key = (collection.database.name, collection.name)
+
+    def __getattr__(self, name: str):
+        return getattr(self._collection, name)
+
+    async def create_index(self, keys, *args, **kwargs):
+        fields = [field for field, kind in (keys if isinstance(keys, list) else []) if kind == TEXT]
+        if fields:
+            self._text_fields[self._key] = fields
+        return await self._collection.create_index(keys, *args, **kwargs)
+
+    def _rewrite(self, query):
+        if not isinstance(query, dict) or "$text" not in query:
+            return query
+        fields = self._text_fields.get(self._key)
+        if not fields:
+            raise OperationFailure("text index required for $text query")
+        query = dict(query)
+        # Words as ``segment_search.query_terms`` reads them: quotes and negated ``-word`` terms are ignored
+        words = re.findall(r"(?<![\w-])\w+", query.pop("$text")["$search"].replace('"', " "))
+        clauses = [{field: {"$regex": re.escape(word), "$options": "i"}} for field in fields for word in words]
+        query["$and"] = list(query.get("$and", [])) + [{"$or": clauses or [{"_id": {"$exists": False}}]}]
+        return query
+
+    @classmethod
+    def _replace_text_score(cls, value):
+        if value == {"$meta": "textScore"}:
+            return {"$literal": 1.0}
+        if isinstance(value, dict):
+            return {key: cls._replace_text_score(item) for key, item in value.items()}
+        if isinstance(value, list):
+            return [cls._replace_text_score(item) for item in value]
+        return value
+
+    def find(self, filter=None, *args, **kwargs):
+        return self._collection.find(self._rewrite(filter), *args, **kwargs)
+
+    async def find_one(self, filter=None, *args, **kwargs):
+        return await self._collection.find_one(self._rewrite(filter), *args, **kwargs)
+
+    async def count_documents(self, filter, *args, **kwargs):
+        return await self._collection.count_documents(self._rewrite(filter), *args, **kwargs)
+
+    def aggregate(self, pipeline, *args, **kwargs):
+        pipeline = [
+            {"$match": self._rewrite(stage["$match"])} if "$match" in stage else self._replace_text_score(stage)
+            for stage in pipeline
+        ]
+        return self._collection.aggregate(pipeline, *args, **kwargs)
@@ -0,0 +1,70 @@
+import asyncio
+import logging
+import threading
+from typing import Any, Awaitable, Callable, Optional
+
+logger = logging.getLogger(__name__)
+
+
+class JobQueueFull(Exception):
+    """Raised when a job is submitted while ``max_pending`` jobs are already queued or running."""
+
+
+class JobQueue:
+    """Bounded queue of long-running async pipelines on a shared event loop.
+
+    Each job is an ``async`` callable run to completion on the loop given to ``bind_loop`` (the
+    worker's long-lived loop); at most ``max_workers`` run at a time and the rest wait there for a
+    slot. At most ``max_pending`` jobs (running + waiting) are accepted; beyond that ``submit``
+    raises ``JobQueueFull`` so callers can shed load instead of queueing unbounded work in memory.
+    """
+
+    def __init__(self, max_workers: int = 2, max_pending: int = 50, name: str = "jobs"):
+        self.max_workers = max_workers
+        self.max_pending = max_pending
+        self.name = name
+        self._lock = threading.Lock()
+        self._pending = 0
+        self._loop: Optional[asyncio.AbstractEventLoop] = None
+        self._slots: Optional[asyncio.Semaphore] = None
+        self._closed = False
+        self.completed = 0
+        self.failed = 0
+
+    def bind_loop(self, loop: asyncio.AbstractEventLoop):
+        """Run jobs on ``loop``; required before ``submit``."""
+        self._loop = loop
+
+    @property
+    def pending(self) -> int:
+        return self._pending
+
+    def submit(self, job_id: str, job: Callable[..., Awaitable[Any]], *args, **kwargs):
+        """Schedule ``job(*args, **kwargs)`` from any thread; returns the ``concurrent.futures.Future`` of its result."""
+        if self._loop is None or self._closed:
+            raise RuntimeError(f"{self.name} queue is not running (bind_loop first)")
+        with self._lock:
+            if self._pending >= self.max_pending:
+                raise JobQueueFull(f"{self.name} queue is full ({self._pending} pending)")
+            self._pending += 1
+        return asyncio.run_coroutine_threadsafe(self._run(job_id, job, args, kwargs), self._loop)
+
+    async def _run(self, job_id: str, job, args, kwargs):
+        if self._slots is None:
+            self._slots = asyncio.Semaphore(self.max_workers)
+        try:
+            async with self._slots:
+                result = await job(*args, **kwargs)
+            self.completed += 1
+            return result
+        except Exception as e:
+            self.failed += 1
+            logger.error(f"Job {job_id} in {self.name} failed: {e}")
+            raise
+        finally:
+            with self._lock:
+                self._pending -= 1
+
+    def shutdown(self):
+        """Stop accepting jobs; those already scheduled end with the loop."""
+        self._closed = True
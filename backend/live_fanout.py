@@ -0,0 +1,95 @@
+import asyncio
+import logging
+import os
+from typing import Any, Awaitable, Callable, Dict, Optional
+
+from timers import DelayedTask
+
+logger = logging.getLogger(__name__)
+
+
+def interim_delta(previous: str, text: str) -> Dict[str, Any]:
+    """Encode ``text`` against the previously sent interim: keep ``keep`` characters, then ``append``."""
+    keep = len(os.path.commonprefix([previous, text]))
+    return {"keep": keep, "append": text[keep:]}
+
+
+def apply_interim_delta(previous: str, delta: Dict[str, Any]) -> str:
+    """Inverse of ``interim_delta``, as a client applies it."""
+    return previous[:delta["keep"]] + delta["append"]
+
+
+class LiveFanout:
+    """Broadcasts one live session's transcripts to everyone in its meeting room.
+
+    Interim results are throttled to one ``transcript_interim`` event per ``debounce`` seconds:
+    the first interim after a quiet window goes out at once, later ones within the window only
+    replace the pending text, which is sent when the window ends. Each interim is delta-encoded
+    against the last one sent for the stream (``keep`` characters of it, then ``append``); the
+    first interim of an utterance always has ``keep == 0``, so a viewer that joined mid-utterance
+    can ignore deltas until then. Finals are sent immediately and in full as ``transcript_update``
+    and drop any pending interim.
+
+    ``emit`` is awaited as ``emit(event, data, to=room)``.
+    """
+
+    def __init__(self, emit: Callable[..., Awaitable[None]], room: str, stream: str, debounce: float = 0.15):
+        self.emit = emit
+        self.room = room
+        self.stream = stream
+        self.debounce = debounce
+        self._pending: Optional[str] = None
+        self._last_sent = ""
+        self._last_sent_at = float("-inf")
+        self._seq = 0
+        self._flush_timer = DelayedTask(self.flush_interim, f"Timed interim flush for {stream} in {room}")
+        # Received vs. sent is what the debounce saved; server.py exports both as live_interim_results_total
+        self.interims_received = 0
+        self.interims_sent = 0
+        self.finals_sent = 0
+
+    async def interim(self, text: str):
+        """Queue an interim result; it is sent now or at the end of the current debounce window."""
+        self.interims_received += 1
+        self._pending = text
+        if self._flush_timer.scheduled:
+            return
+        wait = self._last_sent_at + self.debounce - asyncio.get_running_loop().time()
+        if wait <= 0:
+            await self.flush_interim()
+        else:
+            self._flush_timer.schedule(wait)
+
+    async def flush_interim(self):
+        """Send the pending interim, if it differs from the last one sent."""
+        self._flush_timer.cancel()
+        text, self._pending = self._pending, None
+        if text is None or text == self._last_sent:
+            return
+        payload = {"stream": self.stream, "seq": self._seq, **interim_delta(self._last_sent, text)}
+        self._seq += 1
+        self._last_sent = text
+        self._last_sent_at = asyncio.get_running_loop().time()
+        self.interims_sent += 1
+        try:
+            await self.emit('transcript_interim', payload, to=self.room)
+        except Exception as e:
+            logger.error(f"Error broadcasting interim for {self.stream} to {self.room}: {e}")
+
+    async def final(self, data: Dict[str, Any]):
+        """Broadcast a final result in full; the next interim starts a new delta chain."""
+        self._flush_timer.cancel()
+        self._pending = None
+        self._last_sent = ""
+        self._last_sent_at = float("-inf")
+        self.finals_sent += 1
+        await self.emit('transcript_update', {"type": "transcript", "stream": self.stream, "data": data}, to=self.room)
+
+    def close(self):
+        """Drop anything pending; called when the live session ends."""
+        self._flush_timer.cancel()
+        self._pending = None
+
+    def stats(self) -> Dict[str, int]:
+        return {"interims_received": self.interims_received, "interims_sent": self.interims_sent,
+                "finals_sent": self.finals_sent}
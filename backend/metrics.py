@@ -0,0 +1,246 @@
+"""Minimal in-process metrics with Prometheus text exposition.
+
+Instruments are plain Python objects guarded by a lock: recording a sample is a dict lookup, a
+``bisect`` and a few additions, cheap enough to leave on for every request (see
+``benchmarks/bench_metrics.py``). Each worker process exposes its own values; Prometheus
+aggregates across workers.
+"""
+import asyncio
+import bisect
+import contextvars
+import threading
+import time
+from concurrent.futures import Executor
+from typing import Callable, Dict, Iterable, List, Optional, Sequence, Tuple
+
+from pymongo import monitoring
+
+# Seconds; spans a fast Mongo command up to a long Deepgram/OpenAI call
+DEFAULT_BUCKETS = (0.001, 0.0025, 0.005, 0.01, 0.025, 0.05, 0.1, 0.25, 0.5, 1.0, 2.5, 5.0, 10.0, 30.0, 60.0)
+
+
+def _escape(value: str) -> str:
+    return value.replace("\\", "\\\\").replace("\n", "\\n").replace('"', '\\"')
+
+
+def _format_labels(names: Sequence[str], values: Sequence[str], extra: str = "") -> str:
+    pairs = [f'{name}="{_escape(str(value))}"' for name, value in zip(names, values)]
+    if extra:
+        pairs.append(extra)
+    return "{" + ",".join(pairs) + "}" if pairs else ""
+
+
+def _format_value(value: float) -> str:
+    return str(int(value)) if float(value).is_integer() else repr(float(value))
+
+
+class Metric:
+    kind = "untyped"
+
+    def __init__(self, name: str, help: str, labelnames: Sequence[str] = ()):
+        self.name = name
+        self.help = help
+        self.labelnames = tuple(labelnames)
+        self._lock = threading.Lock()
+
+    def samples(self) -> Iterable[str]:
+        raise NotImplementedError
+
+    def render(self) -> str:
+        lines = [f"# HELP {self.name} {self.help}", f"# TYPE {self.name} {self.kind}"]
+        lines.extend(self.samples())
+        return "\n".join(lines)
+
+
+class Counter(Metric):
+    kind = "counter"
+
+    def __init__(self, name: str, help: str, labelnames: Sequence[str] = ()):
+        super().__init__(name, help, labelnames)
+        self._values: Dict[Tuple[str, ...], float] = {}
+
+    def inc(self, amount: float = 1.0, *labels: str):
+        with self._lock:
+            self._values[labels] = self._values.get(labels, 0.0) + amount
+
+    def value(self, *labels: str) -> float:
+        return self._values.get(labels, 0.0)
+
+    def samples(self):
+        for labels, value in sorted(self._values.items()):
+            yield f"{self.name}{_format_labels(self.labelnames, labels)} {_format_value(value)}"
+
+
+class Gauge(Metric):
+    """Current value, either set explicitly or read from ``function`` at scrape time."""
+
+    kind = "gauge"
+
+    def __init__(self, name: str, help: str, labelnames: Sequence[str] = (),
+                 function: Optional[Callable[[], float]] = None):
+        super().__init__(name, help, labelnames)
+        self._values: Dict[Tuple[str, ...], float] = {}
+        self.function = function
+
+    def set(self, value: float, *labels: str):
+        self._values[labels] = value
+
+    def samples(self):
+        values = {(): self.function()} if self.function else dict(self._values)
+        for labels, value in sorted(values.items()):
+            yield f"{self.name}{_format_labels(self.labelnames, labels)} {_format_value(value)}"
+
+
+class Histogram(Metric):
+    kind = "histogram"
+
+    def __init__(self, name: str, help: str, labelnames: Sequence[str] = (),
+                 buckets: Sequence[float] = DEFAULT_BUCKETS):
+        super().__init__(name, help, labelnames)
+        self.buckets = tuple(sorted(buckets))
+        # labels -> [per-bucket counts (last is +Inf), sum, count]
+        self._series: Dict[Tuple[str, ...], list] = {}
+
+    def observe(self, value: float, *labels: str):
+        index = bisect.bisect_left(self.buckets, value)
+        with self._lock:
+            series = self._series.get(labels)
+            if series is None:
+                series = self._series[labels] = [[0] * (len(self.buckets) + 1), 0.0, 0]
+            series[0][index] += 1
+            series[1] += value
+            series[2] += 1
+
+    def time(self, *labels: str) -> "_Timer":
+        """Context manager observing the elapsed seconds of its block."""
+        return _Timer(self, labels)
+
+    def count(self, *labels: str) -> int:
+        series = self._series.get(labels)
+        return series[2] if series else 0
+
+    def samples(self):
+        with self._lock:
+            snapshot = [(labels, list(series[0]), series[1], series[2]) for labels, series in self._series.items()]
+        for labels, counts, total, count in sorted(snapshot):
+            cumulative = 0
+            for bound, bucket_count in zip(self.buckets + (float("inf"),), counts):
+                cumulative += bucket_count
+                le = "+Inf" if bound == float("inf") else _format_value(bound)
+                bucket_labels = _format_labels(self.labelnames, labels, f'le="{le}"')
+                yield f"{self.name}_bucket{bucket_labels} {cumulative}"
+            yield f"{self.name}_sum{_format_labels(self.labelnames, labels)} {_format_value(total)}"
+            yield f"{self.name}_count{_format_labels(self.labelnames, labels)} {count}"
+
+
+class _Timer:
+    __slots__ = ("histogram", "labels", "start")
+
+    def __init__(self, histogram: Histogram, labels: Tuple[str, ...]):
+        self.histogram = histogram
+        self.labels = labels
+
+    def __enter__(self):
+        self.start = time.perf_counter()
+        return self
+
+    def __exit__(self, *exc_info):
+        self.histogram.observe(time.perf_counter() - self.start, *self.labels)
+        return False
+
+
+class Registry:
+    def __init__(self):
+        self.metrics: List[Metric] = []
+
+    def register(self, metric: Metric) -> Metric:
+        self.metrics.append(metric)
+        return metric
+
+    def counter(self, name: str, help: str, labelnames: Sequence[str] = ()) -> Counter:
+        return self.register(Counter(name, help, labelnames))
+
+    def gauge(self, name: str, help: str, labelnames: Sequence[str] = (),
+              function: Optional[Callable[[], float]] = None) -> Gauge:
+        return self.register(Gauge(name, help, labelnames, function))
+
+    def histogram(self, name: str, help: str, labelnames: Sequence[str] = (),
+                  buckets: Sequence[float] = DEFAULT_BUCKETS) -> Histogram:
+        return self.register(Histogram(name, help, labelnames, buckets))
+
+    def render(self) -> str:
+        return "\n".join(metric.render() for metric in self.metrics) + "\n"
+
+
+REGISTRY = Registry()
+CONTENT_TYPE = "text/plain; version=0.0.4; charset=utf-8"
+
+THREAD_OFFLOAD_WAIT = REGISTRY.histogram(
+    "thread_offload_wait_seconds", "Time blocking calls waited for a free worker thread", ["call"]
+)
+THREAD_OFFLOAD_DURATION = REGISTRY.histogram(
+    "thread_offload_duration_seconds", "Run time of blocking calls offloaded to threads", ["call"]
+)
+
+
+# Executor for CPU-bound calls; None means the loop's default executor
+cpu_executor: Optional[Executor] = None
+
+
+def set_cpu_executor(executor: Optional[Executor]):
+    """Run ``to_cpu_thread`` calls on ``executor`` (e.g. real OS threads when the default executor's are green)."""
+    global cpu_executor
+    cpu_executor = executor
+
+
+async def _offload(call: str, executor: Optional[Executor], func, args, kwargs):
+    context = contextvars.copy_context()
+    submitted = time.perf_counter()
+    started = None
+
+    def run():
+        nonlocal started
+        started = time.perf_counter()
+        return context.run(func, *args, **kwargs)
+
+    try:
+        return await asyncio.get_running_loop().run_in_executor(executor, run)
+    finally:
+        # Recorded here rather than in the worker thread, which may not share this thread's locks
+        if started is not None:
+            THREAD_OFFLOAD_WAIT.observe(started - submitted, call)
+            THREAD_OFFLOAD_DURATION.observe(time.perf_counter() - started, call)
+
+
+async def to_thread(call: str, func, *args, **kwargs):
+    """``asyncio.to_thread`` for blocking I/O that records queue wait and run time under the ``call`` label."""
+    return await _offload(call, None, func, args, kwargs)
+
+
+async def to_cpu_thread(call: str, func, *args, **kwargs):
+    """Like ``to_thread``, for CPU-bound work: runs on ``cpu_executor`` (see ``set_cpu_executor``)."""
+    return await _offload(call, cpu_executor, func, args, kwargs)
+
+
+class MongoCommandMetrics(monitoring.CommandListener):
+    """pymongo command listener recording the duration of every command per collection."""
+
+    def __init__(self, histogram: Histogram):
+        self.histogram = histogram
+        self._collections: Dict[Tuple, str] = {}
+
+    def started(self, event):
+        collection = event.command.get(event.command_name)
+        self._collections[(event.connection_id, event.request_id)] = (
+            collection if isinstance(collection, str) else ""
+        )
+
+    def _finish(self, event, outcome: str):
+        collection = self._collections.pop((event.connection_id, event.request_id), "")
+        self.histogram.observe(event.duration_micros / 1e6, event.command_name, collection, outcome)
+
+    def succeeded(self, event):
+        self._finish(event, "ok")
+
+    def failed(self, event):
+        self._finish(event, "error")
@@ -0,0 +1,99 @@
+"""Move transcripts embedded in meeting documents into ``transcript_buckets`` and index their segments.
+
+Meetings written before bucketed storage keep their segments in ``meetings.transcript``. For each
+such meeting this stores the segments with ``TranscriptStore.replace`` and indexes them for search
+(``transcript_segments``), then unsets the embedded list and sets ``segments_count``. A meeting is
+only unset after its buckets and index are written, so the script can be stopped and re-run at any
+point; meetings already migrated are not matched again.
+
+Then every meeting whose stored transcript has no search index yet (meetings from before
+segment search, including ones migrated by an earlier run of this script) is indexed from its
+buckets.
+
+    MONGO_URL=mongodb://localhost:27017 DB_NAME=meetings python migrate_transcripts.py --dry-run
+    MONGO_URL=mongodb://localhost:27017 DB_NAME=meetings python migrate_transcripts.py
+"""
+import argparse
+import asyncio
+import logging
+import os
+from pathlib import Path
+
+from dotenv import load_dotenv
+
+from providers import build_mongo_client
+from segment_search import SegmentSearchIndex
+from transcript_store import TranscriptStore
+
+load_dotenv(Path(__file__).parent / '.env')
+logging.basicConfig(level=logging.INFO, format='%(asctime)s - %(name)s - %(levelname)s - %(message)s')
+logger = logging.getLogger(__name__)
+
+
+async def migrate(db, store: TranscriptStore, segment_index: SegmentSearchIndex, batch_size: int, dry_run: bool):
+    query = {"transcript": {"$exists": True}}
+    cursor = db.meetings.find(query, {"_id": 0, "id": 1, "transcript": 1}).batch_size(batch_size)
+    meetings = segments = 0
+    async for meeting in cursor:
+        transcript = meeting.get("transcript") or []
+        meetings += 1
+        segments += len(transcript)
+        if dry_run:
+            continue
+        await store.replace(meeting["id"], transcript)
+        await segment_index.replace_meeting(meeting["id"], transcript)
+        await db.meetings.update_one(
+            {"id": meeting["id"]},
+            {"$unset": {"transcript": ""}, "$set": {"segments_count": len(transcript)}}
+        )
+        if meetings % 100 == 0:
+            logger.info(f"Migrated {meetings} meetings ({segments} segments)")
+    action = "Would migrate" if dry_run else "Migrated"
+    logger.info(f"{action} {meetings} meetings ({segments} segments)")
+
+
+async def backfill_segments(db, store: TranscriptStore, segment_index: SegmentSearchIndex, batch_size: int,
+                            dry_run: bool):
+    query = {"transcript": {"$exists": False}, "segments_count": {"$gt": 0}}
+    cursor = db.meetings.find(query, {"_id": 0, "id": 1}).batch_size(batch_size)
+    meetings = segments = 0
+    async for meeting in cursor:
+        if await segment_index.has_meeting(meeting["id"]):
+            continue
+        transcript = [segment async for segment in store.iter_segments(meeting["id"])]
+        meetings += 1
+        segments += len(transcript)
+        if dry_run:
+            continue
+        await segment_index.replace_meeting(meeting["id"], transcript)
+        if meetings % 100 == 0:
+            logger.info(f"Indexed {meetings} meetings ({segments} segments)")
+    action = "Would index" if dry_run else "Indexed"
+    logger.info(f"{action} {meetings} meetings ({segments} segments) for search")
+
+
+async def main():
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[0])
+    parser.add_argument("--dry-run", action="store_true", help="count the meetings to migrate and index without writing")
+    parser.add_argument("--batch-size", type=int, default=50, help="meetings fetched per cursor batch")
+    args = parser.parse_args()
+
+    client = build_mongo_client(os.environ['MONGO_URL'])
+    db = client[os.environ['DB_NAME']]
+    store = TranscriptStore(
+        db.transcript_buckets,
+        max_segments=int(os.environ.get('TRANSCRIPT_BUCKET_SEGMENTS', 200)),
+        bucket_seconds=float(os.environ.get('TRANSCRIPT_BUCKET_SECONDS', 300.0)),
+    )
+    segment_index = SegmentSearchIndex(db.transcript_segments)
+    try:
+        await store.ensure_indexes()
+        await segment_index.ensure_indexes()
+        await migrate(db, store, segment_index, args.batch_size, args.dry_run)
+        await backfill_segments(db, store, segment_index, args.batch_size, args.dry_run)
+    finally:
+        client.close()
+
+
+if __name__ == "__main__":
+    asyncio.run(main())
@@ -0,0 +1,47 @@
+import base64
+import json
+from datetime import datetime
+from typing import Any, Dict, List, Optional, Tuple
+
+
+def encode_token(values: List[Any]) -> str:
+    """Encode a list of JSON-serialisable sort keys as an opaque URL-safe token."""
+    raw = json.dumps(values).encode()
+    return base64.urlsafe_b64encode(raw).decode().rstrip("=")
+
+
+def decode_token(token: str) -> List[Any]:
+    """Inverse of ``encode_token``. Raises ``ValueError`` on malformed tokens."""
+    try:
+        padded = token + "=" * (-len(token) % 4)
+        values = json.loads(base64.urlsafe_b64decode(padded))
+    except Exception as e:
+        raise ValueError(f"Invalid cursor: {token}") from e
+    if not isinstance(values, list):
+        raise ValueError(f"Invalid cursor: {token}")
+    return values
+
+
+def encode_cursor(timestamp: datetime, item_id: str) -> str:
+    """Encode a ``(timestamp, id)`` keyset position as an opaque URL-safe token."""
+    return encode_token([timestamp.isoformat(), item_id])
+
+
+def decode_cursor(cursor: str) -> Tuple[datetime, str]:
+    """Inverse of ``encode_cursor``. Raises ``ValueError`` on malformed tokens."""
+    try:
+        timestamp, item_id = decode_token(cursor)
+        return datetime.fromisoformat(timestamp), str(item_id)
+    except (TypeError, ValueError) as e:
+        raise ValueError(f"Invalid cursor: {cursor}") from e
+
+
+def keyset_filter(cursor: Optional[str]) -> Dict[str, Any]:
+    """Query fragment selecting documents strictly after ``cursor`` in ``(timestamp desc, id desc)`` order."""
+    if not cursor:
+        return {}
+    timestamp, item_id = decode_cursor(cursor)
+    return {"$or": [
+        {"timestamp": {"$lt": timestamp}},
+        {"timestamp": timestamp, "id": {"$lt": item_id}},
+    ]}
@@ -0,0 +1,93 @@
+"""Construction of the external service clients used by ``server.py``.
+
+``PROVIDERS=live`` (default) builds the real Deepgram, OpenAI and SendGrid clients;
+``PROVIDERS=fake`` swaps in the deterministic stand-ins from ``fakes.py``, tuned with the
+``FAKE_*`` variables below. Independently, a ``MONGO_URL`` of ``mongomock://`` selects an
+in-memory MongoDB (requires the optional ``mongomock-motor`` package), where ``$text`` search
+falls back to a regex scan (see ``fakes.TextSearchClient``).
+"""
+import logging
+import os
+from dataclasses import dataclass
+from typing import Any, Optional, Sequence
+
+logger = logging.getLogger(__name__)
+
+PROVIDER_MODES = ("live", "fake")
+IN_MEMORY_MONGO_URL = "mongomock://"
+
+
+@dataclass
+class Providers:
+    mode: str
+    deepgram: Any
+    openai: Any
+    sendgrid: Any
+    mongo: Any
+
+
+def _env_float(name: str, default: float) -> float:
+    return float(os.environ.get(name, default))
+
+
+def build_mongo_client(url: str, event_listeners: Sequence[Any] = (), max_pool_size: int = 100):
+    """Motor client for ``url``, or an in-memory Motor-compatible client for ``mongomock://``.
+
+    One client (and its connection pool) is shared by the whole worker.
+    """
+    if url.startswith(IN_MEMORY_MONGO_URL):
+        from mongomock_motor import AsyncMongoMockClient  # optional, only for offline runs
+        from fakes import TextSearchClient
+        return TextSearchClient(AsyncMongoMockClient())
+    from motor.motor_asyncio import AsyncIOMotorClient
+    return AsyncIOMotorClient(url, event_listeners=list(event_listeners), maxPoolSize=max_pool_size)
+
+
+def build_live_clients(openai_api_key: Optional[str], deepgram_api_key: Optional[str],
+                       sendgrid_api_key: Optional[str]):
+    import openai
+    import sendgrid
+    from deepgram import DeepgramClient
+
+    openai.api_key = openai_api_key
+    # One OpenAI client per worker so its HTTP connection pool is reused across requests and threads;
+    # without a key fall back to the module, which reports the missing key on first use
+    openai_client = openai.OpenAI(api_key=openai_api_key) if openai_api_key else openai
+    return DeepgramClient(deepgram_api_key), openai_client, sendgrid.SendGridAPIClient(api_key=sendgrid_api_key)
+
+
+def build_fake_clients():
+    from fakes import FakeDeepgramClient, FakeOpenAI, FakeSendGrid
+
+    seed = int(os.environ.get('FAKE_SEED', 0))
+    deepgram = FakeDeepgramClient(
+        latency=_env_float('FAKE_DEEPGRAM_LATENCY', 0.5),
+        live_latency=_env_float('FAKE_DEEPGRAM_LIVE_LATENCY', 0.3),
+        utterances=int(os.environ.get('FAKE_DEEPGRAM_UTTERANCES', 50)),
+        utterance_seconds=_env_float('FAKE_DEEPGRAM_UTTERANCE_SECONDS', 2.0),
+        seed=seed
+    )
+    openai = FakeOpenAI(
+        latency=_env_float('FAKE_OPENAI_LATENCY', 1.0),
+        chunk_delay=_env_float('FAKE_OPENAI_CHUNK_DELAY', 0.02)
+    )
+    sendgrid = FakeSendGrid(
+        latency=_env_float('FAKE_SENDGRID_LATENCY', 0.2),
+        failure_rate=_env_float('FAKE_SENDGRID_FAILURE_RATE', 0.0),
+        seed=seed
+    )
+    return deepgram, openai, sendgrid
+
+
+def build_providers(mongo_url: str, mode: Optional[str] = None, openai_api_key: Optional[str] = None,
+                    deepgram_api_key: Optional[str] = None, sendgrid_api_key: Optional[str] = None,
+                    mongo_event_listeners: Sequence[Any] = (), mongo_max_pool_size: int = 100) -> Providers:
+    mode = mode or os.environ.get('PROVIDERS', 'live')
+    if mode not in PROVIDER_MODES:
+        raise ValueError(f"Unknown PROVIDERS mode '{mode}', expected one of {PROVIDER_MODES}")
+    if mode == "fake":
+        logger.warning("Using fake Deepgram/OpenAI/SendGrid providers")
+        deepgram, openai, sendgrid = build_fake_clients()
+    else:
+        deepgram, openai, sendgrid = build_live_clients(openai_api_key, deepgram_api_key, sendgrid_api_key)
+    return Providers(mode, deepgram, openai, sendgrid, build_mongo_client(mongo_url, mongo_event_listeners, mongo_max_pool_size))
@@ -0,0 +1,115 @@
+import html
+import logging
+import re
+from typing import Any, Dict, List, Optional, Tuple
+
+from pymongo import ASCENDING, TEXT
+
+from pagination import decode_token, encode_token
+
+logger = logging.getLogger(__name__)
+
+SNIPPET_RADIUS = 80
+
+
+def query_terms(query: str) -> List[str]:
+    """Words from a search query, ignoring quotes and negated (``-word``) terms."""
+    return [t.lower() for t in re.findall(r"(?<![\w-])\w+", query.replace('"', " "))]
+
+
+def highlight_snippet(text: str, terms: List[str], radius: int = SNIPPET_RADIUS) -> str:
+    """HTML-escaped excerpt of ``text`` around the first match, with matches wrapped in ``<mark>``."""
+    if not terms:
+        return html.escape(text[:2 * radius])
+    pattern = re.compile(r"\b(" + "|".join(re.escape(t) for t in terms) + r")\w*", re.IGNORECASE)
+    first = pattern.search(text)
+    start = max((first.start() if first else 0) - radius, 0)
+    end = min((first.end() if first else 0) + radius, len(text))
+    excerpt, pos = [], start
+    for match in pattern.finditer(text, start, end):
+        excerpt.append(html.escape(text[pos:match.start()]))
+        excerpt.append(f"<mark>{html.escape(match.group(0))}</mark>")
+        pos = match.end()
+    excerpt.append(html.escape(text[pos:end]))
+    return ("…" if start > 0 else "") + "".join(excerpt) + ("…" if end < len(text) else "")
+
+
+class SegmentSearchIndex:
+    """Full-text index over transcript segments, kept as one small document per segment.
+
+    Segment documents are written alongside the meeting transcript, so searches never
+    scan meeting documents. Ranking uses MongoDB's ``textScore``.
+    """
+
+    def __init__(self, collection):
+        self.collection = collection
+
+    async def ensure_indexes(self):
+        await self.collection.create_index([("text", TEXT)], name="segments_text")
+        await self.collection.create_index([("meeting_id", ASCENDING), ("timestamp", ASCENDING)])
+
+    @staticmethod
+    def _documents(meeting_id: str, segments: List[Dict[str, Any]]) -> List[Dict[str, Any]]:
+        return [{
+            "id": seg["id"],
+            "meeting_id": meeting_id,
+            "text": seg["text"],
+            "timestamp": seg["timestamp"],
+            "speaker": seg.get("speaker", "Unknown"),
+        } for seg in segments if seg.get("text")]
+
+    async def add_segments(self, meeting_id: str, segments: List[Dict[str, Any]]):
+        """Index newly appended segments of a meeting."""
+        documents = self._documents(meeting_id, segments)
+        if documents:
+            await self.collection.insert_many(documents, ordered=False)
+
+    async def has_meeting(self, meeting_id: str) -> bool:
+        return await self.collection.find_one({"meeting_id": meeting_id}, {"_id": 1}) is not None
+
+    async def replace_meeting(self, meeting_id: str, segments: List[Dict[str, Any]]):
+        """Re-index a meeting whose transcript was replaced wholesale."""
+        await self.collection.delete_many({"meeting_id": meeting_id})
+        await self.add_segments(meeting_id, segments)
+
+    async def search(self, query: str, cursor: Optional[str] = None, limit: int = 20,
+                     meeting_id: Optional[str] = None) -> Tuple[List[Dict[str, Any]], Optional[str]]:
+        """Ranked segment hits for ``query`` and the cursor of the next page (``None`` on the last page)."""
+        match: Dict[str, Any] = {"$text": {"$search": query}}
+        if meeting_id:
+            match["meeting_id"] = meeting_id
+        pipeline: List[Dict[str, Any]] = [
+            {"$match": match},
+            {"$addFields": {"score": {"$meta": "textScore"}}},
+        ]
+        if cursor:
+            try:
+                score, segment_id = decode_token(cursor)
+                score = float(score)
+            except (TypeError, ValueError) as e:
+                raise ValueError(f"Invalid cursor: {cursor}") from e
+            pipeline.append({"$match": {"$or": [
+                {"score": {"$lt": score}},
+                {"score": score, "id": {"$gt": segment_id}},
+            ]}})
+        pipeline += [
+            {"$sort": {"score": -1, "id": 1}},
+            {"$limit": limit + 1},
+            {"$project": {"_id": 0, "id": 1, "meeting_id": 1, "text": 1, "timestamp": 1, "speaker": 1, "score": 1}},
+        ]
+        docs = await self.collection.aggregate(pipeline).to_list(limit + 1)
+
+        next_cursor = None
+        if len(docs) > limit:
+            docs = docs[:limit]
+            next_cursor = encode_token([docs[-1]["score"], docs[-1]["id"]])
+        terms = query_terms(query)
+        hits = [{
+            "meeting_id": doc["meeting_id"],
+            "segment_id": doc["id"],
+            "timestamp": doc["timestamp"],
+            "speaker": doc["speaker"],
+            "score": round(doc["score"], 4),
+            "snippet": highlight_snippet(doc["text"], terms),
+        } for doc in docs]
+        return hits, next_cursor
@@ -1,34 +1,63 @@
-import eventlet
-eventlet.monkey_patch()  # MUST be first
-
 import os
+
+# SERVER_MODE=eventlet (default): Flask-SocketIO on eventlet, started with `python server.py` or gunicorn.
+# SERVER_MODE=asgi: one asyncio loop per worker, started with `uvicorn asgi:app` (see asgi.py).
+SERVER_MODE = os.environ.get('SERVER_MODE', 'eventlet')
+if SERVER_MODE == 'eventlet':
+    # Eventlet's asyncio hub: green threads and the shared asyncio loop take turns on one OS thread
+    os.environ['EVENTLET_HUB'] = 'asyncio'
+    import eventlet
+    eventlet.monkey_patch()  # MUST be first
+    import eventlet.tpool
+
 import logging
 import uuid
 import json
+import queue
 import asyncio
 import tempfile
+import threading
 import atexit
+import socket
+import time
+from concurrent.futures import Future, ThreadPoolExecutor
 from pathlib import Path
 from datetime import datetime
 from typing import List, Optional, Dict, Any
 
 # Flask and extensions for web framework and WebSockets
-from flask import Flask, Blueprint, request, jsonify, abort
+from flask import Flask, Blueprint, Request, Response, g, request, jsonify, abort
+from werkzeug.exceptions import HTTPException
 from flask_cors import CORS
-from flask_socketio import SocketIO, join_room, leave_room
+import socketio as python_socketio
+from flask_socketio import SocketIO
 
 # Pydantic for data validation and settings management
 from pydantic import BaseModel, Field, ValidationError
 from dotenv import load_dotenv
 
 # MongoDB async client
-from motor.motor_asyncio import AsyncIOMotorClient
+from pymongo import ASCENDING, DESCENDING, TEXT
 
 # Third-party API clients
-import openai
-from deepgram import DeepgramClient, PrerecordedOptions, LiveTranscriptionEvents, LiveOptions
-import sendgrid
-from sendgrid.helpers.mail import Mail
+from deepgram import PrerecordedOptions, LiveTranscriptionEvents, LiveOptions
+from sendgrid.helpers.mail import From, Mail
+
+from audio_ingest import AudioIngest
+from email_outbox import EmailOutbox
+from export import EXPORT_FORMATS, MeetingExporter, export_query
+from jobs import JobQueue, JobQueueFull
+from live_fanout import LiveFanout
+import metrics
+from pagination import encode_cursor, keyset_filter
+from providers import build_providers
+from segment_search import SegmentSearchIndex
+from similarity import ITEM_SECTIONS, MeetingSimilarity
+from session_registry import SessionRegistry, build_session_bus
+from summarizer import SUMMARY_SECTIONS, ChunkedSummarizer, format_segment, segments_from_text
+from summary_cache import SummaryCache, summary_cache_key
+from transcript_buffer import TranscriptBuffer
+from transcript_store import TranscriptStore
 
 # --- Configuration and Initialization ---
 
@@ -41,25 +70,335 @@ OPENAI_API_KEY = os.environ.get('OPENAI_API_KEY')
 DEEPGRAM_API_KEY = os.environ.get('DEEPGRAM_API_KEY')
 SENDGRID_API_KEY = os.environ.get('SENDGRID_API_KEY')
 
-# Initialize clients
-openai.api_key = OPENAI_API_KEY
-deepgram_client = DeepgramClient(DEEPGRAM_API_KEY)
-sg = sendgrid.SendGridAPIClient(api_key=SENDGRID_API_KEY)
+# Live transcript persistence: flush after this many final segments or this many seconds
+TRANSCRIPT_FLUSH_SEGMENTS = int(os.environ.get('TRANSCRIPT_FLUSH_SEGMENTS', 25))
+TRANSCRIPT_FLUSH_SECONDS = float(os.environ.get('TRANSCRIPT_FLUSH_SECONDS', 5.0))
+# Transcript storage: a bucket document holds at most this many segments / seconds of meeting time
+TRANSCRIPT_BUCKET_SEGMENTS = int(os.environ.get('TRANSCRIPT_BUCKET_SEGMENTS', 200))
+TRANSCRIPT_BUCKET_SECONDS = float(os.environ.get('TRANSCRIPT_BUCKET_SECONDS', 300.0))
 
-# MongoDB Connection
+# Summarization: transcripts are split into chunks of this many (estimated) tokens
+SUMMARY_CHUNK_TOKENS = int(os.environ.get('SUMMARY_CHUNK_TOKENS', 6000))
+SUMMARY_MAX_CONCURRENCY = int(os.environ.get('SUMMARY_MAX_CONCURRENCY', 4))
+SUMMARY_CACHE_MAX_BYTES = int(os.environ.get('SUMMARY_CACHE_MAX_BYTES', 8 * 1024 * 1024))
+SUMMARY_CACHE_TTL_SECONDS = int(os.environ.get('SUMMARY_CACHE_TTL_SECONDS', 30 * 24 * 3600))
+
+# Live audio: client chunks are coalesced into frames of this length before going to Deepgram
+AUDIO_FRAME_MS = int(os.environ.get('AUDIO_FRAME_MS', 100))
+AUDIO_MAX_QUEUED_FRAMES = int(os.environ.get('AUDIO_MAX_QUEUED_FRAMES', 50))
+AUDIO_OVERFLOW_POLICY = os.environ.get('AUDIO_OVERFLOW_POLICY', 'drop_oldest')
+# Live fan-out to the meeting room: at most one interim update per stream every this many seconds
+LIVE_INTERIM_DEBOUNCE_SECONDS = float(os.environ.get('LIVE_INTERIM_DEBOUNCE_SECONDS', 0.15))
+
+# Multi-worker live sessions: Socket.IO message queue (e.g. redis://...) shared by all workers,
+# and how long a worker may miss heartbeats before its sessions can be taken over
+SOCKETIO_MESSAGE_QUEUE = os.environ.get('SOCKETIO_MESSAGE_QUEUE')
+SESSION_HEARTBEAT_TTL = float(os.environ.get('SESSION_HEARTBEAT_TTL', 15.0))
+SESSION_OWNER_CACHE_SECONDS = 1.0
+WORKER_ID = f"{socket.gethostname()}:{os.getpid()}:{uuid.uuid4().hex[:6]}"
+
+# File transcription: uploads are streamed to UPLOAD_DIR and processed by a bounded worker pool
+UPLOAD_DIR = os.environ.get('UPLOAD_DIR', tempfile.gettempdir())
+UPLOAD_PREFIX = "meeting-upload-"
+# Spooled uploads older than this that no unfinished job refers to are removed at startup
+UPLOAD_STALE_SECONDS = float(os.environ.get('UPLOAD_STALE_SECONDS', 6 * 3600))
+TRANSCRIPTION_WORKERS = int(os.environ.get('TRANSCRIPTION_WORKERS', 2))
+TRANSCRIPTION_MAX_PENDING = int(os.environ.get('TRANSCRIPTION_MAX_PENDING', 50))
+
+# Email delivery: recipients per SendGrid request, parallel requests and retry policy
+EMAIL_BATCH_SIZE = int(os.environ.get('EMAIL_BATCH_SIZE', 1000))
+EMAIL_MAX_CONCURRENCY = int(os.environ.get('EMAIL_MAX_CONCURRENCY', 4))
+EMAIL_MAX_ATTEMPTS = int(os.environ.get('EMAIL_MAX_ATTEMPTS', 5))
+EMAIL_RETRY_BASE_DELAY = float(os.environ.get('EMAIL_RETRY_BASE_DELAY', 2.0))
+# A worker's claim on an outbox entry expires after this long without progress; the sweeper re-queues due entries
+EMAIL_LEASE_TTL = float(os.environ.get('EMAIL_LEASE_TTL', 300.0))
+EMAIL_SWEEP_INTERVAL = float(os.environ.get('EMAIL_SWEEP_INTERVAL', 5.0))
+
+# ASGI mode: Flask views run in this many threads and await their coroutines on the shared loop
+ASGI_WSGI_THREADS = int(os.environ.get('ASGI_WSGI_THREADS', 32))
+# Eventlet mode: blocking SDK calls made with ``asyncio.to_thread`` run in at most this many green threads
+EVENTLET_EXECUTOR_THREADS = int(os.environ.get('EVENTLET_EXECUTOR_THREADS', 64))
+MONGO_MAX_POOL_SIZE = int(os.environ.get('MONGO_MAX_POOL_SIZE', 100))
+
+# Meeting history paging
+MEETINGS_PAGE_SIZE = 20
+MEETINGS_MAX_PAGE_SIZE = 100
+
+# Bulk export: meetings fetched per cursor batch, and size of the response chunks
+EXPORT_BATCH_SIZE = int(os.environ.get('EXPORT_BATCH_SIZE', 100))
+EXPORT_CHUNK_BYTES = int(os.environ.get('EXPORT_CHUNK_BYTES', 64 * 1024))
+
+# Metrics, exposed in Prometheus format at /api/metrics
+HTTP_REQUEST_DURATION = metrics.REGISTRY.histogram(
+    "http_request_duration_seconds", "Latency of API requests", ["method", "route", "status"]
+)
+MONGO_COMMAND_DURATION = metrics.REGISTRY.histogram(
+    "mongo_command_duration_seconds", "MongoDB command latency", ["command", "collection", "outcome"]
+)
+DEEPGRAM_PRERECORDED_DURATION = metrics.REGISTRY.histogram(
+    "deepgram_prerecorded_duration_seconds", "Duration of Deepgram file transcription requests"
+)
+LIVE_TIME_TO_FIRST_PARTIAL = metrics.REGISTRY.histogram(
+    "live_time_to_first_partial_seconds", "Time from live session start to its first interim transcript"
+)
+LIVE_TIME_TO_FIRST_FINAL = metrics.REGISTRY.histogram(
+    "live_time_to_first_final_seconds", "Time from live session start to its first final transcript"
+)
+LIVE_INTERIM_RESULTS = metrics.REGISTRY.counter(
+    "live_interim_results_total", "Live interim results received from Deepgram and broadcast to rooms", ["outcome"]
+)
+LIVE_SESSIONS = metrics.REGISTRY.gauge(
+    "live_sessions", "Live sessions with an open Deepgram connection on this worker",
+    function=lambda: len(deepgram_connections)
+)
+OPENAI_REQUEST_DURATION = metrics.REGISTRY.histogram(
+    "openai_request_duration_seconds", "Latency of chat completion requests", ["model"]
+)
+SUMMARY_DURATION = metrics.REGISTRY.histogram(
+    "summary_duration_seconds", "Time to produce a meeting summary", ["cached"]
+)
+SUMMARY_FIRST_SECTION = metrics.REGISTRY.histogram(
+    "summary_first_section_seconds", "Time from the start of a streamed summary to its first complete section"
+)
+SUMMARY_TOKENS = metrics.REGISTRY.histogram(
+    "summary_tokens", "OpenAI tokens used per generated summary", ["model", "type"],
+    buckets=(250, 500, 1000, 2000, 5000, 10000, 20000, 50000, 100000, 200000)
+)
+SENDGRID_SEND_DURATION = metrics.REGISTRY.histogram(
+    "sendgrid_send_duration_seconds", "Latency of SendGrid mail/send requests", ["outcome"]
+)
+
+# Initialize clients (PROVIDERS=fake swaps in local stand-ins, see providers.py)
 mongo_url = os.environ['MONGO_URL']
-client = AsyncIOMotorClient(mongo_url)
+providers = build_providers(
+    mongo_url, openai_api_key=OPENAI_API_KEY, deepgram_api_key=DEEPGRAM_API_KEY, sendgrid_api_key=SENDGRID_API_KEY,
+    mongo_event_listeners=[metrics.MongoCommandMetrics(MONGO_COMMAND_DURATION)], mongo_max_pool_size=MONGO_MAX_POOL_SIZE
+)
+deepgram_client = providers.deepgram
+openai_client = providers.openai
+sg = providers.sendgrid
+
+# MongoDB Connection
+client = providers.mongo
 db = client[os.environ['DB_NAME']]
+transcript_store = TranscriptStore(
+    db.transcript_buckets, max_segments=TRANSCRIPT_BUCKET_SEGMENTS, bucket_seconds=TRANSCRIPT_BUCKET_SECONDS
+)
+segment_index = SegmentSearchIndex(db.transcript_segments)
+transcription_jobs = JobQueue(
+    max_workers=TRANSCRIPTION_WORKERS, max_pending=TRANSCRIPTION_MAX_PENDING, name="transcription"
+)
+email_jobs = JobQueue(max_workers=2, max_pending=500, name="email")
+session_registry = SessionRegistry(db.live_sessions, WORKER_ID, ttl=SESSION_HEARTBEAT_TTL)
+session_bus = build_session_bus(SOCKETIO_MESSAGE_QUEUE, WORKER_ID)
+summarizer = ChunkedSummarizer(
+    openai_client, model="gpt-4o", token_budget=SUMMARY_CHUNK_TOKENS, max_concurrency=SUMMARY_MAX_CONCURRENCY
+)
+summary_cache = SummaryCache(
+    db.summary_cache, max_bytes=SUMMARY_CACHE_MAX_BYTES, ttl_seconds=SUMMARY_CACHE_TTL_SECONDS
+)
+meeting_similarity = MeetingSimilarity(db.similarity_vectors)
+
+
+# --- Shared event loop ---
+# Live sessions (Deepgram sockets, audio frames, transcript buffers) live on one long-lived loop per
+# worker, which also runs the async views and background jobs. Under ASGI it is the server's loop;
+# under eventlet it is the loop of eventlet's asyncio hub, so green threads (requests, Socket.IO
+# handlers) and coroutines share one OS thread. Code on that loop must not make blocking green
+# calls, which would switch away from the hub itself: see ``emit`` and ``publish_to_worker``.
+event_loop: Optional[asyncio.AbstractEventLoop] = None
+
+def bind_event_loop(loop: asyncio.AbstractEventLoop):
+    """Use ``loop`` (the ASGI server's) for live sessions, async views and background jobs."""
+    global event_loop
+    event_loop = loop
+    transcription_jobs.bind_loop(loop)
+    email_jobs.bind_loop(loop)
+
+class GreenThreadExecutor(ThreadPoolExecutor):
+    """Eventlet mode: executor running each call in a green thread, at most ``max_workers`` at a time.
+
+    asyncio's default executor would use real OS threads, and green locks (logging, SDK
+    connection pools) must not be shared across OS threads.
+    """
+
+    def __init__(self, max_workers: int):
+        super().__init__(max_workers)
+        self._slots = eventlet.semaphore.Semaphore(max_workers)
+
+    def submit(self, fn, /, *args, **kwargs):
+        future = Future()
+
+        def run():
+            with self._slots:
+                if not future.set_running_or_notify_cancel():
+                    return
+                try:
+                    future.set_result(fn(*args, **kwargs))
+                except BaseException as e:
+                    future.set_exception(e)
+
+        eventlet.spawn_n(run)
+        return future
+
+    def shutdown(self, wait: bool = True, *, cancel_futures: bool = False):
+        pass
+
+class TpoolExecutor(GreenThreadExecutor):
+    """Eventlet mode: executor for CPU-bound calls, run in eventlet's pool of real OS threads.
+
+    A green thread would hold the hub, and with it every request and live session, for the whole
+    computation. Calls run one at a time: the work inside (e.g. ``MeetingSimilarity``) is guarded
+    by green locks, which must not be contended from several OS threads.
+    """
+
+    def __init__(self):
+        super().__init__(1)
+
+    def submit(self, fn, /, *args, **kwargs):
+        return super().submit(eventlet.tpool.execute, fn, *args, **kwargs)
+
+def bind_eventlet_loop():
+    """Eventlet mode: share the loop of eventlet's asyncio hub, which starts with the server."""
+    from eventlet.hubs import asyncio as asyncio_hub, get_hub
+    hub = get_hub()
+    if not isinstance(hub, asyncio_hub.Hub):
+        # e.g. a gunicorn eventlet worker that picked its hub before importing this module
+        raise RuntimeError("SERVER_MODE=eventlet requires EVENTLET_HUB=asyncio in the environment")
+    hub.loop.set_default_executor(GreenThreadExecutor(EVENTLET_EXECUTOR_THREADS))
+    metrics.set_cpu_executor(TpoolExecutor())
+    bind_event_loop(hub.loop)
+
+def start_event_loop_thread():
+    """ASGI mode without an ASGI server (tests, benchmarks): run the shared loop in a background thread."""
+    loop = asyncio.new_event_loop()
+    threading.Thread(target=loop.run_forever, daemon=True, name="event-loop").start()
+    bind_event_loop(loop)
+    run_on_loop(run_startup_tasks()).result()
 
+def _log_task_error(future):
+    # An HTTPException is a view's normal answer (e.g. ``abort(404)``), re-raised to the caller
+    if not future.cancelled() and future.exception() is not None and not isinstance(future.exception(), HTTPException):
+        logger.error(f"Background task failed: {future.exception()}")
+
+def run_on_loop(coro):
+    """Schedule ``coro`` on the shared loop from any thread; returns a ``concurrent.futures.Future``."""
+    future = asyncio.run_coroutine_threadsafe(coro, event_loop)
+    future.add_done_callback(_log_task_error)
+    return future
+
+def iterate_on_loop(agen):
+    """Drive an async generator on the shared loop from a sync response body, one item per pull.
+
+    Nothing is produced ahead of the client, so a slow download never piles up in memory.
+    """
+    async def next_item():
+        try:
+            return await agen.__anext__()
+        except StopAsyncIteration:
+            return None
+
+    try:
+        while (item := run_on_loop(next_item()).result()) is not None:
+            yield item
+    finally:
+        run_on_loop(agen.aclose())
 
 
 # Flask App Initialization
-app = Flask(__name__)
+class UploadRequest(Request):
+    """Request that streams uploaded file parts straight to disk instead of buffering them.
+
+    Every spooled file is deleted when the request ends unless a view took it over with ``keep_upload``.
+    """
+
+    def __init__(self, *args, **kwargs):
+        super().__init__(*args, **kwargs)
+        self.spooled_paths: List[str] = []
+
+    def _get_file_stream(self, total_content_length, content_type, filename=None, content_length=None):
+        suffix = Path(filename or '').suffix
+        spooled = tempfile.NamedTemporaryFile('wb+', delete=False, dir=UPLOAD_DIR, prefix=UPLOAD_PREFIX, suffix=suffix)
+        self.spooled_paths.append(spooled.name)
+        return spooled
+
+    def keep_upload(self, path: str):
+        """Hand a spooled file over to the caller, who deletes it when done."""
+        self.spooled_paths.remove(path)
+
+    def close(self):
+        super().close()
+        for path in self.spooled_paths:
+            try:
+                os.unlink(path)
+            except FileNotFoundError:
+                pass
+        self.spooled_paths = []
+
+def read_request_body():
+    """Consume the request body in the calling thread, leaving it parsed or cached on ``request``.
+
+    Views on the shared loop must not read it themselves: the ASGI adapter receives the body on
+    that same loop, and under eventlet the read would be a blocking green call on the hub.
+    """
+    if request.mimetype in ('multipart/form-data', 'application/x-www-form-urlencoded'):
+        request.form  # parses the form; file parts are spooled to disk by UploadRequest
+    else:
+        request.get_data()
+
+class MeetingApp(Flask):
+    """Flask app whose ``async def`` views run on the shared loop.
+
+    Flask's default starts a new event loop for every request, which is slow, breaks clients
+    such as Motor that are tied to one loop, and cannot run inside eventlet's asyncio hub.
+    """
+
+    request_class = UploadRequest
+
+    def async_to_sync(self, func):
+        if event_loop is None:
+            return super().async_to_sync(func)
+
+        def run(*args, **kwargs):
+            # Runs in one of the ASGI adapter's threads or an eventlet green thread; the request
+            # context travels with the task
+            read_request_body()
+            return asyncio.run_coroutine_threadsafe(func(*args, **kwargs), event_loop).result()
+        return run
+
+app = MeetingApp(__name__)
 # A secret key is needed for Flask sessions and SocketIO
 app.config['SECRET_KEY'] = os.environ.get('FLASK_SECRET_KEY', 'a_secure_random_secret_key')
 CORS(app)  # Enable CORS for all routes
-# Use 'eventlet' for async support with SocketIO
-socketio = SocketIO(app, async_mode='eventlet', cors_allowed_origins="*")
+# A message queue lets any worker emit to any client
+if SERVER_MODE == 'asgi':
+    # python-socketio's asyncio server, mounted next to the Flask app by asgi.py
+    sio = python_socketio.AsyncServer(
+        async_mode='asgi', cors_allowed_origins="*",
+        client_manager=python_socketio.AsyncRedisManager(SOCKETIO_MESSAGE_QUEUE) if SOCKETIO_MESSAGE_QUEUE else None
+    )
+    socketio = None
+else:
+    # Use 'eventlet' for async support with SocketIO
+    sio = None
+    socketio = SocketIO(
+        app, async_mode='eventlet', cors_allowed_origins="*", message_queue=SOCKETIO_MESSAGE_QUEUE
+    )
+
+
+@app.before_request
+def start_request_timer():
+    g.request_started = time.perf_counter()
+
+@app.after_request
+def record_request_duration(response):
+    started = g.pop('request_started', None)
+    if started is not None:
+        route = request.url_rule.rule if request.url_rule else "unmatched"
+        HTTP_REQUEST_DURATION.observe(
+            time.perf_counter() - started, request.method, route, str(response.status_code)
+        )
+    return response
 
 
 # API Blueprint for modular routing
@@ -80,6 +419,25 @@ class TranscriptSegment(BaseModel):
     speaker: str = "Unknown"
     confidence: float = 0.0
 
+class Job(BaseModel):
+    """Background job record, stored in the ``jobs`` collection and reported by ``/api/jobs/<id>``."""
+    id: str = Field(default_factory=lambda: str(uuid.uuid4()))
+    type: str
+    meeting_id: str
+    status: str = "queued"  # queued, running, completed, failed
+    stage: str = "queued"
+    progress: float = 0.0
+    filename: Optional[str] = None
+    size_bytes: Optional[int] = None
+    error: Optional[str] = None
+    result: Optional[Dict[str, Any]] = None
+    # Worker running the job, its liveness (epoch seconds, see ``heartbeat_jobs``) and the spooled upload
+    worker_id: Optional[str] = None
+    heartbeat_at: float = Field(default_factory=time.time)
+    file_path: Optional[str] = None
+    created_at: datetime = Field(default_factory=datetime.utcnow)
+    updated_at: datetime = Field(default_factory=datetime.utcnow)
+
 class MeetingSummary(BaseModel):
     id: str = Field(default_factory=lambda: str(uuid.uuid4()))
     key_points: List[str] = []
@@ -99,10 +457,27 @@ class Meeting(BaseModel):
     timestamp: datetime = Field(default_factory=datetime.utcnow)
     host: str = "Unknown"
     participants: List[str] = []
-    transcript: List[TranscriptSegment] = []
     summary: Optional[MeetingSummary] = None
     duration: Optional[float] = None
     status: str = "active"  # active, completed, processing
+    segments_count: int = 0
+
+class MeetingListItem(BaseModel):
+    """Lightweight meeting view for history listings (no transcript or summary bodies)."""
+    id: str
+    title: str
+    timestamp: datetime
+    host: str = "Unknown"
+    participants: List[str] = []
+    duration: Optional[float] = None
+    status: str = "active"
+    segments_count: int = 0
+
+# Meeting metadata only; transcripts live in transcript_buckets (legacy embedded ones are skipped)
+MEETING_PROJECTION = {"_id": 0, "transcript": 0}
+
+# Projection matching MeetingListItem so listings never load transcript/summary bodies
+MEETING_LIST_PROJECTION = {"_id": 0, **{field: 1 for field in MeetingListItem.model_fields}}
 
 class MeetingCreate(BaseModel):
     title: str
@@ -137,42 +512,90 @@ async def create_meeting():
 
 @api_bp.route("/meetings", methods=['GET'])
 async def get_meetings():
-    """Get all meetings with optional search and filtering"""
+    """List meetings newest first, with optional search/participant filters and keyset paging.
+
+    Query params: ``search``, ``participant``, ``limit`` and ``cursor`` (the ``next_cursor``
+    returned by the previous page).
+    """
+    try:
+        query = keyset_filter(request.args.get('cursor'))
+    except ValueError as e:
+        abort(400, description=str(e))
     try:
         search = request.args.get('search')
         participant = request.args.get('participant')
-        query = {}
+        limit = min(max(request.args.get('limit', MEETINGS_PAGE_SIZE, type=int), 1), MEETINGS_MAX_PAGE_SIZE)
         if search:
-            query["$or"] = [
-                {"title": {"$regex": search, "$options": "i"}},
-                {"host": {"$regex": search, "$options": "i"}}
-            ]
+            query["$text"] = {"$search": search}
         if participant:
-            query["participants"] = {"$in": [participant]}
-        
-        meetings_cursor = db.meetings.find(query).sort("timestamp", -1)
-        meetings = await meetings_cursor.to_list(100)
-        # Pydantic validation is implicitly handled by the list comprehension
-        return jsonify([Meeting(**m).model_dump() for m in meetings])
+            query["participants"] = participant
+
+        meetings_cursor = (
+            db.meetings.find(query, MEETING_LIST_PROJECTION)
+            .sort([("timestamp", DESCENDING), ("id", DESCENDING)])
+            .limit(limit + 1)
+        )
+        meetings = await meetings_cursor.to_list(limit + 1)
+        next_cursor = None
+        if len(meetings) > limit:
+            meetings = meetings[:limit]
+            next_cursor = encode_cursor(meetings[-1]["timestamp"], meetings[-1]["id"])
+        return jsonify({"meetings": meetings, "next_cursor": next_cursor})
     except Exception as e:
         logger.error(f"Error fetching meetings: {str(e)}")
         abort(500, description=str(e))
 
+@api_bp.route("/export", methods=['GET'])
+def export_meetings():
+    """Stream meetings with their summaries and transcripts as a download.
+
+    Query params: ``format`` (``ndjson``, one meeting per line, the default; ``csv``, one row per
+    transcript segment; ``markdown``, a zip with one file per meeting), ``from``/``to`` (ISO
+    dates, on the meeting timestamp), ``participant`` and ``search``.
+    """
+    export_format = request.args.get('format', 'ndjson')
+    if export_format not in EXPORT_FORMATS:
+        abort(400, description=f"'format' must be one of {', '.join(EXPORT_FORMATS)}")
+    try:
+        start = datetime.fromisoformat(request.args['from']) if request.args.get('from') else None
+        end = datetime.fromisoformat(request.args['to']) if request.args.get('to') else None
+    except ValueError:
+        abort(400, description="'from' and 'to' must be ISO dates")
+    query = export_query(start, end, request.args.get('participant'), request.args.get('search'))
+    exporter = MeetingExporter(db.meetings, transcript_store, batch_size=EXPORT_BATCH_SIZE,
+                               chunk_bytes=EXPORT_CHUNK_BYTES)
+    content_type, extension = EXPORT_FORMATS[export_format]
+    filename = f"meetings-{datetime.utcnow():%Y%m%d-%H%M%S}.{extension}"
+
+    def body():
+        yield from iterate_on_loop(exporter.stream(export_format, query))
+        logger.info(f"Exported {exporter.meetings_exported} meetings as {export_format} "
+                    f"({exporter.bytes_exported} bytes)")
+
+    return Response(body(), content_type=content_type,
+                    headers={"Content-Disposition": f'attachment; filename="{filename}"'})
+
 @api_bp.route("/meetings/<string:meeting_id>", methods=['GET'])
 async def get_meeting(meeting_id: str):
-    """Get a specific meeting by ID"""
+    """Get a meeting's metadata and summary; the transcript is read from ``/transcript``."""
     try:
-        meeting = await db.meetings.find_one({"id": meeting_id})
+        meeting = await db.meetings.find_one({"id": meeting_id}, MEETING_PROJECTION)
         if not meeting:
             abort(404, description="Meeting not found")
         return jsonify(Meeting(**meeting).model_dump())
+    except HTTPException:
+        raise
     except Exception as e:
         logger.error(f"Error fetching meeting {meeting_id}: {str(e)}")
         abort(500, description=str(e))
 
 @api_bp.route("/meetings/<string:meeting_id>/transcript", methods=['POST'])
 async def save_transcript(meeting_id: str):
-    """Save transcript segments for a meeting"""
+    """Save transcript segments for a meeting.
+
+    If a live session already persisted the transcript server-side, that copy is authoritative:
+    the client's array (same speech, client-side ids and timestamps) is not stored over it.
+    """
     if not request.is_json:
         abort(400, description="Invalid content type, expected application/json")
     try:
@@ -181,134 +604,416 @@ async def save_transcript(meeting_id: str):
         
         transcript_segments = [TranscriptSegment(**seg).model_dump() for seg in segments_data]
         
-        result = await db.meetings.update_one(
-            {"id": meeting_id},
-            {"$set": {"transcript": transcript_segments, "status": "completed"}}
+        meeting = await db.meetings.find_one_and_update(
+            {"id": meeting_id}, {"$set": {"status": "completed"}},
+            projection={"_id": 0, "live_transcript": 1, "segments_count": 1}
         )
-        if result.matched_count == 0:
+        if not meeting:
             abort(404, description="Meeting not found")
+        if meeting.get("live_transcript"):
+            logger.info(f"Kept live transcript of meeting {meeting_id}, ignored {len(transcript_segments)} client segments")
+            return jsonify({"message": "Transcript already saved by the live session",
+                            "segments_count": meeting.get("segments_count", 0)})
+        await db.meetings.update_one({"id": meeting_id}, {"$set": {"segments_count": len(transcript_segments)}})
+        await transcript_store.replace(meeting_id, transcript_segments)
+        await segment_index.replace_meeting(meeting_id, transcript_segments)
         
         logger.info(f"Saved transcript for meeting: {meeting_id}")
         return jsonify({"message": "Transcript saved successfully", "segments_count": len(transcript_segments)})
     except ValidationError as e:
         abort(422, description=e.errors())
+    except HTTPException:
+        raise
     except Exception as e:
         logger.error(f"Error saving transcript for {meeting_id}: {str(e)}")
         abort(500, description=str(e))
 
+@api_bp.route("/meetings/<string:meeting_id>/transcript", methods=['GET'])
+async def get_transcript(meeting_id: str):
+    """Transcript segments of a meeting, optionally limited to ``from``/``to`` (seconds into the meeting)."""
+    try:
+        start = float(request.args['from']) if request.args.get('from') else None
+        end = float(request.args['to']) if request.args.get('to') else None
+    except ValueError:
+        abort(400, description="'from' and 'to' must be numbers of seconds")
+    try:
+        if not await db.meetings.find_one({"id": meeting_id}, {"_id": 1}):
+            abort(404, description="Meeting not found")
+        segments = await transcript_store.read_range(meeting_id, start, end)
+        return jsonify({"meeting_id": meeting_id, "from": start, "to": end, "segments": segments})
+    except HTTPException:
+        raise
+    except Exception as e:
+        logger.error(f"Error reading transcript for {meeting_id}: {str(e)}")
+        abort(500, description=str(e))
+
 @api_bp.route("/meetings/<string:meeting_id>/transcribe-file", methods=['POST'])
 async def transcribe_audio_file(meeting_id: str):
-    """Transcribe uploaded audio file using Deepgram"""
+    """Queue an uploaded audio file for transcription using Deepgram.
+
+    The upload is written to disk while the request is parsed (see ``UploadRequest``) and the
+    work runs on the transcription job pool. Returns ``202`` with the job id; poll
+    ``/api/jobs/<id>`` or listen for ``job_progress`` events in the meeting room.
+    Set the form field ``auto_summarize=true`` to summarize once the transcript is stored.
+    """
     if 'audio_file' not in request.files:
         abort(400, description="No 'audio_file' part in the request")
-    
-    audio_file = request.files['audio_file']
-    if audio_file.filename == '':
-        abort(400, description="No selected file")
 
-    temp_file_path = None
+    audio_file = request.files['audio_file']
     try:
-        audio_data = audio_file.read()
-        with tempfile.NamedTemporaryFile(delete=False, suffix=f".{audio_file.filename.split('.')[-1]}") as temp_file:
-            temp_file.write(audio_data)
-            temp_file_path = temp_file.name
+        if audio_file.filename == '':
+            abort(400, description="No selected file")
+        if not await db.meetings.find_one({"id": meeting_id}, {"_id": 1}):
+            abort(404, description="Meeting not found")
+        audio_file.stream.close()
+        temp_file_path = audio_file.stream.name
 
-        options = PrerecordedOptions(
-            model="nova-2", smart_format=True, punctuate=True, diarize=True, utterances=True
+        job = Job(
+            type="transcription", meeting_id=meeting_id, filename=audio_file.filename,
+            size_bytes=os.path.getsize(temp_file_path), worker_id=WORKER_ID, file_path=temp_file_path
         )
-        with open(temp_file_path, "rb") as audio:
-            source = {"buffer": audio, "mimetype": audio_file.mimetype}
-            # The Deepgram SDK call is blocking, run in a thread
-            response = await asyncio.to_thread(
-                deepgram_client.listen.prerecorded.v("1").transcribe_file, source, options
+        await db.jobs.insert_one(job.model_dump())
+        try:
+            transcription_jobs.submit(
+                job.id, run_transcription_job, job.id, meeting_id, temp_file_path, audio_file.mimetype,
+                auto_summarize=request.form.get('auto_summarize', '').lower() == 'true'
             )
+        except JobQueueFull:
+            await db.jobs.delete_one({"id": job.id})
+            abort(503, description="Transcription queue is full, try again later")
+        request.keep_upload(temp_file_path)  # owned by the job now
+        await db.meetings.update_one({"id": meeting_id}, {"$set": {"status": "processing"}})
 
-        transcript_segments = []
-        if response.results and response.results.utterances:
-             for utterance in response.results.utterances:
-                transcript_segments.append(TranscriptSegment(
-                    text=utterance.transcript,
-                    timestamp=utterance.start,
-                    speaker=f"Speaker {utterance.speaker}",
-                    confidence=utterance.confidence
-                ).model_dump())
+        logger.info(f"Queued transcription job {job.id} for meeting: {meeting_id} ({job.size_bytes} bytes)")
+        return jsonify({
+            "message": "Audio queued for transcription",
+            "job_id": job.id,
+            "status": job.status,
+            "status_url": f"/api/jobs/{job.id}"
+        }), 202
+    except HTTPException:
+        raise
+    except Exception as e:
+        logger.error(f"Error queueing audio for {meeting_id}: {str(e)}")
+        abort(500, description=f"Transcription error: {str(e)}")
 
-        result = await db.meetings.update_one(
-            {"id": meeting_id},
-            {"$set": {"transcript": transcript_segments, "status": "completed"}}
+@api_bp.route("/jobs/<string:job_id>", methods=['GET'])
+async def get_job(job_id: str):
+    """Get status and progress of a background job"""
+    job = await db.jobs.find_one({"id": job_id}, {"_id": 0, "file_path": 0})
+    if not job:
+        abort(404, description="Job not found")
+    return jsonify(job)
+
+@api_bp.route("/search", methods=['GET'])
+async def search_transcripts():
+    """Full-text search over transcript segments of all meetings.
+
+    Query params: ``q`` (required), ``meeting_id``, ``limit`` and ``cursor``. Hits are ranked by
+    relevance and carry the segment timestamp, speaker and a highlighted snippet.
+    """
+    search = request.args.get('q', '').strip()
+    if not search:
+        abort(400, description="'q' is required.")
+    limit = min(max(request.args.get('limit', MEETINGS_PAGE_SIZE, type=int), 1), MEETINGS_MAX_PAGE_SIZE)
+    try:
+        hits, next_cursor = await segment_index.search(
+            search, cursor=request.args.get('cursor'), limit=limit,
+            meeting_id=request.args.get('meeting_id')
         )
-        if result.matched_count == 0:
+    except ValueError as e:
+        abort(400, description=str(e))
+    except Exception as e:
+        logger.error(f"Error searching transcripts for '{search}': {str(e)}")
+        abort(500, description=str(e))
+    return jsonify({"hits": hits, "next_cursor": next_cursor})
+
+@api_bp.route("/meetings/<string:meeting_id>/related", methods=['GET'])
+async def get_related_meetings(meeting_id: str):
+    """Meetings whose transcripts and summaries are most similar (TF-IDF cosine) to this one.
+
+    Query params: ``limit``. Meetings are indexed when summarized; one that is not yet indexed is
+    indexed from its stored transcript first.
+    """
+    limit = min(max(request.args.get('limit', 10, type=int), 1), MEETINGS_MAX_PAGE_SIZE)
+    try:
+        meeting = await db.meetings.find_one({"id": meeting_id}, {"_id": 0, "summary": 1})
+        if not meeting:
             abort(404, description="Meeting not found")
+        # Pick up meetings other workers indexed before deciding this one needs vectorizing
+        await meeting_similarity.sync()
+        if meeting_id not in meeting_similarity:
+            await meeting_similarity.update_meeting(
+                meeting_id, await transcript_store.read_range(meeting_id), meeting.get("summary")
+            )
+        scores = dict(await meeting_similarity.related(meeting_id, limit=limit))
+        related = await db.meetings.find({"id": {"$in": list(scores)}}, MEETING_LIST_PROJECTION).to_list(len(scores))
+        related.sort(key=lambda item: scores[item["id"]], reverse=True)
+        return jsonify({"meeting_id": meeting_id,
+                        "related": [{**item, "score": round(scores[item["id"]], 4)} for item in related]})
+    except HTTPException:
+        raise
+    except Exception as e:
+        logger.error(f"Error finding meetings related to {meeting_id}: {str(e)}")
+        abort(500, description=str(e))
 
-        logger.info(f"Transcribed audio file for meeting: {meeting_id}")
-        return jsonify({
-            "message": "Audio transcribed successfully",
-            "segments_count": len(transcript_segments),
-            "transcript": transcript_segments
-        })
+@api_bp.route("/action-items/open", methods=['GET'])
+async def get_open_action_items():
+    """Action items and unresolved issues across all summarized meetings, near-duplicates clustered.
+
+    Query params: ``section`` (``action_items`` or ``unresolved_issues``; both by default),
+    ``threshold`` (cosine similarity that links two items, default 0.6), ``min_count`` (only
+    clusters repeated in at least this many meetings) and ``limit``. Clusters are ordered by how
+    many meetings repeat them; each lists its occurrences newest first.
+    """
+    section = request.args.get('section')
+    if section and section not in ITEM_SECTIONS:
+        abort(400, description=f"'section' must be one of {', '.join(ITEM_SECTIONS)}")
+    threshold = min(max(request.args.get('threshold', 0.6, type=float), 0.0), 1.0)
+    min_count = max(request.args.get('min_count', 1, type=int), 1)
+    limit = min(max(request.args.get('limit', MEETINGS_PAGE_SIZE, type=int), 1), MEETINGS_MAX_PAGE_SIZE)
+    try:
+        groups = await meeting_similarity.item_clusters(threshold, (section,) if section else ITEM_SECTIONS)
+        groups = [group for group in groups if len({item["meeting_id"] for item in group}) >= min_count]
+        groups.sort(key=lambda group: len({item["meeting_id"] for item in group}), reverse=True)
+        groups = groups[:limit]
+
+        meeting_ids = list({item["meeting_id"] for group in groups for item in group})
+        meetings = {m["id"]: m for m in await db.meetings.find(
+            {"id": {"$in": meeting_ids}}, {"_id": 0, "id": 1, "title": 1, "timestamp": 1}
+        ).to_list(len(meeting_ids))}
+        clusters = []
+        for group in groups:
+            occurrences = sorted(
+                ({**item, "title": meetings.get(item["meeting_id"], {}).get("title"),
+                  "timestamp": meetings.get(item["meeting_id"], {}).get("timestamp")} for item in group),
+                key=lambda item: item["timestamp"] or datetime.min, reverse=True
+            )
+            clusters.append({
+                "text": occurrences[0]["text"],
+                "section": occurrences[0]["section"],
+                "meetings": len({item["meeting_id"] for item in group}),
+                "first_seen": occurrences[-1]["timestamp"],
+                "last_seen": occurrences[0]["timestamp"],
+                "occurrences": occurrences,
+            })
+        return jsonify({"clusters": clusters})
     except Exception as e:
-        logger.error(f"Error transcribing audio for {meeting_id}: {str(e)}")
-        abort(500, description=f"Transcription error: {str(e)}")
-    finally:
-        if temp_file_path and os.path.exists(temp_file_path):
-            os.unlink(temp_file_path)
+        logger.error(f"Error clustering open action items: {str(e)}")
+        abort(500, description=str(e))
+
+async def generate_summary(meeting_id: str, segments: List[Dict[str, Any]], refresh: bool = False,
+                           on_section=None):
+    """Summarize ``segments`` (from the summary cache unless ``refresh``) and store it on the meeting.
+
+    With ``on_section``, the completion is streamed and ``on_section(section, items)`` is awaited
+    for each section as soon as it is complete; the summary is still validated and stored once.
+    Returns ``(summary, cached, timings)``, or ``None`` when the meeting does not exist.
+    """
+    started = time.perf_counter()
+    cache_key = summary_cache_key(
+        "\n".join(format_segment(seg) for seg in segments), summarizer.model, summarizer.cache_version
+    )
+    summary_data = None if refresh else await summary_cache.get(cache_key)
+    cached = summary_data is not None
+    timings = None
+    if cached and on_section is not None:
+        for section in SUMMARY_SECTIONS:
+            await on_section(section, summary_data.get(section, []))
+    if not cached:
+        summary_data, timings = await summarizer.summarize(segments, on_section=on_section)
+        if "first_section_ms" in timings:
+            SUMMARY_FIRST_SECTION.observe(timings["first_section_ms"] / 1000)
+        for chunk_ms in timings["chunk_ms"]:
+            OPENAI_REQUEST_DURATION.observe(chunk_ms / 1000, summarizer.model)
+        SUMMARY_TOKENS.observe(timings["prompt_tokens"], summarizer.model, "prompt")
+        SUMMARY_TOKENS.observe(timings["completion_tokens"], summarizer.model, "completion")
+    SUMMARY_DURATION.observe(time.perf_counter() - started, str(cached).lower())
+    summary = MeetingSummary(**summary_data)
+    if not cached:
+        await summary_cache.set(cache_key, summary.model_dump(exclude={"id"}), model=summarizer.model)
+
+    result = await db.meetings.update_one(
+        {"id": meeting_id},
+        {"$set": {"summary": summary.model_dump()}}
+    )
+    if result.matched_count == 0:
+        return None
+    try:
+        await meeting_similarity.update_meeting(meeting_id, segments, summary.model_dump())
+    except Exception as e:
+        logger.error(f"Error indexing meeting {meeting_id} for similarity: {str(e)}")
+    return summary, cached, timings
+
+@api_bp.route("/metrics", methods=['GET'])
+def get_metrics():
+    """Request, provider, database and live-session metrics of this worker in Prometheus text format."""
+    return Response(metrics.REGISTRY.render(), content_type=metrics.CONTENT_TYPE)
+
+@api_bp.route("/live/sessions", methods=['GET'])
+async def get_live_sessions():
+    """Audio ingestion stats of the live sessions handled by this worker"""
+    return jsonify({sid: ingest.stats() for sid, ingest in audio_ingests.items()})
+
+async def load_summary_segments(meeting_id: str, data: Dict[str, Any]) -> List[Dict[str, Any]]:
+    """Segments to summarize: ``transcript_text`` from the request body, else the stored transcript."""
+    transcript_text = data.get('transcript_text')
+    if transcript_text:
+        segments = segments_from_text(transcript_text)
+    else:
+        if not await db.meetings.find_one({"id": meeting_id}, {"_id": 1}):
+            abort(404, description="Meeting not found")
+        segments = await transcript_store.read_range(meeting_id)
+    if not segments:
+        abort(400, description="'transcript_text' is required.")
+    return segments
+
+def sse_event(event: str, data: Any) -> str:
+    return f"event: {event}\ndata: {json.dumps(data, default=str)}\n\n"
 
 @api_bp.route("/meetings/<string:meeting_id>/summarize", methods=['POST'])
 async def summarize_meeting(meeting_id: str):
-    """Generate AI summary using OpenAI GPT-4o"""
+    """Generate AI summary using OpenAI GPT-4o.
+
+    Uses ``transcript_text`` from the body when given, otherwise the stored transcript. Long
+    transcripts are summarized chunk by chunk (see ``ChunkedSummarizer``). Summaries are cached by
+    transcript content; pass ``"refresh": true`` to regenerate.
+    """
     if not request.is_json:
         abort(400, description="Invalid content type, expected application/json")
     try:
         data = request.get_json()
-        transcript_text = data.get('transcript_text')
-        if not transcript_text:
-            abort(400, description="'transcript_text' is required.")
-
-        prompt = f"""
-        Please analyze the following meeting transcript and provide a comprehensive summary in JSON format with these exact sections:
-        Meeting Transcript: {transcript_text}
-        Please respond with a JSON object containing:
-        {{
-            "key_points": ["..."], "decisions_made": ["..."], "action_items": ["..."], "assignees": ["..."], "deadlines": ["..."],
-            "attendee_recommendations": ["..."], "ai_recommendations": ["..."], "unresolved_issues": ["..."], "followup_reminders": ["..."], "references": ["..."]
-        }}
-        Make each section specific and actionable. If a section doesn't apply, include an empty array.
-        """
-        
-        # OpenAI SDK call is blocking, run in a thread
-        response = await asyncio.to_thread(
-            openai.chat.completions.create,
-            model="gpt-4o",
-            messages=[
-                {"role": "system", "content": "You are a professional meeting assistant that creates structured, actionable meeting summaries."},
-                {"role": "user", "content": prompt}
-            ],
-            max_tokens=2000,
-            temperature=0.3
-        )
-        
-        summary_text = response.choices[0].message.content
-        summary_data = json.loads(summary_text)
-        summary = MeetingSummary(**summary_data)
-        
-        result = await db.meetings.update_one(
-            {"id": meeting_id},
-            {"$set": {"summary": summary.model_dump()}}
-        )
-        if result.matched_count == 0:
+        segments = await load_summary_segments(meeting_id, data)
+        generated = await generate_summary(meeting_id, segments, refresh=bool(data.get('refresh')))
+        if generated is None:
             abort(404, description="Meeting not found")
+        summary, cached, timings = generated
 
-        logger.info(f"Generated summary for meeting: {meeting_id}")
-        return jsonify({"message": "Summary generated successfully", "summary": summary.model_dump()})
+        if cached:
+            logger.info(f"Served cached summary for meeting: {meeting_id}")
+        else:
+            logger.info(f"Generated summary for meeting: {meeting_id} ({timings['chunks']} chunks, {timings['total_ms']} ms)")
+        return jsonify({
+            "message": "Summary generated successfully", "summary": summary.model_dump(),
+            "cached": cached, "timings": timings
+        })
+    except HTTPException:
+        raise
     except json.JSONDecodeError:
         abort(500, description="AI summary response was not valid JSON.")
     except Exception as e:
         logger.error(f"Error generating summary for {meeting_id}: {str(e)}")
         abort(500, description=f"Summary generation error: {str(e)}")
 
+@api_bp.route("/meetings/<string:meeting_id>/summarize/stream", methods=['POST'])
+def stream_meeting_summary(meeting_id: str):
+    """Generate the summary like ``/summarize``, streaming each section as it completes.
+
+    Responds with Server-Sent Events: ``section`` (``{"section", "items"}``) per summary section,
+    then ``summary`` with the validated, stored summary, or ``error``. The same sections are
+    emitted as ``summary_section`` Socket.IO events to the meeting room.
+    """
+    if not request.is_json:
+        abort(400, description="Invalid content type, expected application/json")
+    data = request.get_json()
+    # Validate up front so a missing meeting or transcript is a plain HTTP error, not an event
+    segments = run_on_loop(load_summary_segments(meeting_id, data)).result()
+    events: queue.Queue = queue.Queue()
+
+    async def on_section(section: str, items: List[str]):
+        events.put(("section", {"section": section, "items": items}))
+        await emit('summary_section', {"meeting_id": meeting_id, "section": section, "items": items}, to=meeting_id)
+
+    async def produce():
+        try:
+            generated = await generate_summary(meeting_id, segments, refresh=bool(data.get('refresh')),
+                                               on_section=on_section)
+            if generated is None:
+                events.put(("error", {"status": 404, "description": "Meeting not found"}))
+                return
+            summary, cached, timings = generated
+            events.put(("summary", {"summary": summary.model_dump(), "cached": cached, "timings": timings}))
+            logger.info(f"Streamed summary for meeting: {meeting_id} (cached={cached})")
+        except Exception as e:
+            logger.error(f"Error streaming summary for {meeting_id}: {str(e)}")
+            events.put(("error", {"status": 500, "description": f"Summary generation error: {str(e)}"}))
+        finally:
+            events.put(None)
+
+    run_on_loop(produce())
+
+    def stream():
+        while (item := events.get()) is not None:
+            yield sse_event(*item)
+
+    return Response(stream(), content_type="text/event-stream",
+                    headers={"Cache-Control": "no-cache", "X-Accel-Buffering": "no"})
+
+@api_bp.route("/summary-cache/stats", methods=['GET'])
+async def summary_cache_stats():
+    """Hit/miss counters and size of the summary cache in this worker."""
+    return jsonify(summary_cache.stats())
+
+async def render_meeting_email(meeting: Meeting):
+    """Subject and plain-text body of the summary email; rendered once per send request."""
+    transcript_lines = []
+    async for seg in transcript_store.iter_segments(meeting.id):
+        transcript_lines.append(
+            f"[{seg.get('timestamp', 0.0):.1f}s] {seg.get('speaker', 'Unknown')}: {seg.get('text', '')}"
+        )
+    transcript_text = "\n".join(transcript_lines)
+    summary_text = "No summary available."
+    if meeting.summary:
+        s = meeting.summary
+        summary_text = f"🔑 KEY POINTS:\n" + "\n".join(f"• {p}" for p in s.key_points) + "\n\n" \
+                     + f"✅ ACTION ITEMS:\n" + "\n".join(f"• {i}" for i in s.action_items)
+
+    email_body = f"Summary for {meeting.title}:\n\n{summary_text}\n\n---\nFull Transcript:\n{transcript_text}"
+    return f"Meeting Summary: {meeting.title}", email_body
+
+def send_email_batch(sender: Dict[str, Any], recipients: List[str], subject: str, body: str):
+    """Send one SendGrid request with a separate personalization per recipient."""
+    message = Mail(
+        from_email=From(sender["email"], sender.get("name")),
+        to_emails=recipients,
+        subject=subject,
+        plain_text_content=body,
+        is_multiple=True
+    )
+    started = time.perf_counter()
+    try:
+        response = sg.send(message)
+    except Exception:
+        SENDGRID_SEND_DURATION.observe(time.perf_counter() - started, "error")
+        raise
+    SENDGRID_SEND_DURATION.observe(time.perf_counter() - started, "ok" if response.status_code < 400 else "error")
+    if response.status_code >= 400:
+        raise RuntimeError(f"SendGrid returned {response.status_code}")
+    return response
+
+email_outbox = EmailOutbox(
+    db.email_logs, send_email_batch, owner=WORKER_ID, batch_size=EMAIL_BATCH_SIZE,
+    max_concurrency=EMAIL_MAX_CONCURRENCY, max_attempts=EMAIL_MAX_ATTEMPTS, base_delay=EMAIL_RETRY_BASE_DELAY,
+    lease_ttl=EMAIL_LEASE_TTL
+)
+# Outbox ids this worker has queued but not finished a round of, so the sweeper doesn't queue them twice
+queued_outbox_ids = set()
+
+def submit_email_delivery(outbox_id: str):
+    """Queue one delivery round of an outbox entry; raises ``JobQueueFull`` when the email queue is full."""
+    if outbox_id in queued_outbox_ids:
+        return
+    future = email_jobs.submit(outbox_id, email_outbox.deliver, outbox_id)
+    queued_outbox_ids.add(outbox_id)
+    future.add_done_callback(lambda _: queued_outbox_ids.discard(outbox_id))
+
 @api_bp.route("/meetings/<string:meeting_id>/send-email", methods=['POST'])
 async def send_meeting_email(meeting_id: str):
-    """Send meeting summary via email using SendGrid"""
+    """Queue the meeting summary email for the given recipients.
+
+    The message is stored in the ``email_logs`` outbox and delivered in the background with
+    per-recipient status and retries. Returns ``202`` with the outbox id.
+    """
     if not request.is_json:
         abort(400, description="Invalid content type, expected application/json")
     try:
@@ -317,108 +1022,449 @@ async def send_meeting_email(meeting_id: str):
         if not recipient_emails:
             abort(400, description="'recipient_emails' list is required.")
 
-        meeting_doc = await db.meetings.find_one({"id": meeting_id})
+        meeting_doc = await db.meetings.find_one({"id": meeting_id}, MEETING_PROJECTION)
         if not meeting_doc:
             abort(404, description="Meeting not found")
         
         meeting = Meeting(**meeting_doc)
-        
-        transcript_text = "\n".join([f"[{seg.timestamp:.1f}s] {seg.speaker}: {seg.text}" for seg in meeting.transcript])
-        summary_text = "No summary available."
-        if meeting.summary:
-            s = meeting.summary
-            summary_text = f"🔑 KEY POINTS:\n" + "\n".join(f"• {p}" for p in s.key_points) + "\n\n" \
-                         + f"✅ ACTION ITEMS:\n" + "\n".join(f"• {i}" for i in s.action_items)
-        
-        email_body = f"Summary for {meeting.title}:\n\n{summary_text}\n\n---\nFull Transcript:\n{transcript_text}"
-        
-        for email in recipient_emails:
-            message = Mail(
-                from_email=req_data.get('sender_email', 'meetings@example.com'),
-                to_emails=email,
-                subject=f"Meeting Summary: {meeting.title}",
-                plain_text_content=email_body
-            )
-            # SendGrid SDK call is blocking, run in a thread
-            await asyncio.to_thread(sg.send, message)
-            logger.info(f"Email sent to {email} for meeting {meeting_id}")
+        subject, email_body = await render_meeting_email(meeting)
+        sender = {
+            "email": req_data.get('sender_email', 'meetings@example.com'),
+            "name": req_data.get('sender_name')
+        }
+        outbox_id = await email_outbox.enqueue(meeting_id, sender, subject, email_body, recipient_emails)
+        try:
+            submit_email_delivery(outbox_id)
+        except JobQueueFull:
+            # Stays pending in the outbox; the sweeper queues it once there is room
+            logger.warning(f"Email queue full, outbox {outbox_id} left pending for the sweeper")
 
-        await db.email_logs.insert_one({
-            "meeting_id": meeting_id, "recipients": recipient_emails, "sent_at": datetime.utcnow()
-        })
-        return jsonify({"message": f"Email sent to {len(recipient_emails)} recipients"})
+        logger.info(f"Queued email to {len(recipient_emails)} recipients for meeting {meeting_id} (outbox {outbox_id})")
+        return jsonify({
+            "message": f"Email queued for {len(recipient_emails)} recipients",
+            "outbox_id": outbox_id,
+            "status_url": f"/api/email-outbox/{outbox_id}"
+        }), 202
+    except HTTPException:
+        raise
     except Exception as e:
         logger.error(f"Error sending email for {meeting_id}: {str(e)}")
         abort(500, description=f"Email sending error: {str(e)}")
 
+@api_bp.route("/email-outbox/<string:outbox_id>", methods=['GET'])
+async def get_email_outbox(outbox_id: str):
+    """Delivery status of a queued meeting email, per recipient"""
+    entry = await db.email_logs.find_one({"id": outbox_id}, {"_id": 0, "body": 0})
+    if not entry:
+        abort(404, description="Outbox entry not found")
+    return jsonify(entry)
+
+
+# --- Background Jobs ---
+
+async def update_job(job_id: str, meeting_id: str, **fields):
+    """Persist job progress and push it to clients in the meeting room."""
+    fields["updated_at"] = datetime.utcnow()
+    await db.jobs.update_one({"id": job_id}, {"$set": fields})
+    event = {key: value for key, value in fields.items() if key != "updated_at"}
+    await emit('job_progress', {"job_id": job_id, "meeting_id": meeting_id, **event}, to=meeting_id)
+
+async def run_transcription_job(job_id: str, meeting_id: str, file_path: str, mimetype: str,
+                                auto_summarize: bool = False):
+    """Transcribe an uploaded file with Deepgram, store the transcript and optionally summarize it."""
+    try:
+        await update_job(job_id, meeting_id, status="running", stage="transcribing", progress=0.1)
+        options = PrerecordedOptions(
+            model="nova-2", smart_format=True, punctuate=True, diarize=True, utterances=True
+        )
+        with open(file_path, "rb") as audio:
+            source = {"buffer": audio, "mimetype": mimetype}
+            # The Deepgram SDK call is blocking, run in a thread
+            with DEEPGRAM_PRERECORDED_DURATION.time():
+                response = await metrics.to_thread(
+                    "deepgram_prerecorded",
+                    deepgram_client.listen.prerecorded.v("1").transcribe_file, source, options
+                )
+
+        transcript_segments = []
+        if response.results and response.results.utterances:
+            for utterance in response.results.utterances:
+                transcript_segments.append(TranscriptSegment(
+                    text=utterance.transcript,
+                    timestamp=utterance.start,
+                    speaker=f"Speaker {utterance.speaker}",
+                    confidence=utterance.confidence
+                ).model_dump())
+
+        await update_job(job_id, meeting_id, stage="saving", progress=0.7)
+        await transcript_store.replace(meeting_id, transcript_segments)
+        await db.meetings.update_one(
+            {"id": meeting_id},
+            {"$set": {"segments_count": len(transcript_segments), "status": "completed", "live_transcript": False}}
+        )
+        await segment_index.replace_meeting(meeting_id, transcript_segments)
+        result = {"segments_count": len(transcript_segments), "summarized": False}
+
+        if auto_summarize and transcript_segments:
+            await update_job(job_id, meeting_id, stage="summarizing", progress=0.8)
+            result["summarized"] = await generate_summary(meeting_id, transcript_segments) is not None
+
+        await update_job(job_id, meeting_id, status="completed", stage="done", progress=1.0, result=result)
+        logger.info(f"Transcribed audio file for meeting: {meeting_id} (job {job_id})")
+    except Exception as e:
+        logger.error(f"Error transcribing audio for {meeting_id} (job {job_id}): {str(e)}")
+        await update_job(job_id, meeting_id, status="failed", error=str(e))
+        await db.meetings.update_one({"id": meeting_id, "status": "processing"}, {"$set": {"status": "active"}})
+    finally:
+        if os.path.exists(file_path):
+            os.unlink(file_path)
+
+
+async def heartbeat_jobs():
+    """Mark this worker's unfinished jobs as alive."""
+    await db.jobs.update_many(
+        {"worker_id": WORKER_ID, "status": {"$in": ["queued", "running"]}}, {"$set": {"heartbeat_at": time.time()}}
+    )
+
+async def reap_orphaned_jobs(grace: float) -> int:
+    """Fail queued/running jobs whose worker stopped heart-beating ``grace`` seconds ago (it died
+    mid-job, so nothing else will finish them): put their meeting back to ``active`` and delete
+    their spooled upload if it is on this host. Returns the number of jobs reaped."""
+    reaped = 0
+    stale = {"status": {"$in": ["queued", "running"]}, "heartbeat_at": {"$lt": time.time() - grace}}
+    # Jobs from before worker ids were recorded have no heartbeat either
+    legacy = {"status": {"$in": ["queued", "running"]}, "heartbeat_at": {"$exists": False}}
+    for query in (stale, legacy):
+        while job := await db.jobs.find_one_and_update(
+            query, {"$set": {"status": "failed", "error": "Interrupted: the worker stopped before the job finished",
+                             "updated_at": datetime.utcnow()}},
+            projection={"_id": 0, "id": 1, "meeting_id": 1, "worker_id": 1, "file_path": 1}
+        ):
+            reaped += 1
+            await emit('job_progress', {"job_id": job["id"], "meeting_id": job["meeting_id"], "status": "failed"},
+                       to=job["meeting_id"])
+            await db.meetings.update_one({"id": job["meeting_id"], "status": "processing"}, {"$set": {"status": "active"}})
+            # Uploads are spooled to the local UPLOAD_DIR of the worker's host
+            file_path = job.get("file_path")
+            if file_path and (job.get("worker_id") or "").split(":")[0] == socket.gethostname():
+                try:
+                    os.unlink(file_path)
+                except FileNotFoundError:
+                    pass
+            logger.warning(f"Job {job['id']} of worker {job.get('worker_id')} was interrupted, marked failed")
+    return reaped
+
+async def remove_stale_uploads() -> int:
+    """Delete spooled uploads left behind by requests or jobs of a crashed process. Returns the number removed."""
+    cursor = db.jobs.find({"status": {"$in": ["queued", "running"]}, "file_path": {"$ne": None}}, {"_id": 0, "file_path": 1})
+    in_use = {job["file_path"] for job in await cursor.to_list(None)}
+    cutoff = time.time() - UPLOAD_STALE_SECONDS
+
+    def remove() -> int:
+        removed = 0
+        for path in Path(UPLOAD_DIR).glob(f"{UPLOAD_PREFIX}*"):
+            try:
+                if str(path) not in in_use and path.stat().st_mtime < cutoff:
+                    path.unlink()
+                    removed += 1
+            except FileNotFoundError:
+                pass
+        return removed
+
+    return await metrics.to_thread("remove_stale_uploads", remove)
+
 
 # --- WebSocket Handlers for Live Transcription ---
 
 # Global dict to track Deepgram connections per client session
 deepgram_connections = {}
+# Per-session buffers of final segments waiting to be written to MongoDB
+transcript_buffers: Dict[str, TranscriptBuffer] = {}
+# Offset (seconds) added to live segment timestamps when a session resumes a meeting
+transcript_offsets: Dict[str, float] = {}
+# Per-session audio coalescing buffers in front of the Deepgram connections
+audio_ingests: Dict[str, AudioIngest] = {}
+# Per-session broadcasters of live transcripts to the meeting room
+live_fanouts: Dict[str, LiveFanout] = {}
+# sid -> (registry entry, expiry) for sessions owned by other workers
+remote_session_owners: Dict[str, Any] = {}
+# sid -> start time, until the session's first interim / first final transcript arrived
+awaiting_first_partial: Dict[str, float] = {}
+awaiting_first_final: Dict[str, float] = {}
+
+# Eventlet mode: events emitted from the loop, sent in order by one green thread
+pending_emits: queue.Queue = queue.Queue()
+
+def send_pending_emits():
+    while True:
+        event, data, to = pending_emits.get()
+        try:
+            socketio.emit(event, data, to=to)
+        except Exception as e:
+            logger.error(f"Error emitting {event}: {e}")
+
+async def emit(event: str, data: Any, to: Optional[str] = None):
+    """Emit a Socket.IO event from async code, in either serving mode."""
+    if sio is not None:
+        await sio.emit(event, data, to=to)
+    else:
+        # Flask-SocketIO's emit is synchronous and may block on the message queue
+        pending_emits.put((event, data, to))
+
+async def broadcast(event: str, data: Any, to: Optional[str] = None):
+    # Looks up ``emit`` at call time so it can be swapped out (see benchmarks/bench_e2e.py)
+    await emit(event, data, to=to)
+
+async def enter_room(sid: str, room: str):
+    if sio is not None:
+        await sio.enter_room(sid, room)
+    else:
+        socketio.server.enter_room(sid, room, namespace='/')
 
 async def on_deepgram_message(result, sid, **kwargs):
     """Callback to handle transcript messages from Deepgram."""
-    transcript = result.channel.alternatives[0].transcript
+    alternative = result.channel.alternatives[0]
+    transcript = alternative.transcript
     if transcript:
-        await socketio.emit('transcript_update', {
-            "type": "transcript",
-            "data": {
-                "text": transcript,
-                "timestamp": datetime.utcnow().timestamp(),
-                "is_final": result.is_final
-            }
-        }, to=sid)
+        pending = awaiting_first_final if result.is_final else awaiting_first_partial
+        if sid in pending:
+            (LIVE_TIME_TO_FIRST_FINAL if result.is_final else LIVE_TIME_TO_FIRST_PARTIAL).observe(
+                time.perf_counter() - pending.pop(sid)
+            )
+        fanout = live_fanouts.get(sid)
+        if fanout is not None:
+            if result.is_final:
+                await fanout.final({
+                    "text": transcript,
+                    "timestamp": datetime.utcnow().timestamp(),
+                    "is_final": True
+                })
+            else:
+                await fanout.interim(transcript)
+        if result.is_final and sid in transcript_buffers:
+            segment = TranscriptSegment(
+                text=transcript,
+                timestamp=transcript_offsets.get(sid, 0.0) + (getattr(result, 'start', 0.0) or 0.0),
+                confidence=getattr(alternative, 'confidence', 0.0) or 0.0
+            )
+            await transcript_buffers[sid].add(segment.model_dump())
 
 async def on_deepgram_error(error, sid, **kwargs):
     """Callback to handle errors from Deepgram."""
     logger.error(f"Deepgram error for sid {sid}: {error}")
-    await socketio.emit('error', {"data": str(error)}, to=sid)
+    await emit('error', {"data": str(error)}, to=sid)
+
+async def on_live_segments_stored(meeting_id: str, segments: List[Dict[str, Any]]):
+    """After a live batch is written: keep the meeting's segment count and the search index current."""
+    await db.meetings.update_one(
+        {"id": meeting_id}, {"$inc": {"segments_count": len(segments)}, "$set": {"live_transcript": True}}
+    )
+    await segment_index.add_segments(meeting_id, segments)
+
+async def start_live_session(sid: str, meeting_id: str):
+    """Open the Deepgram connection and buffers for a live session owned by this worker."""
+    # Resume from whatever was already persisted for this meeting (e.g. after a dropped tab)
+    if not await db.meetings.find_one({"id": meeting_id}, {"_id": 1}):
+        await emit('error', {'data': 'Meeting not found'}, to=sid)
+        return False
+    stored_segments = await transcript_store.read_range(meeting_id)
+    transcript_offsets[sid] = await transcript_store.last_timestamp(meeting_id)
+    transcript_buffers[sid] = TranscriptBuffer(
+        transcript_store, meeting_id,
+        max_segments=TRANSCRIPT_FLUSH_SEGMENTS, max_delay=TRANSCRIPT_FLUSH_SECONDS,
+        on_flush=on_live_segments_stored
+    )
+    if stored_segments:
+        logger.info(f"Resuming meeting {meeting_id} with {len(stored_segments)} stored segments")
+        await emit('transcript_resume', {
+            'meeting_id': meeting_id, 'segments': stored_segments
+        }, to=sid)
+
+    live_fanouts[sid] = LiveFanout(broadcast, meeting_id, sid, debounce=LIVE_INTERIM_DEBOUNCE_SECONDS)
+    dg_connection = deepgram_client.listen.asynclive.v("1")
+    # The SDK calls handlers as handler(connection, result=...) / handler(connection, error=...)
+    dg_connection.on(
+        LiveTranscriptionEvents.Transcript, lambda _, result, **k: on_deepgram_message(result, sid=sid, **k)
+    )
+    dg_connection.on(LiveTranscriptionEvents.Error, lambda _, error, **k: on_deepgram_error(error, sid=sid, **k))
+
+    options = LiveOptions(
+        model="nova-2", punctuate=True, language="en-US",
+        encoding="linear16", channels=1, sample_rate=16000
+    )
+    await dg_connection.start(options)
+    deepgram_connections[sid] = dg_connection
+    awaiting_first_partial[sid] = awaiting_first_final[sid] = time.perf_counter()
+    audio_ingests[sid] = AudioIngest(
+        dg_connection.send, sample_rate=options.sample_rate, channels=options.channels,
+        frame_ms=AUDIO_FRAME_MS, max_queued_frames=AUDIO_MAX_QUEUED_FRAMES, policy=AUDIO_OVERFLOW_POLICY
+    )
+    await session_registry.claim(sid, meeting_id)
+    return True
+
+async def stop_live_session(sid: str):
+    """Flush and close everything this worker holds for a live session."""
+    if sid in audio_ingests:
+        ingest = audio_ingests.pop(sid)
+        await ingest.close()
+        logger.info(f"Audio stats for {sid}: {ingest.stats()}")
+    if sid in deepgram_connections:
+        dg_connection = deepgram_connections.pop(sid)
+        await dg_connection.finish()
+        logger.info(f"Finished Deepgram connection for {sid}")
+    awaiting_first_partial.pop(sid, None)
+    awaiting_first_final.pop(sid, None)
+    if sid in live_fanouts:
+        fanout = live_fanouts.pop(sid)
+        fanout.close()
+        LIVE_INTERIM_RESULTS.inc(fanout.interims_received, "received")
+        LIVE_INTERIM_RESULTS.inc(fanout.interims_sent, "broadcast")
+        logger.info(f"Fan-out stats for {sid}: {fanout.stats()}")
+    # Persist any final segments still waiting in the buffer
+    transcript_offsets.pop(sid, None)
+    if sid in transcript_buffers:
+        await transcript_buffers.pop(sid).close()
+    await session_registry.release(sid)
+
+async def lookup_session_owner(sid: str) -> Optional[Dict[str, Any]]:
+    """Registry entry of a session owned by another worker, cached briefly to keep audio routing cheap."""
+    cached = remote_session_owners.get(sid)
+    if cached and cached[1] > time.monotonic():
+        return cached[0]
+    entry = await session_registry.lookup(sid)
+    remote_session_owners[sid] = (entry, time.monotonic() + SESSION_OWNER_CACHE_SECONDS)
+    return entry
+
+# One bus publish at a time per session, in call order, so its forwarded audio chunks keep their order
+session_bus_locks: Dict[str, asyncio.Lock] = {}
+
+async def publish_to_worker(worker_id: str, message: Dict[str, Any]) -> bool:
+    """Forward a message over the session bus. The publish blocks (a Redis round trip), so it runs
+    in the loop's executor: green threads under eventlet, where the hub itself must not block."""
+    async with session_bus_locks.setdefault(message["sid"], asyncio.Lock()):
+        return await metrics.to_thread("session_bus", session_bus.publish, worker_id, message)
+
+async def route_remote_audio(sid: str, audio_data: bytes):
+    """Forward audio for a session owned elsewhere, or take the session over if its owner died."""
+    entry = await lookup_session_owner(sid)
+    if not entry:
+        return
+    if session_registry.is_alive(entry) and await publish_to_worker(entry["worker_id"], {
+        "type": "audio", "sid": sid, "data": audio_data
+    }):
+        return
+    if await session_registry.takeover(sid):
+        remote_session_owners.pop(sid, None)
+        logger.info(f"Worker {WORKER_ID} took over session {sid} from {entry['worker_id']}")
+        if await start_live_session(sid, entry["meeting_id"]):
+            await audio_ingests[sid].feed(audio_data)
+
+async def handle_bus_message(message: Dict[str, Any]):
+    """Audio or disconnect for one of our sessions, forwarded by the worker that received it."""
+    sid = message["sid"]
+    if message["type"] == "audio" and sid in audio_ingests:
+        await audio_ingests[sid].feed(message["data"])
+    elif message["type"] == "disconnect":
+        await stop_live_session(sid)
 
-@socketio.on('join_meeting')
-async def handle_join_meeting(data):
+def on_bus_message(message: Dict[str, Any]):
+    run_on_loop(handle_bus_message(message))
+
+# Socket.IO events. The handlers take the session id explicitly so both servers can call them:
+# python-socketio (ASGI mode) awaits them directly, Flask-SocketIO (eventlet mode) hands them to
+# the shared loop through the wrappers registered below.
+
+async def join_meeting(sid: str, data):
     """Client joins a meeting room to start live transcription."""
-    sid = request.sid
     meeting_id = data.get('meeting_id')
     if not meeting_id:
         logger.error(f"Client {sid} tried to join without meeting_id")
         return
 
-    logger.info(f"Client {sid} joining meeting {meeting_id}")
-    join_room(meeting_id)
+    logger.info(f"Client {sid} joining meeting {meeting_id} on worker {WORKER_ID}")
+    await enter_room(sid, meeting_id)
 
     try:
-        dg_connection = deepgram_client.listen.asynclive.v("1")
-        dg_connection.on(LiveTranscriptionEvents.Transcript, lambda r, **k: on_deepgram_message(r, sid=sid, **k))
-        dg_connection.on(LiveTranscriptionEvents.Error, lambda e, **k: on_deepgram_error(e, sid=sid, **k))
-
-        options = LiveOptions(
-            model="nova-2", punctuate=True, language="en-US",
-            encoding="linear16", channels=1, sample_rate=16000
-        )
-        await dg_connection.start(options)
-        deepgram_connections[sid] = dg_connection
-        await socketio.emit('joined', {'sid': sid, 'meeting_id': meeting_id}, to=sid)
+        if await start_live_session(sid, meeting_id):
+            await emit('joined', {'sid': sid, 'meeting_id': meeting_id}, to=sid)
     except Exception as e:
         logger.error(f"Error starting Deepgram for {sid}: {e}")
-        await socketio.emit('error', {'data': f'Failed to start transcription service: {e}'}, to=sid)
+        await emit('error', {'data': f'Failed to start transcription service: {e}'}, to=sid)
 
-@socketio.on('audio_stream')
-async def handle_audio_stream(audio_data):
-    """Receives audio from client and forwards to Deepgram."""
-    sid = request.sid
-    if sid in deepgram_connections:
-        await deepgram_connections[sid].send(audio_data)
+async def watch_meeting(sid: str, data):
+    """Client follows a meeting's live transcript without streaming audio."""
+    meeting_id = data.get('meeting_id')
+    if not meeting_id:
+        return
+    if not await db.meetings.find_one({"id": meeting_id}, {"_id": 1}):
+        await emit('error', {'data': 'Meeting not found'}, to=sid)
+        return
+    await enter_room(sid, meeting_id)
+    await emit('transcript_resume', {
+        'meeting_id': meeting_id, 'segments': await transcript_store.read_range(meeting_id)
+    }, to=sid)
+
+async def receive_audio(sid: str, audio_data):
+    """Receives audio from client and forwards it to Deepgram in fixed-size frames."""
+    if sid in audio_ingests:
+        await audio_ingests[sid].feed(audio_data)
+    else:
+        await route_remote_audio(sid, audio_data)
 
-@socketio.on('disconnect')
-async def handle_disconnect():
+async def client_disconnected(sid: str, *reason):
     """Clean up when a client disconnects."""
-    sid = request.sid
     logger.info(f"Client disconnected: {sid}")
-    if sid in deepgram_connections:
-        dg_connection = deepgram_connections.pop(sid)
-        await dg_connection.finish()
-        logger.info(f"Finished Deepgram connection for {sid}")
+    remote_session_owners.pop(sid, None)
+    if sid in deepgram_connections or sid in transcript_buffers:
+        await stop_live_session(sid)
+        return
+    entry = await session_registry.lookup(sid)
+    if entry and not (session_registry.is_alive(entry) and await publish_to_worker(
+        entry["worker_id"], {"type": "disconnect", "sid": sid, "data": None}
+    )):
+        # Owner is gone; its Deepgram socket died with it, only the registry entry is left
+        await session_registry.release(sid)
+    session_bus_locks.pop(sid, None)
+
+if sio is not None:
+    sio.on('join_meeting', join_meeting)
+    sio.on('watch_meeting', watch_meeting)
+    sio.on('audio_stream', receive_audio)
+    sio.on('disconnect', client_disconnected)
+else:
+    @socketio.on('join_meeting')
+    def handle_join_meeting(data):
+        run_on_loop(join_meeting(request.sid, data))
+
+    @socketio.on('watch_meeting')
+    def handle_watch_meeting(data):
+        run_on_loop(watch_meeting(request.sid, data))
+
+    @socketio.on('audio_stream')
+    def handle_audio_stream(audio_data):
+        run_on_loop(receive_audio(request.sid, audio_data))
+
+    @socketio.on('disconnect')
+    def handle_disconnect(*reason):
+        run_on_loop(client_disconnected(request.sid))
+
+    socketio.start_background_task(send_pending_emits)
+
+async def session_heartbeat():
+    """Background task: keep this worker's sessions and jobs alive and reap those of dead workers."""
+    while True:
+        try:
+            await session_registry.heartbeat()
+            reaped = await session_registry.reap_stale(grace=SESSION_HEARTBEAT_TTL)
+            if reaped:
+                logger.info(f"Reaped {reaped} live sessions of dead workers")
+            await heartbeat_jobs()
+            reaped = await reap_orphaned_jobs(grace=SESSION_HEARTBEAT_TTL)
+            if reaped:
+                logger.info(f"Reaped {reaped} jobs of dead workers")
+        except Exception as e:
+            logger.error(f"Session heartbeat failed: {e}")
+        await asyncio.sleep(SESSION_HEARTBEAT_TTL / 3)
 
 
 # --- App Finalization ---
@@ -426,16 +1472,78 @@ async def handle_disconnect():
 # Register the blueprint with the main Flask app
 app.register_blueprint(api_bp)
 
-# Register a function to close the database client on exit
-@atexit.register
-def shutdown_db_client():
+async def ensure_indexes():
+    """Create the indexes the API relies on. Safe to run on every start."""
+    await db.meetings.create_index("id", unique=True)
+    await db.meetings.create_index([("timestamp", DESCENDING), ("id", DESCENDING)])
+    await db.meetings.create_index([("participants", ASCENDING), ("timestamp", DESCENDING)])
+    await db.meetings.create_index([("title", TEXT), ("host", TEXT)], name="meetings_search")
+    await transcript_store.ensure_indexes()
+    await segment_index.ensure_indexes()
+    await summary_cache.ensure_indexes()
+    await meeting_similarity.ensure_indexes()
+    await db.jobs.create_index("id", unique=True)
+    await db.jobs.create_index("updated_at", expireAfterSeconds=7 * 24 * 3600)
+    await db.jobs.create_index([("status", ASCENDING), ("heartbeat_at", ASCENDING)])
+    await email_outbox.ensure_indexes()
+    await session_registry.ensure_indexes()
+    logger.info("MongoDB indexes ensured")
+
+async def email_outbox_sweeper():
+    """Background task: queue outbox entries that are due, i.e. new ones the queue had no room for,
+    retries whose ``next_attempt_at`` has passed and entries whose worker died mid-round."""
+    while True:
+        try:
+            room = email_jobs.max_pending - email_jobs.pending
+            if room > 0:
+                for outbox_id in await email_outbox.due_ids(limit=room):
+                    submit_email_delivery(outbox_id)
+        except JobQueueFull:
+            pass
+        except Exception as e:
+            logger.error(f"Email outbox sweep failed: {e}")
+        await asyncio.sleep(EMAIL_SWEEP_INTERVAL)
+
+background_tasks: List[asyncio.Task] = []
+
+async def run_startup_tasks():
+    """Run one-off async setup on the shared loop before the server starts handling requests."""
+    try:
+        await ensure_indexes()
+        removed = await remove_stale_uploads()
+        if removed:
+            logger.info(f"Removed {removed} stale uploads from {UPLOAD_DIR}")
+    except Exception as e:
+        logger.error(f"Startup tasks failed: {e}")
+    session_bus.start(on_bus_message)
+    loop = asyncio.get_running_loop()
+    # Held so the loop's weak references aren't the only ones to these long-lived tasks
+    background_tasks.extend([loop.create_task(session_heartbeat()), loop.create_task(email_outbox_sweeper())])
+
+async def shutdown():
+    """Release this worker's live sessions and stop its background workers."""
     logger.info("Closing MongoDB client...")
+    try:
+        await session_registry.release_worker()
+    except Exception as e:
+        logger.error(f"Could not release live sessions of {WORKER_ID}: {e}")
+    transcription_jobs.shutdown()
+    email_jobs.shutdown()
     client.close()
 
+if SERVER_MODE != 'asgi':
+    # Under ASGI, asgi.py binds the server's loop and runs startup/shutdown on it
+    bind_eventlet_loop()
+    run_on_loop(run_startup_tasks())
+
+    # Register a function to close the database client on exit
+    @atexit.register
+    def shutdown_db_client():
+        run_on_loop(shutdown()).result(timeout=10)
+
 # Main entry point for running the application
 if __name__ == "__main__":
-    # For production, use a production-ready ASGI server like Uvicorn or Hypercorn
-    # Example: uvicorn your_app_file:app --host 0.0.0.0 --port 8001
+    # For production, use the ASGI mode: uvicorn asgi:app --host 0.0.0.0 --port 8001 (see asgi.py)
     logger.info("Starting Flask-SocketIO development server...")
     port = int(os.environ.get("PORT", 8001))
     import sys
@@ -0,0 +1,222 @@
+import base64
+import json
+import logging
+import threading
+import time
+from typing import Any, Callable, Dict, MutableMapping, Optional
+
+from pymongo import ReturnDocument
+
+logger = logging.getLogger(__name__)
+
+
+class SessionRegistry:
+    """Shared record of which worker owns each live session, stored in MongoDB.
+
+    Every worker refreshes ``heartbeat_at`` on its sessions; a session whose heartbeat is older
+    than ``ttl`` seconds belongs to a dead worker and may be taken over by another one.
+    """
+
+    def __init__(self, collection, worker_id: str, ttl: float = 15.0):
+        self.collection = collection
+        self.worker_id = worker_id
+        self.ttl = ttl
+
+    async def ensure_indexes(self):
+        await self.collection.create_index("sid", unique=True)
+        await self.collection.create_index("worker_id")
+
+    def is_alive(self, entry: Dict[str, Any]) -> bool:
+        return time.time() - entry["heartbeat_at"] < self.ttl
+
+    async def claim(self, sid: str, meeting_id: str):
+        await self.collection.replace_one(
+            {"sid": sid},
+            {"sid": sid, "meeting_id": meeting_id, "worker_id": self.worker_id, "heartbeat_at": time.time()},
+            upsert=True
+        )
+
+    async def lookup(self, sid: str) -> Optional[Dict[str, Any]]:
+        return await self.collection.find_one({"sid": sid}, {"_id": 0})
+
+    async def takeover(self, sid: str) -> Optional[Dict[str, Any]]:
+        """Atomically claim a session whose owner stopped heart-beating; ``None`` if someone else won."""
+        now = time.time()
+        return await self.collection.find_one_and_update(
+            {"sid": sid, "heartbeat_at": {"$lt": now - self.ttl}},
+            {"$set": {"worker_id": self.worker_id, "heartbeat_at": now}},
+            projection={"_id": 0}, return_document=ReturnDocument.AFTER
+        )
+
+    async def release(self, sid: str):
+        await self.collection.delete_one({"sid": sid})
+
+    async def heartbeat(self):
+        await self.collection.update_many({"worker_id": self.worker_id}, {"$set": {"heartbeat_at": time.time()}})
+
+    async def reap_stale(self, grace: float) -> int:
+        """Drop sessions whose owner has been silent for ``ttl + grace`` seconds and nobody took over."""
+        result = await self.collection.delete_many({"heartbeat_at": {"$lt": time.time() - self.ttl - grace}})
+        return result.deleted_count
+
+    async def release_worker(self):
+        """Forget every session of this worker (clean shutdown)."""
+        await self.collection.delete_many({"worker_id": self.worker_id})
+
+
+class LocalSessionRegistry(SessionRegistry):
+    """``SessionRegistry`` over a plain mapping, for single-host tests and benchmarks.
+
+    Pass a ``multiprocessing.Manager().dict()`` and ``Manager().Lock()`` to share it between processes.
+    """
+
+    def __init__(self, store: MutableMapping, worker_id: str, ttl: float = 15.0, lock=None):
+        super().__init__(None, worker_id, ttl)
+        self.store = store
+        self.lock = lock or threading.Lock()
+
+    async def ensure_indexes(self):
+        pass
+
+    async def claim(self, sid: str, meeting_id: str):
+        self.store[sid] = {"sid": sid, "meeting_id": meeting_id, "worker_id": self.worker_id,
+                           "heartbeat_at": time.time()}
+
+    async def lookup(self, sid: str) -> Optional[Dict[str, Any]]:
+        entry = self.store.get(sid)
+        return dict(entry) if entry else None
+
+    async def takeover(self, sid: str) -> Optional[Dict[str, Any]]:
+        with self.lock:
+            entry = self.store.get(sid)
+            if not entry or self.is_alive(entry):
+                return None
+            entry = {**entry, "worker_id": self.worker_id, "heartbeat_at": time.time()}
+            self.store[sid] = entry
+            return entry
+
+    async def release(self, sid: str):
+        self.store.pop(sid, None)
+
+    async def heartbeat(self):
+        with self.lock:
+            now = time.time()
+            for sid, entry in list(self.store.items()):
+                if entry["worker_id"] == self.worker_id:
+                    self.store[sid] = {**entry, "heartbeat_at": now}
+
+    async def reap_stale(self, grace: float) -> int:
+        with self.lock:
+            cutoff = time.time() - self.ttl - grace
+            stale = [sid for sid, entry in list(self.store.items()) if entry["heartbeat_at"] < cutoff]
+            for sid in stale:
+                self.store.pop(sid, None)
+            return len(stale)
+
+    async def release_worker(self):
+        with self.lock:
+            for sid, entry in list(self.store.items()):
+                if entry["worker_id"] == self.worker_id:
+                    self.store.pop(sid, None)
+
+
+# --- Worker-to-worker message bus ---
+# Messages are dicts like {"type": "audio" | "disconnect", "sid": ..., "data": bytes | None}.
+
+def encode_message(message: Dict[str, Any]) -> str:
+    payload = dict(message)
+    if isinstance(payload.get("data"), (bytes, bytearray)):
+        payload["data"] = base64.b64encode(payload["data"]).decode()
+        payload["binary"] = True
+    return json.dumps(payload)
+
+
+def decode_message(raw) -> Dict[str, Any]:
+    message = json.loads(raw)
+    if message.pop("binary", False):
+        message["data"] = base64.b64decode(message["data"])
+    return message
+
+
+class LocalSessionBus:
+    """In-process bus: delivery is a direct call into the target worker's callback."""
+
+    def __init__(self, worker_id: str, hub: Optional[Dict[str, Callable]] = None):
+        self.worker_id = worker_id
+        self.hub = hub if hub is not None else {}
+
+    def start(self, callback: Callable[[Dict[str, Any]], None]):
+        self.hub[self.worker_id] = callback
+
+    def publish(self, worker_id: str, message: Dict[str, Any]) -> bool:
+        callback = self.hub.get(worker_id)
+        if callback is None:
+            return False
+        callback(message)
+        return True
+
+
+class QueueSessionBus:
+    """Bus over ``multiprocessing`` queues (one inbox per worker), for multi-process local runs."""
+
+    def __init__(self, worker_id: str, inboxes: Dict[str, Any]):
+        self.worker_id = worker_id
+        self.inboxes = inboxes
+
+    def start(self, callback: Callable[[Dict[str, Any]], None]):
+        inbox = self.inboxes[self.worker_id]
+
+        def listen():
+            while True:
+                raw = inbox.get()
+                if raw is None:
+                    return
+                callback(decode_message(raw))
+
+        threading.Thread(target=listen, daemon=True, name=f"bus-{self.worker_id}").start()
+
+    def publish(self, worker_id: str, message: Dict[str, Any]) -> bool:
+        inbox = self.inboxes.get(worker_id)
+        if inbox is None:
+            return False
+        inbox.put(encode_message(message))
+        return True
+
+
+class RedisSessionBus:
+    """Bus over Redis pub/sub, one channel per worker. Uses the Socket.IO message queue server."""
+
+    def __init__(self, url: str, worker_id: str, prefix: str = "live-sessions:"):
+        import redis  # optional dependency, only needed when running several workers
+        self.worker_id = worker_id
+        self.prefix = prefix
+        self._redis = redis.Redis.from_url(url)
+
+    def start(self, callback: Callable[[Dict[str, Any]], None]):
+        pubsub = self._redis.pubsub(ignore_subscribe_messages=True)
+        pubsub.subscribe(self.prefix + self.worker_id)
+
+        def listen():
+            for item in pubsub.listen():
+                try:
+                    callback(decode_message(item["data"]))
+                except Exception as e:
+                    logger.error(f"Error handling bus message on {self.worker_id}: {e}")
+
+        threading.Thread(target=listen, daemon=True, name=f"bus-{self.worker_id}").start()
+
+    def publish(self, worker_id: str, message: Dict[str, Any]) -> bool:
+        return self._redis.publish(self.prefix + worker_id, encode_message(message)) > 0
+
+
+def build_session_bus(url: Optional[str], worker_id: str):
+    """Redis bus when a Redis message queue is configured, otherwise a single-process local bus."""
+    if url and url.startswith(("redis://", "rediss://")):
+        return RedisSessionBus(url, worker_id)
+    if url:
+        # Socket.IO still shares rooms over this queue, but live audio can't follow a session to its worker
+        logger.warning(
+            f"No session bus for message queue '{url.split('://')[0]}://', only Redis is supported; "
+            f"live sessions will not be forwarded between workers"
+        )
+    return LocalSessionBus(worker_id)
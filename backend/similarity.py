@@ -0,0 +1,390 @@
+import asyncio
+import logging
+import re
+import threading
+import zlib
+from collections import Counter, OrderedDict
+from datetime import datetime, timedelta
+from typing import Any, Dict, Hashable, Iterable, List, Optional, Tuple
+
+import numpy as np
+from pymongo import ASCENDING, ReturnDocument
+from scipy import sparse
+from scipy.sparse.csgraph import connected_components
+
+import metrics
+
+logger = logging.getLogger(__name__)
+
+N_FEATURES = 2 ** 18
+ITEM_SECTIONS = ("action_items", "unresolved_issues")
+
+SYNC_BATCH_SIZE = 500
+# Every sync re-reads this much of the most recent history: writes stamped close together can
+# become visible out of order
+SYNC_OVERLAP = timedelta(seconds=5)
+# Cluster results kept per (threshold, sections) filter
+CLUSTER_CACHE_SIZE = 8
+
+STOPWORDS = frozenset("""
+a about above after again all also am an and any are as at be because been before being below between both
+but by can could did do does doing down during each few for from further get got had has have having he her
+here hers him his how i if in into is it its itself just let like me more most my no nor not now of off on
+once only or other our ours out over own same she should so some such than that the their theirs them then
+there these they this those through to too under until up us very was we were what when where which while
+who whom why will with would yeah yes you your yours okay ok um uh gonna going really think know
+""".split())
+
+_WORD_RE = re.compile(r"[a-z0-9][a-z0-9']*")
+
+
+def tokenize(text: str, bigrams: bool = False) -> List[str]:
+    """Lower-cased words without stopwords, optionally followed by their adjacent pairs."""
+    words = [w for w in _WORD_RE.findall(text.lower()) if w not in STOPWORDS and len(w) > 1]
+    if bigrams:
+        words += [f"{a} {b}" for a, b in zip(words, words[1:])]
+    return words
+
+
+def term_counts(tokens: Iterable[str], n_features: int = N_FEATURES) -> Dict[int, int]:
+    """Hashed term counts; ``crc32`` keeps the feature ids stable across processes."""
+    return dict(Counter(zlib.crc32(t.encode()) % n_features for t in tokens))
+
+
+class TfidfIndex:
+    """Sparse TF-IDF rows keyed by arbitrary ids, with incremental upserts.
+
+    Rows hold hashed term counts, so the vocabulary never has to be rebuilt. Document frequencies
+    are kept up to date on every change; the weighted, L2-normalized matrix (sublinear tf, smoothed
+    idf) is rebuilt lazily on the next query. Removed rows are zeroed and compacted away once they
+    make up half the matrix. Not thread-safe; ``MeetingSimilarity`` serializes access.
+    """
+
+    def __init__(self, n_features: int = N_FEATURES):
+        self.n_features = n_features
+        self._df = np.zeros(n_features, dtype=np.int64)
+        self._keys: List[Optional[Hashable]] = []
+        self._rows: Dict[Hashable, int] = {}
+        self._matrix = sparse.csr_matrix((0, n_features), dtype=np.float32)
+        self._pending: List[sparse.csr_matrix] = []
+        self._weighted: Optional[sparse.csr_matrix] = None
+        # Bumped on every change, so derived results can be cached
+        self.version = 0
+
+    def __len__(self) -> int:
+        return len(self._rows)
+
+    def __contains__(self, key: Hashable) -> bool:
+        return key in self._rows
+
+    def upsert(self, key: Hashable, counts: Dict[int, int]):
+        if key in self._rows:
+            self.remove(key)
+        columns = np.fromiter(counts.keys(), dtype=np.int64, count=len(counts))
+        values = np.fromiter(counts.values(), dtype=np.float32, count=len(counts))
+        self._pending.append(sparse.csr_matrix(
+            (values, columns, np.array([0, len(columns)])), shape=(1, self.n_features)
+        ))
+        self._rows[key] = len(self._keys)
+        self._keys.append(key)
+        self._df[columns] += 1
+        self._weighted = None
+        self.version += 1
+
+    def remove(self, key: Hashable):
+        row = self._rows.pop(key, None)
+        if row is None:
+            return
+        matrix = self._counts()
+        start, end = matrix.indptr[row], matrix.indptr[row + 1]
+        self._df[matrix.indices[start:end]] -= 1
+        matrix.data[start:end] = 0
+        self._keys[row] = None
+        self._weighted = None
+        self.version += 1
+        if len(self._keys) > 64 and len(self._rows) < len(self._keys) // 2:
+            self._compact()
+
+    def _counts(self) -> sparse.csr_matrix:
+        if self._pending:
+            self._matrix = sparse.vstack([self._matrix, *self._pending], format="csr")
+            self._pending = []
+        return self._matrix
+
+    def _compact(self):
+        alive = [row for row, key in enumerate(self._keys) if key is not None]
+        self._matrix = self._counts()[alive]
+        self._keys = [self._keys[row] for row in alive]
+        self._rows = {key: row for row, key in enumerate(self._keys)}
+
+    def weighted(self) -> sparse.csr_matrix:
+        """Rows as L2-normalized TF-IDF vectors (removed rows are all zero)."""
+        if self._weighted is None:
+            matrix = self._counts().copy()
+            matrix.data = np.where(matrix.data > 0, 1 + np.log(np.maximum(matrix.data, 1)), 0).astype(np.float32)
+            documents = max(len(self._rows), 1)
+            idf = (np.log((1 + documents) / (1 + self._df)) + 1).astype(np.float32)
+            matrix = matrix.multiply(idf[np.newaxis, :]).tocsr()
+            norms = np.sqrt(np.asarray(matrix.multiply(matrix).sum(axis=1)).ravel())
+            norms[norms == 0] = 1
+            self._weighted = sparse.diags((1 / norms).astype(np.float32)) @ matrix
+        return self._weighted
+
+    def rows(self, keys: Iterable[Hashable]) -> List[int]:
+        return [self._rows[key] for key in keys if key in self._rows]
+
+    def key(self, row: int) -> Optional[Hashable]:
+        return self._keys[row]
+
+    def keys(self) -> List[Hashable]:
+        return list(self._rows)
+
+    def most_similar(self, key: Hashable, limit: int = 10, min_score: float = 0.0) -> List[Tuple[Hashable, float]]:
+        """The ``limit`` rows with the highest cosine similarity to ``key``'s row, best first."""
+        if key not in self._rows:
+            return []
+        matrix = self.weighted()
+        row = self._rows[key]
+        scores = (matrix @ matrix[row].T).toarray().ravel()
+        scores[row] = -1
+        limit = min(limit, len(scores) - 1)
+        if limit <= 0:
+            return []
+        top = np.argpartition(-scores, limit - 1)[:limit]
+        top = top[np.argsort(-scores[top])]
+        return [(self._keys[i], float(scores[i])) for i in top if scores[i] > min_score and self._keys[i] is not None]
+
+    def _prefix(self, matrix: sparse.csr_matrix, threshold: float) -> Tuple[sparse.csr_matrix, np.ndarray]:
+        """Split each row into its rarer terms and a tail of its most common terms.
+
+        The tail is the longest run of a row's most frequent terms whose norm stays below
+        ``threshold``; it alone can never make a cosine reach the threshold. Returns the matrix
+        of the remaining (prefix) terms and each row's tail norm.
+        """
+        rows = np.repeat(np.arange(matrix.shape[0]), np.diff(matrix.indptr))
+        order = np.lexsort((-self._df[matrix.indices], rows))  # per row, most common term first
+        squares = matrix.data[order].astype(np.float64) ** 2
+        cumulative = np.cumsum(squares)
+        row_starts = matrix.indptr[:-1][rows[order]]
+        before_row = np.concatenate(([0.0], cumulative))[row_starts]
+        in_tail = cumulative - before_row < threshold ** 2
+        tail_norms = np.sqrt(np.bincount(rows[order][in_tail], weights=squares[in_tail], minlength=matrix.shape[0]))
+        keep = order[~in_tail]
+        prefix = sparse.csr_matrix((matrix.data[keep], (rows[keep], matrix.indices[keep])), shape=matrix.shape)
+        return prefix, tail_norms
+
+    def near_duplicate_groups(self, keys: List[Hashable], threshold: float,
+                              block_size: int = 4096, pair_batch: int = 200_000) -> List[List[Hashable]]:
+        """Group ``keys`` whose rows are linked by cosine similarity >= ``threshold`` (transitively).
+
+        Candidate pairs must share one of a row's rarer terms (see ``_prefix``), found with blocked
+        sparse products; the bound ``prefix score + tail norm`` drops most of them, and the rest get
+        an exact dot product. Rows with identical terms (items repeated verbatim) are compared once.
+        """
+        rows = self.rows(keys)
+        if not rows:
+            return []
+        counts = self._counts()
+        distinct: Dict[Tuple[bytes, bytes], int] = {}
+        representative, unique = [], []
+        for row in rows:
+            start, end = counts.indptr[row], counts.indptr[row + 1]
+            signature = (counts.indices[start:end].tobytes(), counts.data[start:end].tobytes())
+            if signature not in distinct:
+                distinct[signature] = len(representative)
+                representative.append(row)
+            unique.append(distinct[signature])
+
+        matrix = self.weighted()[representative]
+        prefix, tail_norms = self._prefix(matrix, threshold)
+        transposed = matrix.T.tocsc()
+        sources, targets = [], []
+        for start in range(0, len(representative), block_size):
+            block = (prefix[start:start + block_size] @ transposed).tocoo()
+            left = block.row + start
+            possible = (block.data + tail_norms[left] >= threshold) & (left < block.col)
+            left, right = left[possible], block.col[possible]
+            for offset in range(0, len(left), pair_batch):
+                i, j = left[offset:offset + pair_batch], right[offset:offset + pair_batch]
+                scores = np.asarray(matrix[i].multiply(matrix[j]).sum(axis=1)).ravel()
+                sources.append(i[scores >= threshold])
+                targets.append(j[scores >= threshold])
+        sources = np.concatenate(sources) if sources else np.zeros(0, dtype=np.int64)
+        targets = np.concatenate(targets) if targets else np.zeros(0, dtype=np.int64)
+        links = sparse.csr_matrix((np.ones(len(sources), dtype=np.int8), (sources, targets)),
+                                  shape=(len(representative), len(representative)))
+        count, labels = connected_components(links, directed=False)
+        groups: List[List[Hashable]] = [[] for _ in range(count)]
+        for row, position in zip(rows, unique):
+            groups[labels[position]].append(self._keys[row])
+        return groups
+
+
+class MeetingSimilarity:
+    """Related meetings and cross-meeting clusters of open summary items, from TF-IDF vectors.
+
+    Every meeting gets one vector for its transcript and summary, and one per action item and
+    unresolved issue of its summary. Their hashed term counts are stored in ``collection``
+    (``similarity_vectors``), one document per meeting, so each worker keeps the matrices in memory
+    and only pulls the documents changed since its last sync before answering a query. Without a
+    collection the index lives in this process only. Matrix work runs in a thread under a lock.
+
+    Item clusters are cached per filter; once the index has changed, the cached clusters are
+    still served while one background task rebuilds them.
+    """
+
+    def __init__(self, collection=None, n_features: int = N_FEATURES):
+        self.collection = collection
+        self.n_features = n_features
+        self.meetings = TfidfIndex(n_features)
+        self.items = TfidfIndex(n_features)
+        self._item_keys: Dict[str, List[Tuple[str, str, int]]] = {}
+        self._item_text: Dict[Tuple[str, str, int], str] = {}
+        self._versions: Dict[str, datetime] = {}
+        self._synced_at: Optional[datetime] = None
+        self._sync_lock = asyncio.Lock()
+        # (threshold, sections) -> (items version, clusters), least recently used first
+        self._cluster_cache: OrderedDict = OrderedDict()
+        self._cluster_tasks: Dict[Tuple[float, Tuple[str, ...]], asyncio.Future] = {}
+        self._lock = threading.Lock()
+
+    async def ensure_indexes(self):
+        if self.collection is not None:
+            await self.collection.create_index("meeting_id", unique=True)
+            await self.collection.create_index([("updated_at", ASCENDING)])
+
+    def vectorize(self, meeting_id: str, segments: List[Dict[str, Any]],
+                  summary: Optional[Dict[str, Any]]) -> Dict[str, Any]:
+        """The stored form of a meeting: hashed term counts of its text and of each open item."""
+        summary = summary or {}
+        texts = [seg.get("text", "") for seg in segments]
+        texts += [item for section in summary.values() if isinstance(section, list)
+                  for item in section if isinstance(item, str)]
+        counts = term_counts((t for text in texts for t in tokenize(text)), self.n_features)
+        items = []
+        for section in ITEM_SECTIONS:
+            for text in summary.get(section) or []:
+                item_counts = term_counts(tokenize(text, bigrams=True), self.n_features)
+                if item_counts:
+                    items.append({"section": section, "text": text,
+                                  "terms": list(item_counts), "counts": list(item_counts.values())})
+        # A local version; update_meeting replaces it with the time the database stored the document
+        now = datetime.utcnow()
+        return {"meeting_id": meeting_id, "terms": list(counts), "counts": list(counts.values()),
+                "items": items, "updated_at": now.replace(microsecond=now.microsecond // 1000 * 1000)}
+
+    def _apply(self, doc: Dict[str, Any]) -> bool:
+        meeting_id = doc["meeting_id"]
+        if self._versions.get(meeting_id) == doc["updated_at"]:
+            return False
+        self._versions[meeting_id] = doc["updated_at"]
+        self.meetings.upsert(meeting_id, dict(zip(doc["terms"], doc["counts"])))
+        for key in self._item_keys.pop(meeting_id, []):
+            self.items.remove(key)
+            self._item_text.pop(key, None)
+        keys = []
+        for position, item in enumerate(doc["items"]):
+            key = (meeting_id, item["section"], position)
+            self.items.upsert(key, dict(zip(item["terms"], item["counts"])))
+            self._item_text[key] = item["text"]
+            keys.append(key)
+        self._item_keys[meeting_id] = keys
+        return True
+
+    def _apply_all(self, docs: List[Dict[str, Any]]) -> int:
+        with self._lock:
+            return sum(self._apply(doc) for doc in docs)
+
+    async def update_meeting(self, meeting_id: str, segments: List[Dict[str, Any]],
+                             summary: Optional[Dict[str, Any]]):
+        """(Re)index a meeting, e.g. once its summary is stored."""
+        doc = await metrics.to_cpu_thread("similarity", self.vectorize, meeting_id, segments, summary)
+        if self.collection is not None:
+            # Stamped by the database's clock, so workers' clocks never have to agree
+            fields = {key: value for key, value in doc.items() if key != "updated_at"}
+            stored = await self.collection.find_one_and_update(
+                {"meeting_id": meeting_id}, {"$set": fields, "$currentDate": {"updated_at": True}},
+                projection={"_id": 0, "updated_at": 1}, upsert=True, return_document=ReturnDocument.AFTER
+            )
+            doc["updated_at"] = stored["updated_at"]
+        await metrics.to_cpu_thread("similarity", self._apply_all, [doc])
+
+    async def sync(self):
+        """Load vectors written by other workers (or before a restart) since the last sync.
+
+        Pages through the changed documents in ``updated_at`` order, ``SYNC_BATCH_SIZE`` at a time,
+        starting ``SYNC_OVERLAP`` before the last one seen; documents already applied are skipped.
+        """
+        if self.collection is None:
+            return
+        async with self._sync_lock:
+            query = {"updated_at": {"$gte": self._synced_at - SYNC_OVERLAP}} if self._synced_at else {}
+            cursor = self.collection.find(query, {"_id": 0}).sort("updated_at", ASCENDING).batch_size(SYNC_BATCH_SIZE)
+            applied, batch = 0, []
+            async for doc in cursor:
+                batch.append(doc)
+                if len(batch) == SYNC_BATCH_SIZE:
+                    applied += await self._apply_batch(batch)
+                    batch = []
+            if batch:
+                applied += await self._apply_batch(batch)
+            if applied:
+                logger.info(f"Similarity index synced {applied} meetings ({len(self.meetings)} total)")
+
+    async def _apply_batch(self, docs: List[Dict[str, Any]]) -> int:
+        applied = await metrics.to_cpu_thread("similarity", self._apply_all, docs)
+        self._synced_at = max(self._synced_at or docs[-1]["updated_at"], docs[-1]["updated_at"])
+        return applied
+
+    def __contains__(self, meeting_id: str) -> bool:
+        return meeting_id in self.meetings
+
+    def _related(self, meeting_id: str, limit: int, min_score: float):
+        with self._lock:
+            return self.meetings.most_similar(meeting_id, limit, min_score)
+
+    async def related(self, meeting_id: str, limit: int = 10, min_score: float = 0.05) -> List[Tuple[str, float]]:
+        """``(meeting_id, score)`` of the meetings most similar to ``meeting_id``, best first."""
+        await self.sync()
+        return await metrics.to_cpu_thread("similarity", self._related, meeting_id, limit, min_score)
+
+    def _clusters(self, threshold: float, sections: Tuple[str, ...]):
+        with self._lock:
+            version = self.items.version
+            keys = [key for key in self.items.keys() if key[1] in sections]
+            groups = self.items.near_duplicate_groups(keys, threshold)
+            clusters = [[{"meeting_id": key[0], "section": key[1], "text": self._item_text[key]} for key in group]
+                        for group in groups]
+            return version, clusters
+
+    async def _rebuild_clusters(self, cache_key: Tuple[float, Tuple[str, ...]]):
+        version, clusters = await metrics.to_cpu_thread("similarity", self._clusters, *cache_key)
+        self._cluster_cache[cache_key] = (version, clusters)
+        self._cluster_cache.move_to_end(cache_key)
+        while len(self._cluster_cache) > CLUSTER_CACHE_SIZE:
+            self._cluster_cache.popitem(last=False)
+        return clusters
+
+    def _cluster_rebuilt(self, cache_key, task: asyncio.Future):
+        self._cluster_tasks.pop(cache_key, None)
+        if not task.cancelled() and task.exception() is not None:
+            logger.error(f"Rebuilding item clusters {cache_key} failed: {task.exception()}")
+
+    async def item_clusters(self, threshold: float = 0.6,
+                            sections: Tuple[str, ...] = ITEM_SECTIONS) -> List[List[Dict[str, Any]]]:
+        """Summary items of all meetings, grouped into clusters of near-duplicates.
+
+        Only a filter that is not cached yet is computed while the caller waits; otherwise the
+        cached clusters are returned, and refreshed in the background if the index has changed.
+        """
+        await self.sync()
+        cache_key = (threshold, sections)
+        cached = self._cluster_cache.get(cache_key)
+        task = self._cluster_tasks.get(cache_key)
+        if task is None and (cached is None or cached[0] != self.items.version):
+            task = self._cluster_tasks[cache_key] = asyncio.ensure_future(self._rebuild_clusters(cache_key))
+            task.add_done_callback(lambda done: self._cluster_rebuilt(cache_key, done))
+        if cached is None:
+            return await asyncio.shield(task)
+        self._cluster_cache.move_to_end(cache_key)
+        return cached[1]
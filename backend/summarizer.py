@@ -0,0 +1,413 @@
+import asyncio
+import json
+import logging
+import re
+import time
+from typing import Any, Awaitable, Callable, Dict, List, Optional, Tuple
+
+import metrics
+
+logger = logging.getLogger(__name__)
+
+SUMMARY_SECTIONS = (
+    "key_points", "decisions_made", "action_items", "assignees", "deadlines",
+    "attendee_recommendations", "ai_recommendations", "unresolved_issues", "followup_reminders", "references",
+)
+
+# Bump whenever the prompt or the merge logic changes, so cached summaries are not reused
+PROMPT_VERSION = "1"
+
+SYSTEM_PROMPT = "You are a professional meeting assistant that creates structured, actionable meeting summaries."
+
+
+def build_prompt(transcript_text: str, part: Optional[int] = None, parts: Optional[int] = None) -> str:
+    """User prompt asking for the ``MeetingSummary`` JSON sections for (part of) a transcript."""
+    scope = ""
+    if parts and parts > 1:
+        scope = (f"This is part {part} of {parts} of a longer meeting. "
+                 "Only summarize what is said in this part.\n")
+    return f"""
+        Please analyze the following meeting transcript and provide a comprehensive summary in JSON format with these exact sections:
+        {scope}Meeting Transcript: {transcript_text}
+        Please respond with a JSON object containing:
+        {{
+            "key_points": ["..."], "decisions_made": ["..."], "action_items": ["..."], "assignees": ["..."], "deadlines": ["..."],
+            "attendee_recommendations": ["..."], "ai_recommendations": ["..."], "unresolved_issues": ["..."], "followup_reminders": ["..."], "references": ["..."]
+        }}
+        Make each section specific and actionable. If a section doesn't apply, include an empty array.
+        """
+
+
+def estimate_tokens(text: str) -> int:
+    """Cheap token estimate (~4 characters per token for English text)."""
+    return max(1, len(text) // 4)
+
+
+def format_segment(segment: Dict[str, Any]) -> str:
+    return f"{segment.get('speaker', 'Unknown')}: {segment['text']}"
+
+
+def segments_from_text(transcript_text: str) -> List[Dict[str, Any]]:
+    """Turn ``Speaker: text`` lines (the format the frontend sends) back into segments."""
+    segments = []
+    for line in transcript_text.splitlines():
+        line = line.strip()
+        if not line:
+            continue
+        speaker, sep, text = line.partition(": ")
+        if sep and len(speaker) <= 40:
+            segments.append({"speaker": speaker, "text": text})
+        else:
+            segments.append({"speaker": "Unknown", "text": line})
+    return segments
+
+
+def _split_oversized(segment: Dict[str, Any], token_budget: int) -> List[Dict[str, Any]]:
+    """Break a single segment that alone exceeds the budget into word windows.
+
+    The budget covers each piece as ``format_segment`` renders it, speaker prefix included; a word
+    too long for any window is cut into parts.
+    """
+    prefix = len(format_segment({**segment, "text": ""}))
+    # The most characters estimate_tokens still counts within the budget, less the prefix
+    max_chars = max(4 * token_budget + 3 - prefix, 1)
+    pieces, current = [], ""
+    for word in segment["text"].split():
+        for start in range(0, len(word), max_chars):
+            part = word[start:start + max_chars]
+            if current and len(current) + 1 + len(part) > max_chars:
+                pieces.append({**segment, "text": current})
+                current = ""
+            current = f"{current} {part}" if current else part
+    if current:
+        pieces.append({**segment, "text": current})
+    return pieces
+
+
+def chunk_segments(segments: List[Dict[str, Any]], token_budget: int) -> List[List[Dict[str, Any]]]:
+    """Group consecutive segments into chunks of at most ``token_budget`` estimated tokens.
+
+    Chunks never split a segment. When a chunk fills up, it is cut at the last speaker change
+    if that keeps at least half the budget in the chunk, otherwise at the segment boundary.
+    """
+    chunks: List[List[Dict[str, Any]]] = []
+    current: List[Dict[str, Any]] = []
+    current_tokens = 0
+    for segment in segments:
+        for piece in (_split_oversized(segment, token_budget)
+                      if estimate_tokens(format_segment(segment)) > token_budget else [segment]):
+            tokens = estimate_tokens(format_segment(piece))
+            if current and current_tokens + tokens > token_budget:
+                cut = len(current)
+                for i in range(len(current) - 1, 0, -1):
+                    if current[i].get("speaker") != current[i - 1].get("speaker"):
+                        if sum(estimate_tokens(format_segment(s)) for s in current[:i]) >= token_budget // 2:
+                            cut = i
+                        break
+                chunks.append(current[:cut])
+                current = current[cut:]
+                current_tokens = sum(estimate_tokens(format_segment(s)) for s in current)
+                if current and current_tokens + tokens > token_budget:
+                    chunks.append(current)
+                    current, current_tokens = [], 0
+            current.append(piece)
+            current_tokens += tokens
+    if current:
+        chunks.append(current)
+    return chunks
+
+
+def parse_summary_json(content: str) -> Dict[str, Any]:
+    """Parse a model reply into a dict, tolerating a surrounding Markdown code fence."""
+    content = content.strip()
+    fenced = re.match(r"^```(?:json)?\s*(.*?)\s*```$", content, re.DOTALL)
+    if fenced:
+        content = fenced.group(1)
+    return json.loads(content)
+
+
+class SectionStreamParser:
+    """Incremental parser for a streamed JSON object reply.
+
+    ``feed`` takes the next piece of model output and returns the ``(key, value)`` pairs of the
+    top-level object that became complete with it, so each summary section can be used as soon as
+    its closing bracket arrives. Anything before the opening brace (e.g. a Markdown fence) is
+    skipped. The full reply should still be validated with ``parse_summary_json`` at the end.
+    """
+
+    def __init__(self):
+        self._buffer = ""
+        self._pos = 0
+        self._depth = 0
+        self._in_string = False
+        self._escape = False
+        self._expect = "start"  # start, key, colon, value, in_value, after, done
+        self._key: Optional[str] = None
+        self._token_start = 0
+
+    def feed(self, text: str) -> List[Tuple[str, Any]]:
+        self._buffer += text
+        completed: List[Tuple[str, Any]] = []
+        buffer = self._buffer
+        for i in range(self._pos, len(buffer)):
+            c = buffer[i]
+            if self._expect == "done":
+                break
+            if self._in_string:
+                if self._escape:
+                    self._escape = False
+                elif c == "\\":
+                    self._escape = True
+                elif c == '"':
+                    self._in_string = False
+                    if self._depth == 1 and self._expect == "key":
+                        self._key = json.loads(buffer[self._token_start:i + 1])
+                        self._expect = "colon"
+                    elif self._depth == 1 and self._expect == "in_value":
+                        self._complete(buffer[self._token_start:i + 1], completed)
+                continue
+            if self._expect == "start":
+                if c == "{":
+                    self._depth = 1
+                    self._expect = "key"
+                continue
+            if c == '"':
+                self._in_string = True
+                if self._depth == 1 and self._expect == "key":
+                    self._token_start = i
+                elif self._depth == 1 and self._expect == "value":
+                    self._token_start = i
+                    self._expect = "in_value"
+            elif c in "{[":
+                if self._depth == 1 and self._expect == "value":
+                    self._token_start = i
+                    self._expect = "in_value"
+                self._depth += 1
+            elif c in "}]":
+                self._depth -= 1
+                if self._depth == 1 and self._expect == "in_value":
+                    self._complete(buffer[self._token_start:i + 1], completed)
+                elif self._depth == 0:
+                    if self._expect == "in_value":
+                        self._complete(buffer[self._token_start:i], completed)
+                    self._expect = "done"
+            elif self._depth == 1:
+                if c == ":" and self._expect == "colon":
+                    self._expect = "value"
+                elif c == ",":
+                    if self._expect == "in_value":
+                        self._complete(buffer[self._token_start:i], completed)
+                    self._expect = "key"
+                elif not c.isspace() and self._expect == "value":
+                    # number, true, false or null; complete at the next "," or "}"
+                    self._token_start = i
+                    self._expect = "in_value"
+        self._pos = len(buffer)
+        return completed
+
+    def _complete(self, raw: str, completed: List[Tuple[str, Any]]):
+        self._expect = "after"
+        try:
+            completed.append((self._key, json.loads(raw)))
+        except json.JSONDecodeError:
+            logger.warning(f"Could not parse streamed value of {self._key!r}")
+
+
+def _normalize_item(item: str) -> str:
+    return re.sub(r"[^\w]+", " ", item.lower()).strip()
+
+
+def merge_summaries(partials: List[Dict[str, Any]]) -> Dict[str, List[str]]:
+    """Reduce step: concatenate each section across chunks, dropping duplicate items.
+
+    Items are compared case- and punctuation-insensitively; the first wording wins and
+    chunk order is preserved.
+    """
+    merged: Dict[str, List[str]] = {}
+    for section in SUMMARY_SECTIONS:
+        seen = set()
+        items = []
+        for partial in partials:
+            for item in partial.get(section) or []:
+                if not isinstance(item, str):
+                    item = str(item)
+                key = _normalize_item(item)
+                if key and key not in seen:
+                    seen.add(key)
+                    items.append(item.strip())
+        merged[section] = items
+    return merged
+
+
+class ChunkedSummarizer:
+    """Map-reduce summarization of long transcripts.
+
+    The transcript is split into token-bounded chunks, each chunk is summarized by the chat
+    model with at most ``max_concurrency`` requests in flight, and the partial summaries are
+    merged without another model call. ``client`` is anything exposing
+    ``chat.completions.create`` (the ``openai`` module, an ``OpenAI`` instance or a test fake).
+
+    With ``on_section``, completions are streamed and each section is handed to the callback as
+    soon as every chunk has produced it (see ``SectionStreamParser``).
+    """
+
+    def __init__(self, client, model: str = "gpt-4o", token_budget: int = 6000, max_concurrency: int = 4,
+                 max_tokens: int = 2000, temperature: float = 0.3):
+        self.client = client
+        self.model = model
+        self.token_budget = token_budget
+        self.max_concurrency = max_concurrency
+        self.max_tokens = max_tokens
+        self.temperature = temperature
+
+    @property
+    def cache_version(self) -> str:
+        """Everything besides the transcript and model that changes the output."""
+        return f"{PROMPT_VERSION}:{self.token_budget}"
+
+    async def _summarize_chunk(self, chunk: List[Dict[str, Any]], part: int, parts: int,
+                               semaphore: asyncio.Semaphore, timings: List[float],
+                               tokens: Dict[str, int]) -> Dict[str, Any]:
+        transcript_text = "\n".join(format_segment(s) for s in chunk)
+        async with semaphore:
+            start = time.perf_counter()
+            # OpenAI SDK call is blocking, run in a thread
+            response = await metrics.to_thread(
+                "openai",
+                self.client.chat.completions.create,
+                model=self.model,
+                messages=[
+                    {"role": "system", "content": SYSTEM_PROMPT},
+                    {"role": "user", "content": build_prompt(transcript_text, part, parts)}
+                ],
+                max_tokens=self.max_tokens,
+                temperature=self.temperature
+            )
+            timings[part - 1] = (time.perf_counter() - start) * 1000
+        usage = getattr(response, "usage", None)
+        if usage is not None:
+            tokens["prompt"] += usage.prompt_tokens or 0
+            tokens["completion"] += usage.completion_tokens or 0
+        return parse_summary_json(response.choices[0].message.content)
+
+    def _stream_completion(self, messages: List[Dict[str, str]], on_value: Callable[[str, Any], None]):
+        """Blocking: stream one completion, calling ``on_value`` per completed top-level key."""
+        parser = SectionStreamParser()
+        content: List[str] = []
+        usage = None
+        stream = self.client.chat.completions.create(
+            model=self.model,
+            messages=messages,
+            max_tokens=self.max_tokens,
+            temperature=self.temperature,
+            stream=True,
+            stream_options={"include_usage": True}
+        )
+        for event in stream:
+            if getattr(event, "usage", None) is not None:
+                usage = event.usage
+            if not event.choices or not event.choices[0].delta.content:
+                continue
+            content.append(event.choices[0].delta.content)
+            for key, value in parser.feed(event.choices[0].delta.content):
+                on_value(key, value)
+        return "".join(content), usage
+
+    async def _stream_chunk(self, chunk: List[Dict[str, Any]], part: int, parts: int,
+                            semaphore: asyncio.Semaphore, timings: List[float], tokens: Dict[str, int],
+                            on_value: Callable[[str, Any], Awaitable[None]]) -> Dict[str, Any]:
+        transcript_text = "\n".join(format_segment(s) for s in chunk)
+        messages = [
+            {"role": "system", "content": SYSTEM_PROMPT},
+            {"role": "user", "content": build_prompt(transcript_text, part, parts)}
+        ]
+        loop = asyncio.get_running_loop()
+        values: asyncio.Queue = asyncio.Queue()
+
+        def consume():
+            try:
+                return self._stream_completion(
+                    messages, lambda key, value: loop.call_soon_threadsafe(values.put_nowait, (key, value))
+                )
+            finally:
+                loop.call_soon_threadsafe(values.put_nowait, None)
+
+        async with semaphore:
+            start = time.perf_counter()
+            # The SDK stream is a blocking iterator; read it in a thread and hand values back to the loop
+            completion = asyncio.ensure_future(metrics.to_thread("openai", consume))
+            while (item := await values.get()) is not None:
+                await on_value(*item)
+            content, usage = await completion
+            timings[part - 1] = (time.perf_counter() - start) * 1000
+        if usage is not None:
+            tokens["prompt"] += usage.prompt_tokens or 0
+            tokens["completion"] += usage.completion_tokens or 0
+        return parse_summary_json(content)
+
+    async def summarize(self, segments: List[Dict[str, Any]],
+                        on_section: Optional[Callable[[str, List[str]], Awaitable[None]]] = None
+                        ) -> Tuple[Dict[str, List[str]], Dict[str, Any]]:
+        """Summarize ``segments``; returns the merged sections and per-stage timings in ms.
+
+        ``on_section(section, items)`` is awaited once per section, in completion order.
+        """
+        start = time.perf_counter()
+        chunks = chunk_segments(segments, self.token_budget)
+        split_done = time.perf_counter()
+
+        chunk_ms = [0.0] * len(chunks)
+        tokens = {"prompt": 0, "completion": 0}
+        semaphore = asyncio.Semaphore(self.max_concurrency)
+        delivered: Dict[str, List[str]] = {}
+        first_section: List[float] = []
+        if on_section is None:
+            partials = await asyncio.gather(*(
+                self._summarize_chunk(chunk, i + 1, len(chunks), semaphore, chunk_ms, tokens)
+                for i, chunk in enumerate(chunks)
+            ))
+        else:
+            received: Dict[str, List[Dict[str, Any]]] = {}
+
+            async def deliver(section: str, items: List[str]):
+                delivered[section] = items
+                if not first_section:
+                    first_section.append(time.perf_counter())
+                await on_section(section, items)
+
+            async def on_value(key: str, value: Any):
+                # A section is final once every chunk has produced it
+                if key not in SUMMARY_SECTIONS or key in delivered:
+                    return
+                received.setdefault(key, []).append({key: value})
+                if len(received[key]) == len(chunks):
+                    await deliver(key, merge_summaries(received[key])[key])
+
+            partials = await asyncio.gather(*(
+                self._stream_chunk(chunk, i + 1, len(chunks), semaphore, chunk_ms, tokens, on_value)
+                for i, chunk in enumerate(chunks)
+            ))
+        map_done = time.perf_counter()
+
+        merged = merge_summaries(partials)
+        if on_section is not None:
+            # Sections the model left out (or that did not parse while streaming)
+            for section in SUMMARY_SECTIONS:
+                if section not in delivered:
+                    await deliver(section, merged[section])
+        end = time.perf_counter()
+
+        timings = {
+            "chunks": len(chunks),
+            "split_ms": round((split_done - start) * 1000, 2),
+            "map_ms": round((map_done - split_done) * 1000, 2),
+            "reduce_ms": round((end - map_done) * 1000, 2),
+            "total_ms": round((end - start) * 1000, 2),
+            "chunk_ms": [round(ms, 2) for ms in chunk_ms],
+            "prompt_tokens": tokens["prompt"],
+            "completion_tokens": tokens["completion"],
+        }
+        if first_section:
+            timings["first_section_ms"] = round((first_section[0] - start) * 1000, 2)
+        logger.info(f"Summarized {len(segments)} segments in {len(chunks)} chunks: {timings['total_ms']} ms")
+        return merged, timings
@@ -0,0 +1,110 @@
+import hashlib
+import json
+import logging
+import re
+from collections import OrderedDict
+from datetime import datetime
+from typing import Any, Dict, Optional
+
+from pymongo import ASCENDING
+
+logger = logging.getLogger(__name__)
+
+
+def normalize_transcript(transcript_text: str) -> str:
+    """Collapse whitespace so cosmetic differences don't defeat the cache."""
+    return "\n".join(re.sub(r"\s+", " ", line).strip() for line in transcript_text.splitlines() if line.strip())
+
+
+def summary_cache_key(transcript_text: str, model: str, prompt_version: str) -> str:
+    """Content address of a summary: hash of the normalized transcript, model and prompt version."""
+    digest = hashlib.sha256()
+    for part in (model, prompt_version, normalize_transcript(transcript_text)):
+        digest.update(part.encode())
+        digest.update(b"\0")
+    return digest.hexdigest()
+
+
+class SummaryCache:
+    """Two-tier cache of generated summaries keyed by ``summary_cache_key``.
+
+    The first tier is an in-process LRU bounded by the serialized size of its entries; the
+    second is a MongoDB collection with a TTL index, shared by every worker and surviving
+    restarts. Hits in the second tier are promoted into the first.
+    """
+
+    def __init__(self, collection=None, max_bytes: int = 8 * 1024 * 1024, ttl_seconds: int = 30 * 24 * 3600):
+        self.collection = collection
+        self.max_bytes = max_bytes
+        self.ttl_seconds = ttl_seconds
+        self._entries: "OrderedDict[str, Dict[str, Any]]" = OrderedDict()
+        self._sizes: Dict[str, int] = {}
+        self._bytes = 0
+        self.memory_hits = 0
+        self.store_hits = 0
+        self.misses = 0
+        self.evictions = 0
+
+    async def ensure_indexes(self):
+        if self.collection is not None:
+            await self.collection.create_index(
+                [("created_at", ASCENDING)], expireAfterSeconds=self.ttl_seconds
+            )
+
+    def _remember(self, key: str, summary: Dict[str, Any]):
+        size = len(json.dumps(summary))
+        if size > self.max_bytes:
+            return
+        if key in self._entries:
+            self._bytes -= self._sizes[key]
+        self._entries[key] = summary
+        self._entries.move_to_end(key)
+        self._sizes[key] = size
+        self._bytes += size
+        while self._bytes > self.max_bytes:
+            evicted, _ = self._entries.popitem(last=False)
+            self._bytes -= self._sizes.pop(evicted)
+            self.evictions += 1
+
+    async def get(self, key: str) -> Optional[Dict[str, Any]]:
+        if key in self._entries:
+            self._entries.move_to_end(key)
+            self.memory_hits += 1
+            return self._entries[key]
+        if self.collection is not None:
+            try:
+                doc = await self.collection.find_one({"_id": key}, {"summary": 1})
+            except Exception as e:
+                logger.error(f"Summary cache lookup failed for {key[:12]}: {e}")
+                doc = None
+            if doc:
+                self.store_hits += 1
+                self._remember(key, doc["summary"])
+                return doc["summary"]
+        self.misses += 1
+        return None
+
+    async def set(self, key: str, summary: Dict[str, Any], model: str = None):
+        self._remember(key, summary)
+        if self.collection is not None:
+            try:
+                await self.collection.replace_one(
+                    {"_id": key},
+                    {"summary": summary, "model": model, "created_at": datetime.utcnow()},
+                    upsert=True
+                )
+            except Exception as e:
+                logger.error(f"Summary cache write failed for {key[:12]}: {e}")
+
+    def stats(self) -> Dict[str, Any]:
+        lookups = self.memory_hits + self.store_hits + self.misses
+        return {
+            "memory_hits": self.memory_hits,
+            "store_hits": self.store_hits,
+            "misses": self.misses,
+            "hit_ratio": round((self.memory_hits + self.store_hits) / lookups, 4) if lookups else 0.0,
+            "evictions": self.evictions,
+            "entries": len(self._entries),
+            "bytes": self._bytes,
+            "max_bytes": self.max_bytes,
+        }
@@ -0,0 +1,111 @@
+import asyncio
+
+import pytest
+
+from audio_ingest import AudioIngest
+
+# 16 kHz mono linear16 in 10 ms frames: 320 bytes per frame
+FRAME = 320
+
+
+def frame(i):
+    return bytes([i % 256]) * FRAME
+
+
+class Upstream:
+    """Records what was sent; while ``gate`` is set, each send waits for it (a stalled Deepgram socket)."""
+
+    def __init__(self, fail_on=()):
+        self.sent = []
+        self.fail_on = set(fail_on)
+        self.gate = None
+
+    async def send(self, data):
+        if self.gate is not None:
+            await self.gate.wait()
+        if len(self.sent) in self.fail_on:
+            self.fail_on.discard(len(self.sent))
+            raise ConnectionError("socket closed")
+        self.sent.append(data)
+
+
+def make_ingest(upstream, **kwargs):
+    return AudioIngest(upstream.send, frame_ms=10, **kwargs)
+
+
+def test_coalesces_chunks_of_any_size_into_frames():
+    async def run():
+        upstream = Upstream()
+        ingest = make_ingest(upstream)
+        audio = b"".join(frame(i) for i in range(5)) + b"\x07" * 101
+        for start in range(0, len(audio), 77):
+            await ingest.feed(audio[start:start + 77])
+        await asyncio.sleep(0)
+        sent_before_close = list(upstream.sent)
+        await ingest.close()
+        return upstream, ingest, sent_before_close, audio
+
+    upstream, ingest, sent_before_close, audio = asyncio.run(run())
+    assert sent_before_close == [frame(i) for i in range(5)]
+    # The partial tail goes out on close, trimmed to whole samples
+    assert upstream.sent[-1] == b"\x07" * 100
+    assert b"".join(upstream.sent) == audio[:-1]
+    stats = ingest.stats()
+    assert (stats["frames_out"], stats["dropped_frames"], stats["queue_depth"]) == (6, 0, 0)
+
+
+@pytest.mark.parametrize("policy, kept", [
+    ("drop_oldest", [0, 5, 6, 7]),  # frame 0 was already being sent when the queue filled
+    ("drop_newest", [0, 1, 2, 3]),
+])
+def test_overflow_policy_when_the_upstream_stalls(policy, kept):
+    async def run():
+        upstream = Upstream()
+        upstream.gate = asyncio.Event()
+        ingest = make_ingest(upstream, max_queued_frames=3, policy=policy)
+        for i in range(8):
+            await ingest.feed(frame(i))
+            await asyncio.sleep(0)
+        depth_while_stalled = ingest.queue_depth
+        upstream.gate.set()
+        await ingest.close()
+        return upstream, ingest, depth_while_stalled
+
+    upstream, ingest, depth_while_stalled = asyncio.run(run())
+    assert depth_while_stalled == 3
+    assert upstream.sent == [frame(i) for i in kept]
+    stats = ingest.stats()
+    assert (stats["dropped_frames"], stats["dropped_bytes"], stats["max_queue_depth"]) == (4, 4 * FRAME, 3)
+
+
+def test_unknown_policy_is_rejected():
+    with pytest.raises(ValueError):
+        make_ingest(Upstream(), policy="block")
+
+
+def test_a_failed_send_is_counted_and_the_rest_still_go_out():
+    async def run():
+        upstream = Upstream(fail_on={1})
+        ingest = make_ingest(upstream)
+        for i in range(3):
+            await ingest.feed(frame(i))
+        await ingest.close()
+        return upstream, ingest
+
+    upstream, ingest = asyncio.run(run())
+    assert upstream.sent == [frame(0), frame(2)]
+    stats = ingest.stats()
+    assert (stats["send_errors"], stats["dropped_frames"], stats["frames_out"]) == (1, 1, 2)
+
+
+def test_feed_after_close_is_ignored():
+    async def run():
+        upstream = Upstream()
+        ingest = make_ingest(upstream)
+        await ingest.close()
+        await ingest.feed(frame(0))
+        return upstream, ingest
+
+    upstream, ingest = asyncio.run(run())
+    assert upstream.sent == []
+    assert ingest.stats()["chunks_in"] == 0
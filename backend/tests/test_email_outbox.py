@@ -0,0 +1,132 @@
+import asyncio
+from datetime import datetime, timedelta
+
+import pytest
+
+from email_outbox import EmailOutbox
+
+mongomock_motor = pytest.importorskip("mongomock_motor")
+
+SENDER = {"email": "meetings@example.com", "name": None}
+
+
+class FakeProvider:
+    """``send_batch`` stand-in failing for the addresses in ``bad`` (a batch fails if any of them is in it)."""
+
+    def __init__(self, bad=()):
+        self.bad = set(bad)
+        self.batches = []
+
+    def __call__(self, sender, recipients, subject, body):
+        self.batches.append(list(recipients))
+        if self.bad.intersection(recipients):
+            raise RuntimeError("HTTP Error 400: Bad Request")
+
+
+def make_outbox(provider, owner="w1", collection=None, **kwargs):
+    if collection is None:
+        collection = mongomock_motor.AsyncMongoMockClient()["test"].email_logs
+    kwargs.setdefault("base_delay", 0.0)
+    return EmailOutbox(collection, provider, owner=owner, **kwargs)
+
+
+async def make_due(outbox, outbox_id):
+    await outbox.collection.update_one({"id": outbox_id}, {"$set": {"next_attempt_at": datetime.utcnow()}})
+
+
+def test_delivers_in_batches_and_marks_every_recipient_sent():
+    async def run():
+        provider = FakeProvider()
+        outbox = make_outbox(provider, batch_size=2)
+        outbox_id = await outbox.enqueue("m", SENDER, "Subject", "Body", ["a@x", " b@x ", "a@x", "c@x", ""])
+        assert await outbox.due_ids() == [outbox_id]
+        return provider, await outbox.deliver(outbox_id), await outbox.due_ids()
+
+    provider, doc, due = asyncio.run(run())
+    assert provider.batches == [["a@x", "b@x"], ["c@x"]]
+    assert doc["status"] == "sent" and doc["attempts"] == 1 and doc["sent_at"] is not None
+    assert [(r["email"], r["status"]) for r in doc["recipients"]] == [("a@x", "sent"), ("b@x", "sent"), ("c@x", "sent")]
+    assert doc["lease_owner"] is None and due == []
+
+
+def test_failed_recipients_are_rescheduled_then_retried_one_by_one():
+    async def run():
+        provider = FakeProvider(bad={"bad@x"})
+        outbox = make_outbox(provider, max_attempts=3, base_delay=60.0)
+        outbox_id = await outbox.enqueue("m", SENDER, "Subject", "Body", ["ok@x", "bad@x", "also@x"])
+        first = await outbox.deliver(outbox_id)
+        not_due = await outbox.deliver(outbox_id)
+        await make_due(outbox, outbox_id)
+        second = await outbox.deliver(outbox_id)
+        return provider, first, not_due, second
+
+    provider, first, not_due, second = asyncio.run(run())
+    assert first["status"] == "pending" and first["attempts"] == 1
+    assert first["next_attempt_at"] > datetime.utcnow() + timedelta(seconds=50)
+    assert not_due is None
+    assert provider.batches == [["ok@x", "bad@x", "also@x"], ["ok@x"], ["bad@x"], ["also@x"]]
+    assert second["status"] == "pending" and second["attempts"] == 2
+    assert [r["status"] for r in second["recipients"]] == ["sent", "pending", "sent"]
+
+
+def test_gives_up_after_max_attempts():
+    async def run():
+        provider = FakeProvider(bad={"bad@x"})
+        outbox = make_outbox(provider, max_attempts=2)
+        outbox_id = await outbox.enqueue("m", SENDER, "Subject", "Body", ["ok@x", "bad@x"])
+        await outbox.deliver(outbox_id)
+        await make_due(outbox, outbox_id)
+        doc = await outbox.deliver(outbox_id)
+        stored = await outbox.collection.find_one({"id": outbox_id}, {"_id": 0})
+        return doc, stored, await outbox.due_ids()
+
+    doc, stored, due = asyncio.run(run())
+    assert doc["status"] == stored["status"] == "partial"
+    assert [(r["status"], r["attempts"]) for r in stored["recipients"]] == [("sent", 2), ("failed", 2)]
+    assert stored["recipients"][1]["last_error"] == "HTTP Error 400: Bad Request"
+    assert due == []
+
+
+def test_every_recipient_failing_marks_the_entry_failed():
+    async def run():
+        outbox = make_outbox(FakeProvider(bad={"bad@x"}), max_attempts=1)
+        outbox_id = await outbox.enqueue("m", SENDER, "Subject", "Body", ["bad@x"])
+        return await outbox.deliver(outbox_id)
+
+    assert asyncio.run(run())["status"] == "failed"
+
+
+def test_an_entry_leased_by_another_worker_is_skipped_until_the_lease_expires():
+    async def run():
+        collection = mongomock_motor.AsyncMongoMockClient()["test"].email_logs
+        provider = FakeProvider()
+        ours, theirs = make_outbox(provider, "w1", collection), make_outbox(provider, "w2", collection)
+        outbox_id = await ours.enqueue("m", SENDER, "Subject", "Body", ["a@x"])
+        await collection.update_one({"id": outbox_id}, {"$set": {
+            "status": "sending", "lease_owner": "w2", "lease_until": datetime.utcnow() + timedelta(minutes=5)
+        }})
+        skipped, due_while_leased = await ours.deliver(outbox_id), await ours.due_ids()
+        # w2 died mid-round: its lease runs out and the entry is due again
+        await collection.update_one({"id": outbox_id}, {"$set": {"lease_until": datetime.utcnow()}})
+        taken_over = await ours.deliver(outbox_id)
+        return provider, skipped, due_while_leased, taken_over, await theirs.deliver(outbox_id)
+
+    provider, skipped, due_while_leased, taken_over, finished = asyncio.run(run())
+    assert skipped is None and due_while_leased == []
+    assert taken_over["status"] == "sent"
+    assert finished is None
+    assert provider.batches == [["a@x"]]
+
+
+def test_concurrent_deliveries_send_once():
+    async def run():
+        collection = mongomock_motor.AsyncMongoMockClient()["test"].email_logs
+        provider = FakeProvider()
+        workers = [make_outbox(provider, f"w{i}", collection) for i in range(3)]
+        outbox_id = await workers[0].enqueue("m", SENDER, "Subject", "Body", ["a@x", "b@x"])
+        results = await asyncio.gather(*(worker.deliver(outbox_id) for worker in workers))
+        return provider, results
+
+    provider, results = asyncio.run(run())
+    assert provider.batches == [["a@x", "b@x"]]
+    assert [result is not None for result in results].count(True) == 1
@@ -0,0 +1,130 @@
+import asyncio
+import csv
+import io
+import json
+import zipfile
+from datetime import datetime
+
+import pytest
+
+from export import CSV_COLUMNS, MeetingExporter, export_query, markdown_filename
+from transcript_store import TranscriptStore
+
+mongomock_motor = pytest.importorskip("mongomock_motor")
+
+MEETINGS = [
+    {"id": "planning-2", "title": "Planning", "host": "Ana", "participants": ["Ana", "Bob"],
+     "timestamp": datetime(2024, 1, 1, 9), "status": "completed",
+     "summary": {"key_points": ["Ship the beta"], "action_items": ["Bob writes the notes"]}},
+    {"id": "retro-1", "title": "Retro, \"quick\"", "host": "Bob", "participants": ["Bob"],
+     "timestamp": datetime(2024, 2, 1, 9), "status": "completed", "summary": {}},
+    {"id": "planning-1", "title": "Planning", "host": "Ana", "participants": ["Ana"],
+     "timestamp": datetime(2024, 1, 1, 9), "status": "active"},
+]
+
+SEGMENTS = {
+    "planning-2": [{"id": f"o{i}", "text": f"old line {i}", "speaker": "Ana" if i % 2 else "Bob",
+               "timestamp": float(i), "confidence": 0.9} for i in range(7)],
+    "retro-1": [{"id": "n0", "text": "a, line with \"quotes\"\nand a newline", "speaker": "Bob",
+               "timestamp": 1.5, "confidence": 0.8}],
+}
+
+
+def make_exporter(**kwargs):
+    async def setup():
+        db = mongomock_motor.AsyncMongoMockClient()["test"]
+        await db.meetings.insert_many([dict(meeting) for meeting in MEETINGS])
+        store = TranscriptStore(db.transcript_buckets, max_segments=3)
+        for meeting_id, segments in SEGMENTS.items():
+            await store.append(meeting_id, segments)
+        return MeetingExporter(db.meetings, store, **kwargs)
+
+    return setup()
+
+
+async def collect(exporter, export_format, query=None):
+    return [chunk async for chunk in exporter.stream(export_format, query or {})]
+
+
+def test_export_query():
+    start, end = datetime(2024, 1, 1), datetime(2024, 2, 1)
+    assert export_query() == {}
+    assert export_query(start, end, "Ana", "beta") == {
+        "timestamp": {"$gte": start, "$lt": end}, "participants": "Ana", "$text": {"$search": "beta"}
+    }
+    assert export_query(end=end) == {"timestamp": {"$lt": end}}
+
+
+def test_ndjson_has_one_meeting_per_line_with_its_transcript():
+    async def run():
+        exporter = await make_exporter(batch_size=1, chunk_bytes=64)
+        return exporter, await collect(exporter, "ndjson")
+
+    exporter, chunks = asyncio.run(run())
+    assert len(chunks) > 1
+    records = [json.loads(line) for line in b"".join(chunks).decode().splitlines()]
+    assert [record["id"] for record in records] == ["retro-1", "planning-2", "planning-1"]
+    assert records[1]["transcript"] == SEGMENTS["planning-2"]
+    assert records[1]["timestamp"] == "2024-01-01T09:00:00"
+    assert records[2]["transcript"] == []
+    assert exporter.meetings_exported == 3
+    assert exporter.bytes_exported == sum(len(chunk) for chunk in chunks)
+
+
+def test_ndjson_applies_the_query():
+    async def run():
+        exporter = await make_exporter()
+        return await collect(exporter, "ndjson", export_query(participant="Bob"))
+
+    records = [json.loads(line) for line in b"".join(asyncio.run(run())).splitlines()]
+    assert [record["id"] for record in records] == ["retro-1", "planning-2"]
+
+
+def test_csv_has_one_row_per_segment():
+    async def run():
+        exporter = await make_exporter(chunk_bytes=100)
+        return exporter, await collect(exporter, "csv")
+
+    exporter, chunks = asyncio.run(run())
+    assert len(chunks) > 1
+    rows = list(csv.reader(io.StringIO(b"".join(chunks).decode())))
+    assert rows[0] == CSV_COLUMNS
+    assert rows[1] == ["retro-1", "Retro, \"quick\"", "2024-02-01T09:00:00", "n0", "1.5", "Bob", "0.8",
+                       "a, line with \"quotes\"\nand a newline"]
+    assert [row[3] for row in rows[2:]] == [f"o{i}" for i in range(7)]
+    assert exporter.meetings_exported == 3
+
+
+def test_markdown_zip_has_one_file_per_meeting():
+    async def run():
+        exporter = await make_exporter(chunk_bytes=256)
+        return exporter, await collect(exporter, "markdown")
+
+    exporter, chunks = asyncio.run(run())
+    archive = zipfile.ZipFile(io.BytesIO(b"".join(chunks)))
+    assert archive.testzip() is None
+    names = archive.namelist()
+    # Two meetings share a date, title and id prefix: the second file name carries the full id
+    assert names == ["2024-02-01-retro-quick-retro-1.md", "2024-01-01-planning-planning.md",
+                     "2024-01-01-planning-planning-planning-1.md"]
+    planning = archive.read(names[1]).decode()
+    assert planning.startswith("# Planning\n")
+    assert "### Key Points\n- Ship the beta" in planning
+    assert "### Action Items\n- Bob writes the notes" in planning
+    assert planning.endswith("## Transcript\n\n" + "\n".join(
+        f"[{i}.0s] **{'Ana' if i % 2 else 'Bob'}:** old line {i}  " for i in range(7)) + "\n")
+    assert "## Summary" not in archive.read(names[0]).decode()
+    assert exporter.bytes_exported == sum(len(chunk) for chunk in chunks)
+
+
+def test_markdown_filename_without_timestamp_or_title():
+    assert markdown_filename({"id": "0123456789", "title": "  ***  "}) == "undated-meeting-01234567.md"
+
+
+def test_unknown_format_is_rejected():
+    async def run():
+        exporter = await make_exporter()
+        exporter.stream("xml", {})
+
+    with pytest.raises(ValueError):
+        asyncio.run(run())
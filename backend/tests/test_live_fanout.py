@@ -0,0 +1,142 @@
+import asyncio
+import random
+
+import pytest
+
+from live_fanout import LiveFanout, apply_interim_delta, interim_delta
+
+
+class Room:
+    def __init__(self):
+        self.events = []
+
+    async def emit(self, event, data, to=None):
+        self.events.append((event, data, to))
+
+    def interims(self):
+        return [data for event, data, _ in self.events if event == "transcript_interim"]
+
+
+def replay(interims):
+    """What a viewer that saw every interim displays after each one."""
+    shown, text = [], ""
+    for delta in interims:
+        text = apply_interim_delta(text, delta)
+        shown.append(text)
+    return shown
+
+
+@pytest.mark.parametrize("previous, text, delta", [
+    ("", "hello", {"keep": 0, "append": "hello"}),
+    ("hello", "hello world", {"keep": 5, "append": " world"}),
+    ("hello world", "hello word", {"keep": 9, "append": "d"}),
+    ("abc", "", {"keep": 0, "append": ""}),
+    ("same", "same", {"keep": 4, "append": ""}),
+])
+def test_delta(previous, text, delta):
+    assert interim_delta(previous, text) == delta
+    assert apply_interim_delta(previous, delta) == text
+
+
+def test_random_delta_round_trips():
+    rng = random.Random(3)
+    for _ in range(500):
+        previous = "".join(rng.choice("ab ") for _ in range(rng.randint(0, 12)))
+        text = previous[:rng.randint(0, len(previous))] + "".join(rng.choice("ab ") for _ in range(rng.randint(0, 6)))
+        assert apply_interim_delta(previous, interim_delta(previous, text)) == text
+
+
+def test_interims_within_the_window_are_coalesced():
+    async def run():
+        room = Room()
+        fanout = LiveFanout(room.emit, "meeting", "speaker-1", debounce=0.05)
+        for text in ["we", "we should", "we should ship"]:
+            await fanout.interim(text)
+        sent_at_once = len(room.interims())
+        await asyncio.sleep(0.1)
+        return room, fanout, sent_at_once
+
+    room, fanout, sent_at_once = asyncio.run(run())
+    assert sent_at_once == 1
+    assert room.interims() == [
+        {"stream": "speaker-1", "seq": 0, "keep": 0, "append": "we"},
+        {"stream": "speaker-1", "seq": 1, "keep": 2, "append": " should ship"},
+    ]
+    assert {to for _, _, to in room.events} == {"meeting"}
+    assert fanout.stats() == {"interims_received": 3, "interims_sent": 2, "finals_sent": 0}
+
+
+def test_unchanged_interim_is_not_resent():
+    async def run():
+        room = Room()
+        fanout = LiveFanout(room.emit, "meeting", "s", debounce=0.02)
+        await fanout.interim("hello")
+        await fanout.interim("hello")
+        await asyncio.sleep(0.05)
+        return room
+
+    assert len(asyncio.run(run()).interims()) == 1
+
+
+def test_final_drops_the_pending_interim_and_restarts_the_delta_chain():
+    async def run():
+        room = Room()
+        fanout = LiveFanout(room.emit, "meeting", "s", debounce=0.05)
+        await fanout.interim("let's")
+        await fanout.interim("let's ship")
+        await fanout.final({"text": "Let's ship it.", "is_final": True})
+        await asyncio.sleep(0.1)
+        await fanout.interim("next")
+        return room
+
+    room = asyncio.run(run())
+    assert [event for event, _, _ in room.events] == ["transcript_interim", "transcript_update", "transcript_interim"]
+    assert room.events[1][1] == {"type": "transcript", "stream": "s", "data": {"text": "Let's ship it.", "is_final": True}}
+    assert room.interims()[1] == {"stream": "s", "seq": 1, "keep": 0, "append": "next"}
+
+
+def test_viewers_rebuild_every_sent_interim():
+    async def run():
+        room = Room()
+        fanout = LiveFanout(room.emit, "meeting", "s", debounce=0.05)
+        words = "so the plan is to ship the beta next friday".split()
+        for i in range(1, len(words) + 1):
+            await fanout.interim(" ".join(words[:i]))
+            await asyncio.sleep(0.004)
+        await asyncio.sleep(0.1)
+        return room, " ".join(words)
+
+    room, text = asyncio.run(run())
+    shown = replay(room.interims())
+    assert shown[-1] == text
+    assert len(shown) < len(text.split())
+    assert [delta["seq"] for delta in room.interims()] == list(range(len(shown)))
+
+
+def test_close_cancels_the_timed_flush():
+    async def run():
+        room = Room()
+        fanout = LiveFanout(room.emit, "meeting", "s", debounce=0.05)
+        await fanout.interim("one")
+        await fanout.interim("one two")
+        fanout.close()
+        await asyncio.sleep(0.1)
+        return room
+
+    assert [delta["append"] for delta in asyncio.run(run()).interims()] == ["one"]
+
+
+def test_emit_failures_are_logged_not_raised(caplog):
+    async def broken(event, data, to=None):
+        raise ConnectionError("message queue down")
+
+    async def run():
+        fanout = LiveFanout(broken, "meeting", "s", debounce=0.01)
+        await fanout.interim("one")
+        await fanout.interim("one two")
+        await asyncio.sleep(0.05)
+        return fanout
+
+    fanout = asyncio.run(run())
+    assert fanout.stats()["interims_sent"] == 2
+    assert "message queue down" in caplog.text
@@ -0,0 +1,38 @@
+from datetime import datetime
+
+import pytest
+
+from pagination import decode_cursor, decode_token, encode_cursor, encode_token, keyset_filter
+
+
+def test_cursor_round_trip():
+    timestamp = datetime(2024, 3, 1, 9, 30, 15, 123000)
+    cursor = encode_cursor(timestamp, "meeting-1")
+    assert "=" not in cursor
+    assert decode_cursor(cursor) == (timestamp, "meeting-1")
+
+
+def test_token_round_trip():
+    values = [0.75, "segment-9", None]
+    assert decode_token(encode_token(values)) == values
+
+
+@pytest.mark.parametrize("token", ["", "not base64!", encode_token({"a": 1}), "e30"])
+def test_decode_token_rejects_malformed_tokens(token):
+    with pytest.raises(ValueError):
+        decode_token(token)
+
+
+@pytest.mark.parametrize("values", [["2024-03-01T09:30:00"], ["yesterday", "meeting-1"], [1, 2, 3]])
+def test_decode_cursor_rejects_malformed_positions(values):
+    with pytest.raises(ValueError):
+        decode_cursor(encode_token(values))
+
+
+def test_keyset_filter():
+    timestamp = datetime(2024, 3, 1, 9, 30)
+    assert keyset_filter(None) == {}
+    assert keyset_filter(encode_cursor(timestamp, "m2")) == {"$or": [
+        {"timestamp": {"$lt": timestamp}},
+        {"timestamp": timestamp, "id": {"$lt": "m2"}},
+    ]}
@@ -0,0 +1,104 @@
+"""Smoke tests of server.py in each SERVER_MODE, with fake providers and an in-memory MongoDB.
+
+``server`` binds its event loop (and, under eventlet, monkey-patches the interpreter) when it is
+imported, so every mode runs in its own subprocess.
+"""
+import json
+import os
+import socket
+import subprocess
+import sys
+import time
+import urllib.request
+from pathlib import Path
+
+import pytest
+
+pytest.importorskip("mongomock_motor")
+
+BACKEND = Path(__file__).resolve().parent.parent
+
+TEST_CLIENT_SCRIPT = """
+import json
+import server
+
+if server.SERVER_MODE == "asgi":
+    server.start_event_loop_thread()
+client = server.app.test_client()
+
+created = client.post("/api/meetings", json={"title": "Weekly sync", "participants": ["ana@example.com"]})
+assert created.status_code == 201, created.get_data(as_text=True)
+meeting_id = created.get_json()["id"]
+saved = client.post(f"/api/meetings/{meeting_id}/transcript",
+                    json={"segments": [{"text": "Let's ship on Friday", "speaker": "Ana", "timestamp": 1.5}]})
+assert saved.status_code == 200, saved.get_data(as_text=True)
+
+meeting = client.get(f"/api/meetings/{meeting_id}").get_json()
+listed = client.get("/api/meetings").get_json()
+transcript = client.get(f"/api/meetings/{meeting_id}/transcript").get_json()
+print(json.dumps({"mode": server.SERVER_MODE, "meeting": meeting, "listed": listed, "transcript": transcript}))
+"""
+
+
+def server_env(mode):
+    env = {key: value for key, value in os.environ.items() if key not in ("EVENTLET_HUB", "MONGO_URL")}
+    env.update(SERVER_MODE=mode, PROVIDERS="fake", MONGO_URL="mongomock://", DB_NAME="smoke_test")
+    return env
+
+
+@pytest.mark.parametrize("mode", ["eventlet", "asgi"])
+def test_create_meeting_through_the_test_client(mode):
+    result = subprocess.run([sys.executable, "-c", TEST_CLIENT_SCRIPT], cwd=BACKEND, env=server_env(mode),
+                            capture_output=True, text=True, timeout=60)
+    assert result.returncode == 0, result.stderr
+    output = json.loads(result.stdout.strip().splitlines()[-1])
+    assert output["mode"] == mode
+    assert output["meeting"]["title"] == "Weekly sync"
+    assert output["meeting"]["segments_count"] == 1
+    assert [m["id"] for m in output["listed"]["meetings"]] == [output["meeting"]["id"]]
+    assert "Let's ship on Friday" in json.dumps(output["transcript"])
+
+
+def free_port():
+    with socket.socket() as sock:
+        sock.bind(("127.0.0.1", 0))
+        return sock.getsockname()[1]
+
+
+def request_json(url, body=None, timeout=10):
+    data = json.dumps(body).encode() if body is not None else None
+    req = urllib.request.Request(url, data=data, headers={"Content-Type": "application/json"})
+    with urllib.request.urlopen(req, timeout=timeout) as response:
+        return response.status, json.loads(response.read())
+
+
+def test_create_meeting_over_uvicorn():
+    """A request body read through the ASGI adapter while async views run on the server's loop."""
+    pytest.importorskip("uvicorn")
+    port = free_port()
+    process = subprocess.Popen(
+        [sys.executable, "-m", "uvicorn", "asgi:app", "--host", "127.0.0.1", "--port", str(port)],
+        cwd=BACKEND, env=server_env("asgi"), stdout=subprocess.DEVNULL, stderr=subprocess.PIPE, text=True
+    )
+    base = f"http://127.0.0.1:{port}/api"
+    try:
+        deadline = time.monotonic() + 30
+        while True:
+            try:
+                request_json(f"{base}/", timeout=1)
+                break
+            except OSError:
+                if process.poll() is not None or time.monotonic() > deadline:
+                    pytest.fail(f"uvicorn did not start: {process.stderr.read() if process.poll() is not None else ''}")
+                time.sleep(0.2)
+        status, meeting = request_json(f"{base}/meetings", {"title": "Over ASGI"})
+        assert status == 201
+        status, fetched = request_json(f"{base}/meetings/{meeting['id']}")
+        assert (status, fetched["title"]) == (200, "Over ASGI")
+    finally:
+        process.terminate()
+        try:
+            process.wait(timeout=10)
+        except subprocess.TimeoutExpired:
+            process.kill()
+            process.wait()
@@ -0,0 +1,86 @@
+import random
+
+import numpy as np
+import pytest
+
+from similarity import TfidfIndex, term_counts, tokenize
+
+WORDS = [f"w{i}" for i in range(60)]
+
+
+def random_index(seed, items=160, n_features=4096):
+    """Short "action items" over a small vocabulary, with verbatim repeats and some removed rows."""
+    rng = random.Random(seed)
+    index = TfidfIndex(n_features=n_features)
+    texts = {}
+    for i in range(items):
+        if texts and rng.random() < 0.15:
+            text = rng.choice(list(texts.values()))
+        elif texts and rng.random() < 0.4:
+            words = rng.choice(list(texts.values())).split()
+            words[rng.randrange(len(words))] = rng.choice(WORDS)
+            text = " ".join(words)
+        else:
+            text = " ".join(rng.choice(WORDS) for _ in range(rng.randint(2, 7)))
+        texts[f"item-{i}"] = text
+        index.upsert(f"item-{i}", term_counts(tokenize(text), n_features))
+    for key in rng.sample(sorted(texts), 20):
+        index.remove(key)
+        del texts[key]
+    return index, sorted(texts)
+
+
+def brute_force_groups(index, keys, threshold):
+    """Every pair compared in float64, then linked transitively with union-find."""
+    vectors = index.weighted()[index.rows(keys)].toarray().astype(np.float64)
+    scores = vectors @ vectors.T
+    parent = list(range(len(keys)))
+
+    def find(i):
+        while parent[i] != i:
+            parent[i] = parent[parent[i]]
+            i = parent[i]
+        return i
+
+    for i in range(len(keys)):
+        for j in range(i + 1, len(keys)):
+            if scores[i, j] >= threshold:
+                parent[find(i)] = find(j)
+    groups = {}
+    for i, key in enumerate(keys):
+        groups.setdefault(find(i), set()).add(key)
+    return {frozenset(group) for group in groups.values()}, scores
+
+
+def refines(finer, coarser):
+    return all(any(group <= other for other in coarser) for group in finer)
+
+
+@pytest.mark.parametrize("seed", [1, 2, 3])
+@pytest.mark.parametrize("threshold", [0.3, 0.6, 0.85])
+def test_near_duplicate_groups_match_pairwise_comparison(seed, threshold):
+    index, keys = random_index(seed)
+    groups = {frozenset(group) for group in index.near_duplicate_groups(keys, threshold, block_size=7, pair_batch=5)}
+    assert sorted(key for group in groups for key in group) == keys
+    # The index scores in float32: a pair within 1e-4 of the threshold may fall either way
+    strict, _ = brute_force_groups(index, keys, threshold + 1e-4)
+    loose, _ = brute_force_groups(index, keys, threshold - 1e-4)
+    assert refines(strict, groups) and refines(groups, loose)
+    assert any(len(group) > 1 for group in strict)
+
+
+def test_near_duplicate_groups_of_a_subset_ignore_other_rows():
+    index, keys = random_index(4)
+    subset = keys[::3] + ["unknown-key"]
+    expected, _ = brute_force_groups(index, keys[::3], 0.5)
+    assert {frozenset(group) for group in index.near_duplicate_groups(subset, 0.5)} == expected
+    assert index.near_duplicate_groups(["unknown-key"], 0.5) == []
+
+
+def test_most_similar_matches_pairwise_scores():
+    index, keys = random_index(5)
+    _, scores = brute_force_groups(index, keys, 1.0)
+    row = keys.index(keys[10])
+    order = [i for i in np.argsort(-scores[row], kind="stable") if i != row][:5]
+    result = index.most_similar(keys[10], limit=5)
+    assert [score for _, score in result] == pytest.approx([scores[row, i] for i in order], abs=1e-5)
@@ -0,0 +1,84 @@
+import json
+import random
+
+import pytest
+
+from summarizer import SectionStreamParser, chunk_segments, estimate_tokens, format_segment, merge_summaries
+
+SECTIONS = {
+    "key_points": ["Budget {Q3} approved", 'Vendor said "no, not yet"', "Path C:\\shared\\plans"],
+    "decisions_made": [],
+    "action_items": ["Ana: send the [draft] by Friday, then review", "Ünïcode – ok"],
+    "attendees": 4,
+    "recorded": True,
+    "notes": None,
+}
+REPLY = "```json\n" + json.dumps(SECTIONS, ensure_ascii=False, indent=2) + "\n```"
+
+
+def parse(chunks):
+    parser = SectionStreamParser()
+    completed = []
+    for chunk in chunks:
+        completed += parser.feed(chunk)
+    return completed
+
+
+def test_whole_reply():
+    assert parse([REPLY]) == list(SECTIONS.items())
+
+
+@pytest.mark.parametrize("split", range(1, len(REPLY)))
+def test_any_split_into_two_chunks(split):
+    assert parse([REPLY[:split], REPLY[split:]]) == list(SECTIONS.items())
+
+
+def test_random_chunk_sizes():
+    rng = random.Random(7)
+    for _ in range(200):
+        chunks, pos = [], 0
+        while pos < len(REPLY):
+            size = rng.randint(1, 12)
+            chunks.append(REPLY[pos:pos + size])
+            pos += size
+        assert parse(chunks) == list(SECTIONS.items())
+
+
+def test_list_section_completes_at_its_closing_bracket():
+    closing = REPLY.index('"action_items"')
+    closing = REPLY.index("]", REPLY.index("Ünïcode", closing))
+    parser = SectionStreamParser()
+    keys = [key for key, _ in parser.feed(REPLY[:closing])]
+    assert "action_items" not in keys
+    assert parser.feed(REPLY[closing]) == [("action_items", SECTIONS["action_items"])]
+
+
+def test_ignores_text_after_the_object():
+    assert parse(['{"a": [1]}', ' {"b": [2]}']) == [("a", [1])]
+
+
+
+@pytest.mark.parametrize("budget", [8, 50, 500])
+@pytest.mark.parametrize("speaker", ["A", "Speaker 12", "Dr. Someone With A Long Name"])
+def test_chunks_of_an_oversized_segment_stay_within_the_budget(budget, speaker):
+    words = ["word"] * 3000 + ["x" * 5000] + ["tail"] * 10
+    segment = {"speaker": speaker, "text": " ".join(words)}
+    chunks = chunk_segments([segment], budget)
+    assert "".join(piece["text"].replace(" ", "") for chunk in chunks for piece in chunk) == "".join(words)
+    for chunk in chunks:
+        assert sum(estimate_tokens(format_segment(piece)) for piece in chunk) <= budget
+
+
+def test_chunks_cut_at_speaker_changes():
+    segments = [{"speaker": speaker, "text": "x" * 36} for speaker in "AAABBBBCC"]  # 10 tokens each
+    chunks = chunk_segments(segments, 50)
+    assert [[s["speaker"] for s in chunk] for chunk in chunks] == [["A", "A", "A"], ["B", "B", "B", "B"], ["C", "C"]]
+
+
+def test_merge_drops_duplicate_items_across_chunks():
+    merged = merge_summaries([
+        {"key_points": ["Budget approved.", "Launch moved"], "action_items": ["Ana: send draft"]},
+        {"key_points": ["budget approved", "New vendor"], "action_items": None},
+    ])
+    assert merged["key_points"] == ["Budget approved.", "Launch moved", "New vendor"]
+    assert merged["action_items"] == ["Ana: send draft"]
@@ -0,0 +1,100 @@
+import asyncio
+import json
+
+import pytest
+
+from summary_cache import SummaryCache, summary_cache_key
+
+
+def summary(label, size=100):
+    return {"key_points": [label * size]}
+
+
+def entry_bytes(value):
+    return len(json.dumps(value))
+
+
+def test_key_ignores_whitespace_but_not_model_or_prompt():
+    key = summary_cache_key("Ana:  hello\n\n  Bob: hi ", "gpt-4o", "v1")
+    assert key == summary_cache_key("Ana: hello\nBob: hi", "gpt-4o", "v1")
+    assert key != summary_cache_key("Ana: hello\nBob: hi", "gpt-4o-mini", "v1")
+    assert key != summary_cache_key("Ana: hello\nBob: hi", "gpt-4o", "v2")
+    assert key != summary_cache_key("Ana: hello\nBob: bye", "gpt-4o", "v1")
+
+
+def test_memory_tier_evicts_least_recently_used_by_bytes():
+    async def run():
+        cache = SummaryCache(max_bytes=3 * entry_bytes(summary("a")))
+        for label in "abc":
+            await cache.set(label, summary(label))
+        assert await cache.get("a") == summary("a")  # "b" is now the oldest
+        await cache.set("d", summary("d"))
+        return cache, [await cache.get(label) is not None for label in "abcd"]
+
+    cache, present = asyncio.run(run())
+    assert present == [True, False, True, True]
+    stats = cache.stats()
+    assert (stats["entries"], stats["evictions"], stats["misses"]) == (3, 1, 1)
+    assert stats["bytes"] == 3 * entry_bytes(summary("a")) <= stats["max_bytes"]
+
+
+def test_a_large_entry_evicts_as_many_as_needed():
+    async def run():
+        cache = SummaryCache(max_bytes=4 * entry_bytes(summary("a")))
+        for label in "abcd":
+            await cache.set(label, summary(label))
+        await cache.set("big", summary("x", size=250))
+        return cache
+
+    cache = asyncio.run(run())
+    assert list(cache._entries) == ["d", "big"]
+    assert cache.stats()["evictions"] == 3
+
+
+def test_entries_larger_than_the_cache_are_not_kept_in_memory():
+    async def run():
+        cache = SummaryCache(max_bytes=50)
+        await cache.set("a", summary("a"))
+        return cache, await cache.get("a")
+
+    cache, value = asyncio.run(run())
+    assert value is None
+    assert cache.stats()["bytes"] == 0
+
+
+def test_store_tier_is_shared_and_promotes_hits():
+    mongomock_motor = pytest.importorskip("mongomock_motor")
+
+    async def run():
+        collection = mongomock_motor.AsyncMongoMockClient()["test"].summary_cache
+        writer, reader = SummaryCache(collection), SummaryCache(collection)
+        await writer.ensure_indexes()
+        await writer.set("k", summary("a"), model="gpt-4o")
+        stored = await collection.find_one({"_id": "k"})
+        first, second = await reader.get("k"), await reader.get("k")
+        return stored, first, second, reader.stats()
+
+    stored, first, second, stats = asyncio.run(run())
+    assert stored["model"] == "gpt-4o" and "created_at" in stored
+    assert first == second == summary("a")
+    assert (stats["store_hits"], stats["memory_hits"], stats["misses"]) == (1, 1, 0)
+
+
+def test_store_failures_degrade_to_misses():
+    class BrokenCollection:
+        async def find_one(self, *args, **kwargs):
+            raise ConnectionError("database unavailable")
+
+        async def replace_one(self, *args, **kwargs):
+            raise ConnectionError("database unavailable")
+
+    async def run():
+        cache = SummaryCache(BrokenCollection())
+        missing = await cache.get("k")
+        await cache.set("k", summary("a"))
+        return cache, missing, await cache.get("k")
+
+    cache, missing, cached = asyncio.run(run())
+    assert missing is None
+    assert cached == summary("a")
+    assert cache.stats()["misses"] == 1
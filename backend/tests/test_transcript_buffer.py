@@ -0,0 +1,82 @@
+import asyncio
+
+from transcript_buffer import TranscriptBuffer
+
+
+class FakeStore:
+    def __init__(self, failures=0):
+        self.failures = failures
+        self.batches = []
+
+    async def append(self, meeting_id, segments):
+        if self.failures:
+            self.failures -= 1
+            raise ConnectionError("database unavailable")
+        self.batches.append([s["id"] for s in segments])
+
+
+def segments(n, start=0):
+    return [{"id": f"s{i}", "text": "hello"} for i in range(start, start + n)]
+
+
+def test_flushes_when_the_batch_is_full():
+    async def run():
+        store = FakeStore()
+        flushed = []
+
+        async def on_flush(meeting_id, batch):
+            flushed.append((meeting_id, len(batch)))
+
+        buffer = TranscriptBuffer(store, "m", max_segments=3, max_delay=60.0, on_flush=on_flush)
+        for segment in segments(7):
+            await buffer.add(segment)
+        return store, buffer, flushed
+
+    store, buffer, flushed = asyncio.run(run())
+    assert store.batches == [["s0", "s1", "s2"], ["s3", "s4", "s5"]]
+    assert buffer.pending == 1
+    assert (buffer.writes, buffer.segments_written) == (2, 6)
+    assert flushed == [("m", 3), ("m", 3)]
+
+
+def test_flushes_after_max_delay():
+    async def run():
+        store = FakeStore()
+        buffer = TranscriptBuffer(store, "m", max_segments=10, max_delay=0.05)
+        for segment in segments(2):
+            await buffer.add(segment)
+        assert store.batches == []
+        await asyncio.sleep(0.2)
+        return store, buffer
+
+    store, buffer = asyncio.run(run())
+    assert store.batches == [["s0", "s1"]]
+    assert buffer.pending == 0
+
+
+def test_failed_write_is_retried_with_the_next_flush():
+    async def run():
+        store = FakeStore(failures=1)
+        buffer = TranscriptBuffer(store, "m", max_segments=2, max_delay=60.0)
+        for segment in segments(2):
+            await buffer.add(segment)
+        failed_pending = buffer.pending
+        await buffer.add(segments(1, start=2)[0])
+        return store, buffer, failed_pending
+
+    store, buffer, failed_pending = asyncio.run(run())
+    assert failed_pending == 2
+    assert store.batches == [["s0", "s1", "s2"]]
+    assert buffer.pending == 0
+
+
+def test_close_flushes_the_rest_and_cancels_the_timer():
+    async def run():
+        store = FakeStore()
+        buffer = TranscriptBuffer(store, "m", max_segments=10, max_delay=0.05)
+        await buffer.add(segments(1)[0])
+        await buffer.close()
+        await asyncio.sleep(0.1)
+        return store
+
+    assert asyncio.run(run()).batches == [["s0"]]
@@ -0,0 +1,81 @@
+import asyncio
+
+import pytest
+
+from transcript_store import TranscriptStore
+
+mongomock_motor = pytest.importorskip("mongomock_motor")
+
+
+def segment(i, timestamp):
+    return {"id": f"s{i}", "text": f"segment {i}", "speaker": "A", "timestamp": timestamp}
+
+
+def make_store(max_segments=3, bucket_seconds=60.0):
+    collection = mongomock_motor.AsyncMongoMockClient()["test"].transcript_buckets
+    return TranscriptStore(collection, max_segments=max_segments, bucket_seconds=bucket_seconds)
+
+
+async def buckets(store, meeting_id="m"):
+    return await store.collection.find({"meeting_id": meeting_id}, {"_id": 0}).sort("seq", 1).to_list(None)
+
+
+def test_buckets_close_on_segment_count():
+    async def run():
+        store = make_store(max_segments=3)
+        await store.append("m", [segment(i, float(i)) for i in range(7)])
+        return await buckets(store)
+
+    stored = asyncio.run(run())
+    assert [(b["seq"], b["count"], b["start"], b["end"]) for b in stored] == [
+        (0, 3, 0.0, 2.0), (1, 3, 3.0, 5.0), (2, 1, 6.0, 6.0)
+    ]
+
+
+def test_buckets_close_on_time_span():
+    async def run():
+        store = make_store(max_segments=100, bucket_seconds=60.0)
+        await store.append("m", [segment(i, t) for i, t in enumerate([0.0, 30.0, 59.0, 60.0, 200.0])])
+        return await buckets(store)
+
+    stored = asyncio.run(run())
+    assert [[s["timestamp"] for s in b["segments"]] for b in stored] == [[0.0, 30.0, 59.0], [60.0], [200.0]]
+
+
+def test_append_fills_the_last_bucket_first():
+    async def run():
+        store = make_store(max_segments=3)
+        await store.append("m", [segment(0, 0.0), segment(1, 1.0)])
+        await store.append("m", [segment(2, 2.0), segment(3, 3.0)])
+        await store.append("other", [segment(9, 0.0)])
+        return await buckets(store), await store.read_range("m")
+
+    stored, segments = asyncio.run(run())
+    assert [(b["seq"], b["count"], b["start"], b["end"]) for b in stored] == [(0, 3, 0.0, 2.0), (1, 1, 3.0, 3.0)]
+    assert [s["id"] for s in segments] == ["s0", "s1", "s2", "s3"]
+
+
+def test_read_range():
+    async def run():
+        store = make_store(max_segments=4)
+        await store.append("m", [segment(i, i * 10.0) for i in range(20)])
+        return (await store.read_range("m", 35.0, 75.0), await store.read_range("m", start=170.0),
+                await store.read_range("m", end=10.0), await store.read_range("m", 500.0, 600.0))
+
+    middle, tail, head, empty = asyncio.run(run())
+    assert [s["timestamp"] for s in middle] == [40.0, 50.0, 60.0, 70.0]
+    assert [s["timestamp"] for s in tail] == [170.0, 180.0, 190.0]
+    assert [s["timestamp"] for s in head] == [0.0, 10.0]
+    assert empty == []
+
+
+def test_replace_and_iter_segments():
+    async def run():
+        store = make_store(max_segments=2)
+        await store.append("m", [segment(i, float(i)) for i in range(5)])
+        await store.replace("m", [segment(7, 1.0), segment(8, 2.0), segment(9, 3.0)])
+        return [s["id"] async for s in store.iter_segments("m", batch_size=1)], await buckets(store)
+
+    ids, stored = asyncio.run(run())
+    assert ids == ["s7", "s8", "s9"]
+    assert [b["seq"] for b in stored] == [0, 1]
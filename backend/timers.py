@@ -0,0 +1,42 @@
+import asyncio
+import logging
+from typing import Awaitable, Callable, Optional
+
+logger = logging.getLogger(__name__)
+
+
+class DelayedTask:
+    """Runs ``action()`` as a task on the running loop ``delay`` seconds after ``schedule``.
+
+    The task is referenced until it finishes (the loop holds tasks only weakly) and a failure is
+    logged as ``"<description> failed: <error>"``. ``cancel`` stops a call that has not started yet.
+    """
+
+    def __init__(self, action: Callable[[], Awaitable[None]], description: str):
+        self.action = action
+        self.description = description
+        self._timer: Optional[asyncio.TimerHandle] = None
+        self._task: Optional[asyncio.Task] = None
+
+    @property
+    def scheduled(self) -> bool:
+        return self._timer is not None
+
+    def schedule(self, delay: float):
+        self._timer = asyncio.get_running_loop().call_later(delay, self._start)
+
+    def cancel(self):
+        if self._timer is not None:
+            self._timer.cancel()
+            self._timer = None
+
+    def _start(self):
+        self._timer = None
+        self._task = asyncio.get_running_loop().create_task(self.action())
+        self._task.add_done_callback(self._done)
+
+    def _done(self, task: asyncio.Task):
+        if self._task is task:
+            self._task = None
+        if not task.cancelled() and task.exception() is not None:
+            logger.error(f"{self.description} failed: {task.exception()}")
@@ -0,0 +1,73 @@
+import asyncio
+import logging
+from typing import Any, Awaitable, Callable, Dict, List, Optional
+
+from timers import DelayedTask
+
+logger = logging.getLogger(__name__)
+
+
+class TranscriptBuffer:
+    """Buffers final live-transcript segments for one session and flushes them to MongoDB in batches.
+
+    A flush is triggered when ``max_segments`` segments are pending or when the oldest
+    pending segment has waited ``max_delay`` seconds, whichever comes first. Each flush
+    is a single ``store.append`` (a ``$push``/``$each`` onto the meeting's last transcript
+    bucket, see ``TranscriptStore``). ``on_flush`` is awaited with ``(meeting_id, segments)``
+    after every successful write.
+    """
+
+    def __init__(self, store, meeting_id: str, max_segments: int = 25, max_delay: float = 5.0,
+                 on_flush: Optional[Callable[[str, List[Dict[str, Any]]], Awaitable[None]]] = None):
+        self.store = store
+        self.meeting_id = meeting_id
+        self.max_segments = max_segments
+        self.max_delay = max_delay
+        self.on_flush = on_flush
+        self._pending: List[Dict[str, Any]] = []
+        self._lock = asyncio.Lock()
+        self._flush_timer = DelayedTask(self.flush, f"Timed flush for meeting {meeting_id}")
+        # Reported by close(): how well the live session's segments were batched
+        self.writes = 0
+        self.segments_written = 0
+
+    @property
+    def pending(self) -> int:
+        return len(self._pending)
+
+    async def add(self, segment: Dict[str, Any]):
+        """Queue a segment and flush if the batch is full."""
+        self._pending.append(segment)
+        if len(self._pending) >= self.max_segments:
+            await self.flush()
+        elif not self._flush_timer.scheduled:
+            self._flush_timer.schedule(self.max_delay)
+
+    async def flush(self):
+        """Write all pending segments in one update. Failed batches are kept for the next flush."""
+        self._flush_timer.cancel()
+        async with self._lock:
+            if not self._pending:
+                return
+            batch, self._pending = self._pending, []
+            try:
+                await self.store.append(self.meeting_id, batch)
+            except Exception as e:
+                logger.error(f"Error flushing {len(batch)} segments for meeting {self.meeting_id}: {e}")
+                self._pending[:0] = batch
+                return
+            self.writes += 1
+            self.segments_written += len(batch)
+            if self.on_flush is not None:
+                try:
+                    await self.on_flush(self.meeting_id, batch)
+                except Exception as e:
+                    logger.error(f"on_flush callback failed for meeting {self.meeting_id}: {e}")
+
+    async def close(self):
+        """Flush whatever is left; called when the live session ends."""
+        await self.flush()
+        logger.info(
+            f"Transcript buffer for meeting {self.meeting_id} closed: "
+            f"{self.segments_written} segments in {self.writes} writes"
+        )
@@ -0,0 +1,107 @@
+import logging
+from typing import Any, AsyncIterator, Dict, List, Optional
+
+from pymongo import ASCENDING, DESCENDING
+
+logger = logging.getLogger(__name__)
+
+
+class TranscriptStore:
+    """Meeting transcripts stored as time-bucketed chunks of segments.
+
+    Each document of ``collection`` (``transcript_buckets``) holds a run of consecutive segments
+    of one meeting: ``{meeting_id, seq, start, end, count, segments}``. A bucket is closed once it
+    has ``max_segments`` segments or spans ``bucket_seconds`` of meeting time, so documents stay
+    small however long the meeting runs, and a time-range read only loads the buckets overlapping
+    the range. ``start``/``end`` are the lowest and highest segment timestamps in the bucket.
+
+    Appends assume one writer per meeting at a time (the worker owning its live session, or the
+    transcription job replacing it).
+    """
+
+    def __init__(self, collection, max_segments: int = 200, bucket_seconds: float = 300.0):
+        self.collection = collection
+        self.max_segments = max_segments
+        self.bucket_seconds = bucket_seconds
+
+    async def ensure_indexes(self):
+        await self.collection.create_index([("meeting_id", ASCENDING), ("seq", ASCENDING)], unique=True)
+        await self.collection.create_index([("meeting_id", ASCENDING), ("start", ASCENDING)])
+
+    def _bucket_has_room(self, bucket: Dict[str, Any], segment: Dict[str, Any]) -> bool:
+        return (bucket["count"] < self.max_segments
+                and segment.get("timestamp", 0.0) - bucket["start"] < self.bucket_seconds)
+
+    @staticmethod
+    def _new_bucket(meeting_id: str, seq: int, segment: Dict[str, Any]) -> Dict[str, Any]:
+        timestamp = segment.get("timestamp", 0.0)
+        return {"meeting_id": meeting_id, "seq": seq, "start": timestamp, "end": timestamp,
+                "count": 0, "segments": []}
+
+    async def append(self, meeting_id: str, segments: List[Dict[str, Any]]):
+        """Add segments after the existing ones: fill the last bucket, then insert new buckets."""
+        if not segments:
+            return
+        last = await self.collection.find_one(
+            {"meeting_id": meeting_id}, {"_id": 0, "seq": 1, "start": 1, "count": 1},
+            sort=[("seq", DESCENDING)]
+        )
+        tail: List[Dict[str, Any]] = []
+        new_buckets: List[Dict[str, Any]] = []
+        current = last
+        for segment in segments:
+            if current is None or not self._bucket_has_room(current, segment):
+                current = self._new_bucket(meeting_id, (current or {"seq": -1})["seq"] + 1, segment)
+                new_buckets.append(current)
+            if current is last:
+                tail.append(segment)
+            else:
+                current["segments"].append(segment)
+                current["start"] = min(current["start"], segment.get("timestamp", 0.0))
+                current["end"] = max(current["end"], segment.get("timestamp", 0.0))
+            current["count"] += 1
+
+        if tail:
+            timestamps = [segment.get("timestamp", 0.0) for segment in tail]
+            await self.collection.update_one(
+                {"meeting_id": meeting_id, "seq": last["seq"]},
+                {"$push": {"segments": {"$each": tail}}, "$inc": {"count": len(tail)},
+                 "$min": {"start": min(timestamps)}, "$max": {"end": max(timestamps)}}
+            )
+        if new_buckets:
+            await self.collection.insert_many(new_buckets)
+
+    async def replace(self, meeting_id: str, segments: List[Dict[str, Any]]):
+        """Store ``segments`` as the meeting's whole transcript."""
+        await self.delete(meeting_id)
+        await self.append(meeting_id, segments)
+
+    async def delete(self, meeting_id: str):
+        await self.collection.delete_many({"meeting_id": meeting_id})
+
+    async def read_range(self, meeting_id: str, start: Optional[float] = None,
+                         end: Optional[float] = None) -> List[Dict[str, Any]]:
+        """Segments with ``start <= timestamp <= end`` (either bound optional), in stored order."""
+        return [segment async for segment in self.iter_segments(meeting_id, start, end)]
+
+    async def iter_segments(self, meeting_id: str, start: Optional[float] = None, end: Optional[float] = None,
+                            batch_size: int = 4) -> AsyncIterator[Dict[str, Any]]:
+        """Stream segments bucket by bucket, holding only ``batch_size`` buckets in memory."""
+        query: Dict[str, Any] = {"meeting_id": meeting_id}
+        if start is not None:
+            query["end"] = {"$gte": start}
+        if end is not None:
+            query["start"] = {"$lte": end}
+        cursor = self.collection.find(query, {"_id": 0, "segments": 1}).sort("seq", ASCENDING).batch_size(batch_size)
+        async for bucket in cursor:
+            for segment in bucket["segments"]:
+                timestamp = segment.get("timestamp", 0.0)
+                if (start is None or timestamp >= start) and (end is None or timestamp <= end):
+                    yield segment
+
+    async def last_timestamp(self, meeting_id: str) -> float:
+        """Highest segment timestamp stored for the meeting (0 when it has none)."""
+        bucket = await self.collection.find_one(
+            {"meeting_id": meeting_id}, {"_id": 0, "end": 1}, sort=[("end", DESCENDING)]
+        )
+        return bucket["end"] if bucket else 0.0
@@ -48,7 +48,10 @@ function App() {
     meetings,
     currentMeeting,
     setCurrentMeeting,
+    nextCursor,
     fetchMeetings,
+    fetchMeeting,
+    fetchTranscript,
     createMeeting,
   } = useMeetings();
 
@@ -172,6 +175,9 @@ function App() {
             participantFilter={participantFilter}
             setParticipantFilter={setParticipantFilter}
             fetchMeetings={fetchMeetings}
+            fetchMeeting={fetchMeeting}
+            fetchTranscript={fetchTranscript}
+            nextCursor={nextCursor}
             setCurrentMeeting={setCurrentMeeting}
             setTranscript={setTranscript}
             setSummary={setSummary}
@@ -1,5 +1,14 @@
 import React from "react";
 
+const API = `${process.env.REACT_APP_BACKEND_URL}/api`;
+
+const exportUrl = (format, search, participant) => {
+  const params = new URLSearchParams({ format });
+  if (search) params.set("search", search);
+  if (participant) params.set("participant", participant);
+  return `${API}/export?${params}`;
+};
+
 const MeetingHistory = ({
   meetings,
   searchQuery,
@@ -7,6 +16,9 @@ const MeetingHistory = ({
   participantFilter,
   setParticipantFilter,
   fetchMeetings,
+  fetchMeeting,
+  fetchTranscript,
+  nextCursor,
   setCurrentMeeting,
   setTranscript,
   setSummary,
@@ -34,6 +46,12 @@ const MeetingHistory = ({
           <button className="btn btn-search" onClick={fetchMeetings}>
             🔍 Search
           </button>
+          <a
+            className="btn btn-search"
+            href={exportUrl("markdown", searchQuery, participantFilter)}
+          >
+            ⬇️ Export
+          </a>
         </div>
       </div>
 
@@ -60,16 +78,20 @@ const MeetingHistory = ({
                 </p>
                 <p>
                   <strong>Transcript segments:</strong>{" "}
-                  {meeting.transcript?.length || 0}
+                  {meeting.segments_count || 0}
                 </p>
               </div>
               <div className="card-actions">
                 <button
                   className="btn btn-view"
-                  onClick={() => {
-                    setCurrentMeeting(meeting);
-                    setTranscript(meeting.transcript || []);
-                    setSummary(meeting.summary || null);
+                  onClick={async () => {
+                    const [fullMeeting, segments] = await Promise.all([
+                      fetchMeeting(meeting.id),
+                      fetchTranscript(meeting.id),
+                    ]);
+                    setCurrentMeeting(fullMeeting || meeting);
+                    setTranscript(segments);
+                    setSummary((fullMeeting || meeting).summary || null);
                     setActiveTab("live");
                   }}
                 >
@@ -85,6 +107,15 @@ const MeetingHistory = ({
           </div>
         )}
       </div>
+
+      {nextCursor && (
+        <button
+          className="btn btn-search"
+          onClick={() => fetchMeetings(searchQuery, participantFilter, nextCursor)}
+        >
+          Load more
+        </button>
+      )}
     </div>
   );
 };
@@ -6,20 +6,50 @@ const API = `${process.env.REACT_APP_BACKEND_URL}/api`;
 export const useMeetings = () => {
   const [meetings, setMeetings] = useState([]);
   const [currentMeeting, setCurrentMeeting] = useState(null);
+  const [nextCursor, setNextCursor] = useState(null);
 
-  const fetchMeetings = useCallback(async (searchQuery = "", participant = "") => {
+  const fetchMeetings = useCallback(async (searchQuery = "", participant = "", cursor = null) => {
     try {
       const params = new URLSearchParams();
       if (searchQuery) params.append("search", searchQuery);
       if (participant) params.append("participant", participant);
+      if (cursor) params.append("cursor", cursor);
 
       const response = await axios.get(`${API}/meetings?${params.toString()}`);
-      setMeetings(response.data);
+      setMeetings((prev) =>
+        cursor ? [...prev, ...response.data.meetings] : response.data.meetings
+      );
+      setNextCursor(response.data.next_cursor);
     } catch (error) {
       console.error("Error fetching meetings:", error);
     }
   }, []);
 
+  const fetchMeeting = useCallback(async (meetingId) => {
+    try {
+      const response = await axios.get(`${API}/meetings/${meetingId}`);
+      return response.data;
+    } catch (error) {
+      console.error("Error fetching meeting:", error);
+      return null;
+    }
+  }, []);
+
+  // Transcript segments of a meeting, optionally limited to [from, to] seconds into the meeting
+  const fetchTranscript = useCallback(async (meetingId, from = null, to = null) => {
+    try {
+      const params = new URLSearchParams();
+      if (from !== null) params.append("from", from);
+      if (to !== null) params.append("to", to);
+
+      const response = await axios.get(`${API}/meetings/${meetingId}/transcript?${params.toString()}`);
+      return response.data.segments;
+    } catch (error) {
+      console.error("Error fetching transcript:", error);
+      return [];
+    }
+  }, []);
+
   const createMeeting = useCallback(async (title, host = "Current User", participants = []) => {
     try {
       const response = await axios.post(`${API}/meetings`, {
@@ -39,7 +69,10 @@ export const useMeetings = () => {
     meetings,
     currentMeeting,
     setCurrentMeeting,
+    nextCursor,
     fetchMeetings,
+    fetchMeeting,
+    fetchTranscript,
     createMeeting,
   };
 };
@@ -28,7 +28,18 @@ export const useTranscript = ({ currentMeeting, showToast }) => {
         }
       );
 
-      setTranscript(response.data.transcript || []);
+      // Transcription runs as a background job; poll until it finishes
+      let job = { status: response.data.status };
+      while (job.status === "queued" || job.status === "running") {
+        await new Promise((resolve) => setTimeout(resolve, 2000));
+        job = (await axios.get(`${API}/jobs/${response.data.job_id}`)).data;
+      }
+      if (job.status !== "completed") {
+        throw new Error(job.error || "Transcription failed");
+      }
+
+      const stored = await axios.get(`${API}/meetings/${currentMeeting.id}/transcript`);
+      setTranscript(stored.data.segments || []);
       showToast("Audio transcribed successfully", "success");
     } catch (error) {
       console.error("Error transcribing file:", error);
@@ -52,15 +63,45 @@ export const useTranscript = ({ currentMeeting, showToast }) => {
         .map((seg) => `${seg.speaker}: ${seg.text}`)
         .join("\n");
 
-      const response = await axios.post(
-        `${API}/meetings/${currentMeeting.id}/summarize`,
+      // Sections arrive as Server-Sent Events as soon as each one is complete
+      const response = await fetch(
+        `${API}/meetings/${currentMeeting.id}/summarize/stream`,
         {
-          meeting_id: currentMeeting.id,
-          transcript_text: transcriptText,
+          method: "POST",
+          headers: { "Content-Type": "application/json" },
+          body: JSON.stringify({
+            meeting_id: currentMeeting.id,
+            transcript_text: transcriptText,
+          }),
         }
       );
-
-      setSummary(response.data.summary);
+      if (!response.ok) {
+        throw new Error(`Summary request failed: ${response.status}`);
+      }
+
+      setSummary({});
+      const reader = response.body.getReader();
+      const decoder = new TextDecoder();
+      let buffer = "";
+      let done = false;
+      while (!done) {
+        const chunk = await reader.read();
+        done = chunk.done;
+        buffer += decoder.decode(chunk.value || new Uint8Array(), { stream: !done });
+        const events = buffer.split("\n\n");
+        buffer = events.pop();
+        for (const raw of events) {
+          const event = raw.match(/^event: (.*)$/m)?.[1];
+          const data = JSON.parse(raw.match(/^data: (.*)$/m)?.[1] || "null");
+          if (event === "section") {
+            setSummary((prev) => ({ ...prev, [data.section]: data.items }));
+          } else if (event === "summary") {
+            setSummary(data.summary);
+          } else if (event === "error") {
+            throw new Error(data.description);
+          }
+        }
+      }
       showToast("Summary generated successfully", "success");
     } catch (error) {
       console.error("Error generating summary:", error);